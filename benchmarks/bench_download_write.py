@@ -0,0 +1,111 @@
+"""
+Benchmark: iter_content(8 KiB) loop vs. the buffered readinto write path for downloads.
+
+Serves an in-memory archive from a local HTTP server and writes it to a
+temporary file with both write paths (sha256 included, as in the installer).
+
+Usage:
+    python benchmarks/bench_download_write.py [--size-mb N] [--repeat N] [--json results.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.constants import DOWNLOAD_BUFFER_BYTES
+from core.download_writer import copy_response, content_length, preallocate
+from core.http_client import create_session
+
+
+ITER_CONTENT_CHUNK_SIZE = 8192  # Chunk size of the previous write path
+
+
+def start_server(body):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/zip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            view = memoryview(body)
+            for start in range(0, len(body), 4 * 1024 * 1024):
+                self.wfile.write(view[start:start + 4 * 1024 * 1024])
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}/archive.zip"
+
+
+def write_iter_content(response, f, hasher):
+    """The previous write path."""
+    for chunk in response.iter_content(chunk_size=ITER_CONTENT_CHUNK_SIZE):
+        if chunk:
+            f.write(chunk)
+            hasher.update(chunk)
+
+
+def write_buffered(response, f, hasher):
+    preallocate(f, content_length(response) or 0)
+    copy_response(response, f, hasher=hasher)
+    f.truncate()
+
+
+def timed_download(session, url, path, write):
+    start = time.perf_counter()
+    hasher = hashlib.sha256()
+    with session.get(url, stream=True, timeout=30) as response, open(path, 'wb') as f:
+        write(response, f, hasher)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=256, help="Archive size in MiB")
+    parser.add_argument('--repeat', type=int, default=3, help="Downloads per mode (best time is kept)")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    body = os.urandom(size)
+    httpd, url = start_server(body)
+    session = create_session()
+    results = {'size_mb': args.size_mb, 'chunk_size': ITER_CONTENT_CHUNK_SIZE, 'buffer_bytes': DOWNLOAD_BUFFER_BYTES}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "archive.zip"
+            for mode, write in (('iter_content', write_iter_content), ('buffered', write_buffered)):
+                best = min(timed_download(session, url, path, write) for _ in range(args.repeat))
+                assert path.stat().st_size == size
+                results[f'{mode}_s'] = best
+                results[f'{mode}_mb_per_s'] = args.size_mb / best
+    finally:
+        session.close()
+        httpd.shutdown()
+
+    print(f"{args.size_mb} MiB archive, best of {args.repeat}")
+    for mode in ('iter_content', 'buffered'):
+        print(f"  {mode:<13} {results[f'{mode}_s']:7.3f} s   {results[f'{mode}_mb_per_s']:8.1f} MiB/s")
+    print(f"  speedup {results['iter_content_s'] / results['buffered_s']:5.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Benchmark suite: scanning, status resolution and pre-filtering on large synthetic installs.
+
+Generates a fake Starsector install per size (see synthetic_install.py) and
+times the operations that walk the whole mods folder or the whole modlist.
+"cold" runs start from an empty installed-mods index, "warm" runs reuse it.
+
+Usage:
+    python benchmarks/bench_large_install.py [--sizes 50,500,2000] [--repeat N]
+                                             [--json results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import utils.installed_mod_index as index_module
+from core import MAX_SCAN_WORKERS, ModInstaller
+from gui.main_window import ModlistInstaller
+from synthetic_install import GAME_VERSION, create_install
+from utils.mod_utils import scan_installed_mods
+
+
+def quiet_log(*args, **kwargs):
+    pass
+
+
+def reset_index(starsector_dir):
+    """Forget the shared installed-mods index and its saved file."""
+    index_module._indexes.clear()
+    (starsector_dir / index_module.INDEX_FILE_NAME).unlink(missing_ok=True)
+
+
+def best_of(func, repeat, setup=None, budget=10.0):
+    """Return the fastest wall-clock time of func() over up to repeat runs.
+
+    Stops repeating once budget seconds were spent, so quadratic operations
+    on the largest installs run only once.
+    """
+    best = None
+    spent = 0.0
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        spent += elapsed
+        if spent >= budget:
+            break
+    return best
+
+
+def bench_size(count, repeat):
+    """Time every operation on an install with count mods."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        starsector_dir, modlist_data = create_install(tmp, count)
+        mods_dir = starsector_dir / "mods"
+        mods = modlist_data['mods']
+        folder_names = sorted(p.name for p in mods_dir.iterdir() if p.is_dir())
+        installer = ModInstaller(quiet_log)
+        cold = lambda: reset_index(starsector_dir)
+
+        results['scan_installed_mods'] = best_of(lambda: list(scan_installed_mods(mods_dir)), repeat)
+        results['scan_installed_mods_parallel'] = best_of(
+            lambda: list(scan_installed_mods(mods_dir, max_workers=MAX_SCAN_WORKERS)), repeat)
+
+        def check_all_installed():
+            # One lookup per pass over the modlist, as the docstring recommends
+            lookup = installer.build_installed_lookup(mods_dir)
+            return [installer.is_mod_already_installed(mod, mods_dir, lookup) for mod in mods]
+
+        results['is_mod_already_installed_cold'] = best_of(check_all_installed, repeat, setup=cold)
+        results['is_mod_already_installed_warm'] = best_of(check_all_installed, repeat)
+        results['resolve_install_status_warm'] = best_of(
+            lambda: installer.resolve_install_status(mods, mods_dir), repeat)
+
+        results['detect_outdated_mods_cold'] = best_of(
+            lambda: installer.detect_outdated_mods(mods_dir, mods), repeat, setup=cold)
+        results['detect_outdated_mods_warm'] = best_of(
+            lambda: installer.detect_outdated_mods(mods_dir, mods), repeat)
+
+        results['detect_incompatible_game_versions_cold'] = best_of(
+            lambda: installer.detect_incompatible_game_versions(mods_dir, GAME_VERSION), repeat, setup=cold)
+        results['detect_incompatible_game_versions_warm'] = best_of(
+            lambda: installer.detect_incompatible_game_versions(mods_dir, GAME_VERSION), repeat)
+
+        results['update_enabled_mods_warm'] = best_of(
+            lambda: installer.update_enabled_mods(mods_dir, folder_names, merge=False), repeat)
+
+        # GUI method: run it on a minimal stand-in for the window, on a fresh
+        # copy of the modlist each time so every run does the same updates
+        def update_metadata():
+            window = SimpleNamespace(modlist_data={'mods': [dict(mod) for mod in mods]}, log=quiet_log)
+            ModlistInstaller._update_mod_metadata_from_installed(window, mods_dir)
+
+        results['update_mod_metadata_from_installed_warm'] = best_of(update_metadata, repeat)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print operations that got slower than threshold x the baseline.
+
+    Returns:
+        int: Number of regressions
+    """
+    regressions = 0
+    for size, timings in results.items():
+        for name, seconds in timings.items():
+            before = baseline.get(size, {}).get(name)
+            if before and seconds > before * threshold:
+                regressions += 1
+                print(f"  REGRESSION {size:>5} mods  {name:<42} {before * 1000:9.2f} ms -> {seconds * 1000:9.2f} ms")
+    if not regressions:
+        print(f"  No regressions above {threshold:g}x")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default="50,500,2000", help="Comma-separated numbers of mod folders")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per operation (the fastest is kept)")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    parser.add_argument('--compare', metavar='PATH', help="Baseline JSON from an earlier --json run")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown factor reported as a regression with --compare")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = {}
+    for count in sizes:
+        timings = bench_size(count, args.repeat)
+        results[str(count)] = timings
+        print(f"{count} mods")
+        for name, seconds in timings.items():
+            print(f"  {name:<42} {seconds * 1000:10.2f} ms")
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+        print(f"Compared with {args.compare}")
+        exit_code = 1 if compare(results, baseline, args.threshold) else 0
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+                'results': results
+            }, f, indent=2)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark: lenient mod_info.json parser vs. the per-field regex extractors.
+
+Runs both over the real mod_info.json samples in tests/test_mod_info_samples.py
+and reports the time per file.
+
+Usage:
+    python benchmarks/bench_mod_info_parser.py [--rounds N] [--json results.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from test_mod_info_samples import MOD_INFO_SAMPLES
+from utils.mod_info_parser import parse_mod_info
+from utils.mod_utils import (
+    extract_mod_id_from_text,
+    extract_mod_name_from_text,
+    extract_mod_version_from_text,
+    extract_game_version_from_text,
+    _extract_dependencies_with_regex
+)
+
+
+def regex_stack(content):
+    """The extraction done before the parser: one regex search per field."""
+    return {
+        'id': extract_mod_id_from_text(content),
+        'name': extract_mod_name_from_text(content),
+        'version': extract_mod_version_from_text(content),
+        'gameVersion': extract_game_version_from_text(content),
+        'dependencies': _extract_dependencies_with_regex(content)
+    }
+
+
+def time_per_file(func, samples, rounds, repeats=5):
+    """Return the best time per file in microseconds over several repeats."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for content in samples:
+                func(content)
+        best = min(best, time.perf_counter() - start)
+    return best / (rounds * len(samples)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=500, help="Passes over the samples per repeat")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    samples = list(MOD_INFO_SAMPLES.values())
+    results = {
+        'samples': len(samples),
+        'regex_stack_us': time_per_file(regex_stack, samples, args.rounds),
+        'parser_us': time_per_file(parse_mod_info, samples, args.rounds),
+    }
+    results['speedup'] = results['regex_stack_us'] / results['parser_us']
+
+    print(f"mod_info.json samples: {results['samples']}")
+    print(f"  regex stack: {results['regex_stack_us']:8.1f} µs/file")
+    print(f"  parser:      {results['parser_us']:8.1f} µs/file")
+    print(f"  speedup:     {results['speedup']:8.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: one archive at a time vs. several extraction workers.
+
+Builds a set of local ZIP archives (one mod folder each, with a mod_info.json,
+compressible data files and small sprites) and extracts them all into an empty
+mods directory with ModInstaller.extract_archive, first sequentially, then on
+a thread pool as the install pipeline does.
+
+Usage:
+    python benchmarks/bench_parallel_extract.py [--archives N] [--files N] [--workers N] [--json results.json]
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.constants import MAX_EXTRACTION_WORKERS
+from core.installer import ModInstaller
+
+
+def create_archives(archive_dir, count, files):
+    rng = random.Random(0)
+    words = [bytes(rng.choice(b'abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9))) for _ in range(500)]
+    archives = []
+    for i in range(count):
+        path = archive_dir / f"mod{i:02d}.zip"
+        folder = f"Mod{i:02d}"
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(f"{folder}/mod_info.json", f'{{"id": "mod{i:02d}", "version": "1.0.0"}}')
+            for j in range(files):
+                # Text-like data (inflate cost) and incompressible sprites (write cost)
+                zf.writestr(f"{folder}/data/config{j}.csv", b' '.join(rng.choices(words, k=20000)))
+                zf.writestr(f"{folder}/graphics/sprite{j}.png", os.urandom(16 * 1024))
+        archives.append(path)
+    return archives
+
+
+def extract_all(archives, mods_dir, workers):
+    installer = ModInstaller(lambda *args, **kwargs: None)
+    start = time.perf_counter()
+    if workers == 1:
+        results = [installer.extract_archive(path, mods_dir, False) for path in archives]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda path: installer.extract_archive(path, mods_dir, False), archives))
+    elapsed = time.perf_counter() - start
+    assert results == [True] * len(archives)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--archives', type=int, default=30, help="Number of archives")
+    parser.add_argument('--files', type=int, default=40, help="Data files and sprites per archive")
+    parser.add_argument('--workers', type=int, default=MAX_EXTRACTION_WORKERS, help="Extraction workers")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "archives").mkdir()
+        archives = create_archives(tmp / "archives", args.archives, args.files)
+        size_mb = sum(path.stat().st_size for path in archives) / (1024 * 1024)
+
+        results = {'archives': args.archives, 'files_per_archive': 2 * args.files + 1,
+                   'archive_mb': size_mb, 'workers': args.workers}
+        for mode, workers in (('sequential', 1), ('parallel', args.workers)):
+            mods_dir = tmp / f"mods_{mode}"
+            mods_dir.mkdir()
+            results[f'{mode}_s'] = extract_all(archives, mods_dir, workers)
+            shutil.rmtree(mods_dir)
+
+    print(f"{args.archives} archives, {size_mb:.1f} MiB, {2 * args.files + 1} files each, cpus={os.cpu_count()}")
+    print(f"  sequential           {results['sequential_s']:7.3f} s")
+    print(f"  parallel ({args.workers} workers)  {results['parallel_s']:7.3f} s")
+    print(f"  speedup {results['sequential_s'] / results['parallel_s']:5.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: sequential vs. thread-pool scanning of a mods directory with per-file latency.
+
+Creates a temporary mods directory and injects a fixed delay into every
+mod_info.json read to simulate an SMB/NFS-mounted Starsector install.
+
+Usage:
+    python benchmarks/bench_parallel_scan.py [--mods N] [--latency MS] [--workers N] [--json results.json]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import utils.mod_utils as mod_utils
+from utils.installed_mod_index import InstalledModIndex
+
+
+def create_mods(mods_dir, count):
+    for i in range(count):
+        folder = mods_dir / f"Mod{i:04d}"
+        folder.mkdir(parents=True)
+        (folder / "mod_info.json").write_text(
+            f'{{"id": "mod{i}", "name": "Mod {i}", "version": "1.0.{i}", "gameVersion": "0.98a-RC8"}}',
+            encoding='utf-8'
+        )
+
+
+def with_latency(func, latency):
+    def delayed(*args, **kwargs):
+        time.sleep(latency)
+        return func(*args, **kwargs)
+    return delayed
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mods', type=int, default=200, help="Number of mod folders")
+    parser.add_argument('--latency', type=float, default=5.0, help="Simulated latency per read in milliseconds")
+    parser.add_argument('--workers', type=int, default=8, help="Worker threads for the parallel mode")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    latency = args.latency / 1000
+    # Both the scan and the index read mod_info.json through read_mod_info_text
+    mod_utils.read_mod_info_text = with_latency(mod_utils.read_mod_info_text, latency)
+
+    results = {'mods': args.mods, 'latency_ms': args.latency, 'workers': args.workers}
+    with tempfile.TemporaryDirectory() as tmp:
+        mods_dir = Path(tmp) / "mods"
+        create_mods(mods_dir, args.mods)
+
+        results['scan_sequential_s'] = timed(lambda: list(mod_utils.scan_installed_mods(mods_dir)))
+        results['scan_parallel_s'] = timed(
+            lambda: list(mod_utils.scan_installed_mods(mods_dir, max_workers=args.workers)))
+
+        index_file = Path(tmp) / "index.json"
+        results['index_cold_sequential_s'] = timed(
+            lambda: InstalledModIndex(mods_dir, index_file=index_file).refresh(save=False))
+        results['index_cold_parallel_s'] = timed(
+            lambda: InstalledModIndex(mods_dir, index_file=index_file, max_workers=args.workers).refresh(save=False))
+
+    print(f"{args.mods} mods, {args.latency:g} ms per read, {args.workers} workers")
+    for mode in ('scan', 'index_cold'):
+        sequential = results[f'{mode}_sequential_s']
+        parallel = results[f'{mode}_parallel_s']
+        print(f"  {mode:<11} sequential {sequential:7.3f} s   parallel {parallel:7.3f} s   "
+              f"speedup {sequential / parallel:5.1f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
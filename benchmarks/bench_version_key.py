@@ -0,0 +1,95 @@
+"""
+Micro-benchmarks: cached VersionKey vs. the previous re-parsing compare_versions().
+
+Usage:
+    python benchmarks/bench_version_key.py [--versions N] [--json results.json]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from functools import cmp_to_key
+from itertools import zip_longest
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from utils.mod_utils import compare_versions
+from utils.version_key import max_version, sort_versions
+
+
+def legacy_compare(version1, version2):
+    """compare_versions() before VersionKey: parses both strings on every call."""
+    if version1 == version2:
+        return 0
+
+    def parse_version(v):
+        v = str(v).lower().replace('v', '').replace('version', '').strip()
+        parts = re.findall(r'\d+|[a-z]+', v)
+        return [int(p) if p.isdigit() else ord(p[0]) - ord('a') + 1 for p in parts]
+
+    for p1, p2 in zip_longest(parse_version(version1), parse_version(version2), fillvalue=0):
+        if p1 > p2:
+            return 1
+        elif p1 < p2:
+            return -1
+    return 0
+
+
+def make_versions(count, seed=42):
+    rng = random.Random(seed)
+    suffixes = ['', '', '', 'a', 'b', 'c', '-RC1', '.b']
+    return [f"{rng.randint(0, 3)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}{rng.choice(suffixes)}"
+            for _ in range(count)]
+
+
+def best_of(func, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--versions', type=int, default=2000, help="Number of versions to sort")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = parser.parse_args()
+
+    versions = make_versions(args.versions)
+    # Nested-loop pattern of the installer: every modlist entry against installed versions
+    pairs = [(a, b) for a in versions[:200] for b in versions[:50]]
+
+    results = {
+        'versions': len(versions),
+        'pairwise_compares': len(pairs),
+        'compare_legacy_s': best_of(lambda: [legacy_compare(a, b) for a, b in pairs]),
+        'compare_cached_s': best_of(lambda: [compare_versions(a, b) for a, b in pairs]),
+        'sort_legacy_s': best_of(lambda: sorted(versions, key=cmp_to_key(legacy_compare))),
+        'sort_cached_s': best_of(lambda: sort_versions(versions)),
+        'max_legacy_s': best_of(lambda: max(versions, key=cmp_to_key(legacy_compare))),
+        'max_cached_s': best_of(lambda: max_version(versions)),
+    }
+
+    assert sorted(versions, key=cmp_to_key(legacy_compare)) == sort_versions(versions)
+
+    print(f"{len(versions)} versions, {len(pairs)} pairwise comparisons")
+    for name in ('compare', 'sort', 'max'):
+        legacy = results[f'{name}_legacy_s']
+        cached = results[f'{name}_cached_s']
+        print(f"  {name:<8} legacy {legacy * 1000:8.2f} ms   cached {cached * 1000:8.2f} ms   "
+              f"speedup {legacy / cached:6.1f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Synthetic Starsector install generator shared by the benchmarks.
+
+Creates <root>/Starsector/mods with N mod folders whose mod_info.json files use
+the dialects found in real mods (comments, trailing commas, unquoted keys,
+version objects, dependency objects), plus a matching modlist config.
+"""
+
+import json
+import random
+from pathlib import Path
+
+
+GAME_VERSION = "0.98a-RC8"
+CATEGORIES = ["Libs", "Factions", "Ships", "Utility", "QoL"]
+LIBRARIES = [
+    ("lw_lazylib", "LazyLib"),
+    ("MagicLib", "MagicLib"),
+    ("shaderLib", "GraphicsLib"),
+    ("lunalib", "LunaLib"),
+]
+
+
+def _strict(mod):
+    data = {
+        "id": mod['id'],
+        "name": mod['name'],
+        "author": "Benchmark",
+        "version": mod['version'],
+        "description": f"Synthetic mod {mod['name']} for benchmarks.",
+        "gameVersion": mod['game_version'],
+        "jars": [f"jars/{mod['id']}.jar"],
+        "modPlugin": f"data.scripts.{mod['id']}.ModPlugin",
+        "dependencies": [{"id": dep, "name": name} for dep, name in mod['dependencies']],
+    }
+    return json.dumps(data, indent=4)
+
+
+def _commented(mod):
+    deps = "".join(f'\n        {{"id": "{dep}", "name": "{name}"}},' for dep, name in mod['dependencies'])
+    return f"""{{
+    # Generated by the benchmark suite
+    "id": "{mod['id']}", // mod id
+    "name": "{mod['name']}",
+    "author": "Benchmark",
+    "version": "{mod['version']}",
+    /* Multi-line
+       comment */
+    "description": "Synthetic mod with comments, trailing commas",
+    "gameVersion": "{mod['game_version']}",
+    "jars": ["jars/{mod['id']}.jar",],
+    "dependencies": [{deps}
+    ],
+}}
+"""
+
+
+def _unquoted(mod):
+    deps = ", ".join(f'{{id: "{dep}", name: "{name}"}}' for dep, name in mod['dependencies'])
+    return (f'{{\r\n  id: "{mod["id"]}",\r\n  name: "{mod["name"]}",\r\n  author: "Benchmark",\r\n'
+            f'  version: "{mod["version"]}",\r\n  gameVersion: "{mod["game_version"]}",\r\n'
+            f'  dependencies: [{deps}],\r\n}}\r\n')
+
+
+def _version_object(mod):
+    parts = mod['version'].split('.') + ['0', '0']
+    deps = ", ".join(f'"{dep}"' for dep, _ in mod['dependencies'])
+    return f"""{{
+    "id": "{mod['id']}",
+    "name": "{mod['name']}",
+    "version": {{"major": {parts[0]}, "minor": {parts[1]}, "patch": "{parts[2]}"}},
+    "description": "Version as an object, dependencies as plain ids",
+    "gameVersion": "{mod['game_version']}",
+    "dependencies": [{deps}],
+}}
+"""
+
+
+DIALECTS = [_strict, _commented, _unquoted, _version_object]
+
+
+def create_install(root, count, seed=0):
+    """
+    Create a synthetic Starsector install and a matching modlist.
+
+    The modlist covers every installed mod plus 10% that are not installed.
+    Entries mix mod_id and name-only matching, newer modlist versions
+    (outdated installs) and mods built for an older game version.
+
+    Args:
+        root: Directory to create the install in
+        count: Number of installed mod folders
+        seed: Random seed (same seed, same tree)
+
+    Returns:
+        tuple: (starsector_dir, modlist_data)
+    """
+    rng = random.Random(seed)
+    starsector_dir = Path(root) / "Starsector"
+    mods_dir = starsector_dir / "mods"
+    mods_dir.mkdir(parents=True)
+
+    modlist_mods = []
+    for i in range(count):
+        if i < len(LIBRARIES):
+            mod_id, name = LIBRARIES[i]
+            dependencies = []
+        else:
+            mod_id, name = f"bench_mod_{i:05d}", f"Bench Mod {i:05d}"
+            dependencies = rng.sample(LIBRARIES, rng.randint(0, 2))
+        version = f"{rng.randint(0, 3)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+        game_version = GAME_VERSION if rng.random() > 0.1 else "0.97a-RC11"
+        mod = {'id': mod_id, 'name': name, 'version': version,
+               'game_version': game_version, 'dependencies': dependencies}
+
+        folder = mods_dir / (f"{name} {version}" if i % 3 else name)
+        (folder / "jars").mkdir(parents=True)
+        (folder / "mod_info.json").write_text(DIALECTS[i % len(DIALECTS)](mod), encoding='utf-8')
+
+        entry = {
+            'name': name,
+            'download_url': f"https://example.com/mods/{mod_id}.zip",
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'game_version': GAME_VERSION,
+            'mod_version': version,
+            'dependencies': [dep for dep, _ in dependencies],
+        }
+        if i % 5:
+            entry['mod_id'] = mod_id
+        if rng.random() < 0.1:
+            entry['mod_version'] = f"{int(version.split('.')[0]) + 1}.0.0"
+        modlist_mods.append(entry)
+
+    for i in range(max(1, count // 10)):
+        modlist_mods.append({
+            'name': f"Not Installed {i:05d}",
+            'mod_id': f"missing_mod_{i:05d}",
+            'download_url': f"https://example.com/mods/missing_{i}.zip",
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'game_version': GAME_VERSION,
+            'mod_version': "1.0.0",
+            'dependencies': [],
+        })
+
+    modlist_data = {
+        'modlist_name': f"Benchmark {count}",
+        'version': "1.0",
+        'starsector_version': GAME_VERSION,
+        'description': "Synthetic modlist for benchmarks",
+        'mods': modlist_mods,
+    }
+    with open(starsector_dir / "modlist_config.json", 'w', encoding='utf-8') as f:
+        json.dump(modlist_data, f, indent=2)
+
+    return starsector_dir, modlist_data
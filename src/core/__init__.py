@@ -2,8 +2,14 @@
 
 from .constants import (
     BASE_DIR, CONFIG_FILE, CATEGORIES_FILE, LOG_FILE, PREFS_FILE, CACHE_DIR,
-    URL_VALIDATION_TIMEOUT_HEAD, REQUEST_TIMEOUT, MIN_FREE_SPACE_GB, CHUNK_SIZE,
-    MAX_DOWNLOAD_WORKERS, MAX_VALIDATION_WORKERS,
+    URL_VALIDATION_TIMEOUT_HEAD, REQUEST_TIMEOUT, MIN_FREE_SPACE_GB, DOWNLOAD_BUFFER_BYTES,
+    HTTP_USER_AGENT, HTTP_POOL_HOSTS, HTTP_CONNECT_RETRIES, DOWNLOAD_CACHE_MAX_BYTES,
+    SEGMENTED_DOWNLOAD_MIN_BYTES, DOWNLOAD_SEGMENT_BYTES, MAX_SEGMENT_CONNECTIONS,
+    MAX_DOWNLOAD_WORKERS, MAX_VALIDATION_WORKERS, MAX_SCAN_WORKERS, MAX_EXTRACTION_WORKERS, MODS_WATCH_POLL_INTERVAL,
+    ZIP_MEMBER_WORKERS, ZIP_PARALLEL_MIN_MEMBERS,
+    MAX_ADAPTIVE_DOWNLOAD_WORKERS, HOST_INITIAL_CONNECTIONS, HOST_MAX_CONNECTIONS, HOST_BREAKER_THRESHOLD,
+    THROUGHPUT_SAMPLE_INTERVAL, THROUGHPUT_GAIN,
+    MODS_WATCH_FULL_SCAN_INTERVAL,
     MAX_RETRIES, RETRY_DELAY, BACKOFF_MULTIPLIER, CACHE_TIMEOUT,
     UI_BOTTOM_BUTTON_HEIGHT, UI_MIN_WINDOW_WIDTH, UI_MIN_WINDOW_HEIGHT,
     UI_DEFAULT_WINDOW_WIDTH, UI_DEFAULT_WINDOW_HEIGHT,
@@ -14,8 +20,14 @@ from .installer import ModInstaller
 
 __all__ = [
     'BASE_DIR', 'CONFIG_FILE', 'CATEGORIES_FILE', 'LOG_FILE', 'PREFS_FILE', 'CACHE_DIR',
-    'URL_VALIDATION_TIMEOUT_HEAD', 'REQUEST_TIMEOUT', 'MIN_FREE_SPACE_GB', 'CHUNK_SIZE',
-    'MAX_DOWNLOAD_WORKERS', 'MAX_VALIDATION_WORKERS',
+    'URL_VALIDATION_TIMEOUT_HEAD', 'REQUEST_TIMEOUT', 'MIN_FREE_SPACE_GB', 'DOWNLOAD_BUFFER_BYTES',
+    'HTTP_USER_AGENT', 'HTTP_POOL_HOSTS', 'HTTP_CONNECT_RETRIES', 'DOWNLOAD_CACHE_MAX_BYTES',
+    'SEGMENTED_DOWNLOAD_MIN_BYTES', 'DOWNLOAD_SEGMENT_BYTES', 'MAX_SEGMENT_CONNECTIONS',
+    'MAX_DOWNLOAD_WORKERS', 'MAX_VALIDATION_WORKERS', 'MAX_SCAN_WORKERS', 'MAX_EXTRACTION_WORKERS', 'MODS_WATCH_POLL_INTERVAL',
+    'ZIP_MEMBER_WORKERS', 'ZIP_PARALLEL_MIN_MEMBERS',
+    'MAX_ADAPTIVE_DOWNLOAD_WORKERS', 'HOST_INITIAL_CONNECTIONS', 'HOST_MAX_CONNECTIONS', 'HOST_BREAKER_THRESHOLD',
+    'THROUGHPUT_SAMPLE_INTERVAL', 'THROUGHPUT_GAIN',
+    'MODS_WATCH_FULL_SCAN_INTERVAL',
     'MAX_RETRIES', 'RETRY_DELAY', 'BACKOFF_MULTIPLIER', 'CACHE_TIMEOUT',
     'UI_BOTTOM_BUTTON_HEIGHT', 'UI_MIN_WINDOW_WIDTH', 'UI_MIN_WINDOW_HEIGHT',
     'UI_DEFAULT_WINDOW_WIDTH', 'UI_DEFAULT_WINDOW_HEIGHT',
@@ -1,10 +1,9 @@
 """Configuration and data management for modlist."""
 import json
-import tempfile
-import os
 from pathlib import Path
 
 from .constants import CONFIG_FILE, CATEGORIES_FILE, PREFS_FILE
+from utils.persistence import save_json_atomic
 
 
 class ConfigManager:
@@ -25,24 +24,7 @@ class ConfigManager:
             ensure_ascii: Whether to escape non-ASCII characters (default: False)
         """
         try:
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            # Atomic write: write to temp file then replace
-            temp_fd, temp_path = tempfile.mkstemp(
-                dir=file_path.parent,
-                prefix=f'.tmp_{file_path.stem}_',
-                suffix='.json'
-            )
-            try:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
-                # Atomic replace (preserves file if crash during write)
-                os.replace(temp_path, file_path)
-            except Exception:
-                # Cleanup temp file if something failed
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise
+            save_json_atomic(file_path, data, indent=indent, ensure_ascii=ensure_ascii)
         except Exception as e:
             print(f"Error saving {file_path.name}: {e}")
     
@@ -35,8 +35,15 @@ CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
 # Network & Download settings
 URL_VALIDATION_TIMEOUT_HEAD = 6
 REQUEST_TIMEOUT = 30
-CHUNK_SIZE = 8192
+DOWNLOAD_BUFFER_BYTES = 1024 ** 2  # Reusable buffer download bodies are read into and written from
 MIN_FREE_SPACE_GB = 5
+HTTP_USER_AGENT = "ASTRA-Modlist-Installer"
+HTTP_POOL_HOSTS = 16  # Per-host keep-alive connection pools kept by the shared session
+HTTP_CONNECT_RETRIES = 2  # Transport-level retries for failed connections (before any data)
+DOWNLOAD_CACHE_MAX_BYTES = 5 * 1024 ** 3  # Archives kept in CACHE_DIR (least recently used evicted first)
+SEGMENTED_DOWNLOAD_MIN_BYTES = 64 * 1024 ** 2  # Archives at least this large are fetched in byte ranges
+DOWNLOAD_SEGMENT_BYTES = 16 * 1024 ** 2  # Size of one byte range of a segmented download
+MAX_SEGMENT_CONNECTIONS = 3  # Connections one segmented download may use (taken from idle download workers)
 
 # Retry settings
 MAX_RETRIES = 3
@@ -45,8 +52,22 @@ BACKOFF_MULTIPLIER = 2  # exponential backoff multiplier
 CACHE_TIMEOUT = 3600  # 1 hour in seconds
 
 # Thread pool settings
-MAX_DOWNLOAD_WORKERS = 3
-MAX_VALIDATION_WORKERS = 5
+MAX_DOWNLOAD_WORKERS = 3  # Archives downloaded at once when an install starts (grows with throughput)
+MAX_ADAPTIVE_DOWNLOAD_WORKERS = 8  # Ceiling for the adaptive download worker count
+MAX_VALIDATION_WORKERS = 5  # URL checks running at once (across all hosts)
+HOST_INITIAL_CONNECTIONS = 2  # Concurrent requests per host before it proves it can take more
+HOST_MAX_CONNECTIONS = 6  # Per-host ceiling (also the connections kept per host pool)
+HOST_BREAKER_THRESHOLD = 3  # Consecutive timeouts/connection errors before a host's URL checks fail fast
+THROUGHPUT_SAMPLE_INTERVAL = 5.0  # seconds of download throughput compared when tuning the worker count
+THROUGHPUT_GAIN = 0.1  # Relative throughput change that adds (or removes) a download worker
+MAX_SCAN_WORKERS = 8  # Concurrent mod_info.json stats/reads (hides network drive latency)
+MAX_EXTRACTION_WORKERS = 4  # Archives extracted at once (default of the 'extraction_workers' preference)
+ZIP_MEMBER_WORKERS = 4  # Threads inflating the members of one large ZIP (each with its own handle)
+ZIP_PARALLEL_MIN_MEMBERS = 200  # Smaller ZIPs are extracted on a single thread
+
+# Mods folder watcher
+MODS_WATCH_POLL_INTERVAL = 2.0  # seconds between checks when inotify is unavailable
+MODS_WATCH_FULL_SCAN_INTERVAL = 60.0  # seconds between mod_info.json stat passes when polling
 
 # UI settings
 UI_BOTTOM_BUTTON_HEIGHT = 35
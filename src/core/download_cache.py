@@ -0,0 +1,321 @@
+"""
+Content-addressed cache for downloaded mod archives.
+
+Archives are stored once per content (sha256) under CACHE_DIR. Each download
+URL maps to the archive it served last, together with the validators the
+server sent for it (ETag, Last-Modified, Content-Length). When a later
+download of the same URL sends them back as If-None-Match / If-Modified-Since;
+a 304 Not Modified answer (or a response with the same validators, from
+servers ignoring conditional requests) takes the archive from the cache
+instead of the network. The cache is capped in size and
+evicts the least recently used archives first.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from .constants import CACHE_DIR, DOWNLOAD_CACHE_MAX_BYTES
+from utils.persistence import save_json_atomic, shared_instance
+
+
+CACHE_INDEX_FILE = "cache_index.json"
+CACHE_FORMAT_VERSION = 1
+
+
+class DownloadCache:
+    """Archive cache keyed by URL and validators, storing files by sha256."""
+
+    def __init__(self, cache_dir, max_bytes=DOWNLOAD_CACHE_MAX_BYTES):
+        """
+        Initialize the cache, loading its index if present.
+
+        Args:
+            cache_dir: Directory holding the archives and the index
+            max_bytes: Size cap; least recently used archives are evicted above it
+        """
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_file = self.cache_dir / CACHE_INDEX_FILE
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = {}  # url -> {'etag', 'last_modified', 'content_length', 'sha256', 'is_7z'}
+        self._objects = {}  # sha256 -> {'size', 'last_used'}
+        self._load()
+
+    @staticmethod
+    def validators(headers):
+        """
+        Return the cache validators of a response.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            dict: {'etag', 'last_modified', 'content_length'}, or None if the
+                  server sent neither ETag nor Last-Modified (the content can't
+                  be told apart from a newer upload of the same size)
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_length': headers.get('Content-Length'),
+        }
+
+    def conditional_headers(self, url):
+        """
+        Return the headers that revalidate the archive cached for url.
+
+        Args:
+            url: Download URL
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, or None if the URL
+                  is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return None
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers or None
+
+    @staticmethod
+    def revalidated(headers):
+        """
+        Return the validators a 304 answer to conditional_headers() confirms.
+
+        Args:
+            headers: Headers returned by conditional_headers()
+
+        Returns:
+            dict: {'etag', 'last_modified'}, for checkout()
+        """
+        return {'etag': headers.get('If-None-Match'), 'last_modified': headers.get('If-Modified-Since')}
+
+    def _object_path(self, sha256):
+        return self.objects_dir / sha256[:2] / sha256
+
+    def _load(self):
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != CACHE_FORMAT_VERSION:
+            return
+        objects = data.get('objects', {})
+        self._objects = {sha: info for sha, info in objects.items() if self._object_path(sha).is_file()}
+        self._entries = {url: entry for url, entry in data.get('entries', {}).items()
+                         if entry.get('sha256') in self._objects}
+
+    def _save(self):
+        """Write the index atomically (caller holds the lock)."""
+        data = {'version': CACHE_FORMAT_VERSION, 'entries': self._entries, 'objects': self._objects}
+        try:
+            save_json_atomic(self.index_file, data)
+        except OSError:
+            pass
+
+    def _remove_object(self, sha256):
+        """Delete an archive and the URLs pointing at it (caller holds the lock)."""
+        self._objects.pop(sha256, None)
+        for url in [url for url, entry in self._entries.items() if entry['sha256'] == sha256]:
+            del self._entries[url]
+        try:
+            self._object_path(sha256).unlink()
+        except OSError:
+            pass
+
+    def _evict(self, keep=None):
+        """Drop least recently used archives until the cache fits (caller holds the lock)."""
+        total = sum(info['size'] for info in self._objects.values())
+        for sha256 in sorted(self._objects, key=lambda sha: self._objects[sha]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            total -= self._objects[sha256]['size']
+            self._remove_object(sha256)
+
+    def checkout(self, url, validators, suffix=''):
+        """
+        Copy the cached archive for url into a new temporary file.
+
+        The copy belongs to the caller (it is deleted after extraction like a
+        fresh download). A hard link is used when the temp directory is on the
+        same filesystem as the cache.
+
+        Args:
+            url: Download URL
+            validators: Validators of the current response (see validators()),
+                        or the ones a 304 confirmed (see revalidated())
+            suffix: Suffix of the temporary file (e.g. '.zip')
+
+        Returns:
+            tuple: (temp_path, is_7z), or None if the URL is not cached with
+                   these validators
+        """
+        if not validators:
+            return None
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or any(entry.get(key) != value for key, value in validators.items()):
+                return None
+            sha256 = entry['sha256']
+            self._objects[sha256]['last_used'] = time.time()
+            self._save()
+            source = self._object_path(sha256)
+            is_7z = entry.get('is_7z', False)
+
+            temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix='modlist_')
+            os.close(temp_fd)
+            try:
+                try:
+                    os.unlink(temp_path)
+                    os.link(source, temp_path)
+                except OSError:
+                    shutil.copyfile(source, temp_path)
+            except OSError:
+                # Archive vanished or is unreadable: forget it
+                self._remove_object(sha256)
+                self._save()
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                return None
+        return temp_path, is_7z
+
+    def store(self, url, validators, file_path, sha256, is_7z=False):
+        """
+        Add a downloaded archive to the cache.
+
+        Args:
+            url: Download URL
+            validators: Validators of the response that served the file
+            file_path: Downloaded archive (left in place)
+            sha256: Hex sha256 digest of the file
+            is_7z: Whether the archive is a 7z file
+
+        Returns:
+            bool: True if the archive is now cached
+        """
+        if not validators:
+            return False
+        size = os.path.getsize(file_path)
+        if size > self.max_bytes:
+            return False
+
+        target = self._object_path(sha256)
+        if not target.is_file():
+            temp_target = None
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_target = tempfile.mkstemp(dir=target.parent, prefix='.tmp_')
+                os.close(fd)
+                try:
+                    os.unlink(temp_target)
+                    os.link(file_path, temp_target)
+                except OSError:
+                    shutil.copyfile(file_path, temp_target)
+                os.replace(temp_target, target)
+            except OSError:
+                # Read-only or full disk: the download itself is still fine
+                if temp_target and os.path.exists(temp_target):
+                    os.unlink(temp_target)
+                return False
+
+        with self._lock:
+            previous = self._entries.get(url)
+            self._entries[url] = dict(validators, sha256=sha256, is_7z=is_7z)
+            self._objects[sha256] = {'size': size, 'last_used': time.time()}
+            # The old version of this URL is garbage unless another URL serves it
+            if previous and previous['sha256'] != sha256 and not any(
+                    entry['sha256'] == previous['sha256'] for entry in self._entries.values()):
+                self._remove_object(previous['sha256'])
+            self._evict(keep=sha256)
+            self._save()
+        return True
+
+    def discard(self, url):
+        """
+        Delete the archive cached for url (e.g. it turned out to be corrupted).
+
+        Returns:
+            bool: True if an archive was deleted
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return False
+            self._remove_object(entry['sha256'])
+            self._save()
+        return True
+
+    def set_max_bytes(self, max_bytes):
+        """Change the size cap, evicting archives if the cache is now too large."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+            self._save()
+
+    def stats(self):
+        """
+        Summarize the cache contents.
+
+        Returns:
+            dict: {'archives', 'urls', 'size_bytes', 'max_bytes', 'cache_dir'}
+        """
+        with self._lock:
+            return {
+                'archives': len(self._objects),
+                'urls': len(self._entries),
+                'size_bytes': sum(info['size'] for info in self._objects.values()),
+                'max_bytes': self.max_bytes,
+                'cache_dir': str(self.cache_dir),
+            }
+
+    def entries(self):
+        """
+        List the cached URLs, most recently used first.
+
+        Returns:
+            list: Dicts with 'url', 'sha256', 'size', 'last_used' and the validators
+        """
+        with self._lock:
+            listed = [dict(entry, url=url, size=self._objects[entry['sha256']]['size'],
+                           last_used=self._objects[entry['sha256']]['last_used'])
+                      for url, entry in self._entries.items()]
+        return sorted(listed, key=lambda entry: entry['last_used'], reverse=True)
+
+    def purge(self):
+        """
+        Delete every cached archive.
+
+        Returns:
+            int: Number of bytes freed
+        """
+        with self._lock:
+            freed = sum(info['size'] for info in self._objects.values())
+            self._entries.clear()
+            self._objects.clear()
+            shutil.rmtree(self.objects_dir, ignore_errors=True)
+            self._save()
+        return freed
+
+
+@shared_instance
+def get_download_cache():
+    """Return the shared download cache in CACHE_DIR, creating it on first use."""
+    return DownloadCache(CACHE_DIR)
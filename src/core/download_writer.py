@@ -0,0 +1,152 @@
+"""
+Write path for download bodies.
+
+Bodies are read straight from the HTTP connection into a reusable
+DOWNLOAD_BUFFER_BYTES buffer (http.client's readinto, through a memoryview)
+and written to the archive file one full buffer at a time, instead of one
+8 KiB bytes object per iter_content() step. Compressed bodies and responses
+that don't expose the connection (test doubles) fall back to iter_content()
+with buffer-sized chunks.
+"""
+
+import http.client
+import os
+import threading
+
+import requests
+
+from .constants import DOWNLOAD_BUFFER_BYTES
+
+
+_buffers = threading.local()
+
+
+def _buffer():
+    """Return this thread's reusable read buffer."""
+    buffer = getattr(_buffers, 'buffer', None)
+    if buffer is None or len(buffer) != DOWNLOAD_BUFFER_BYTES:
+        buffer = _buffers.buffer = bytearray(DOWNLOAD_BUFFER_BYTES)
+    return buffer
+
+
+def content_length(response):
+    """Return the Content-Length of response as an int, or None."""
+    try:
+        return int(response.headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+
+def preallocate(f, size):
+    """
+    Reserve size bytes for an open file, so large archives are laid out in one piece.
+
+    Uses posix_fallocate where available and only extends the file elsewhere.
+    The file keeps that size until it is truncated; callers truncate it to the
+    bytes actually written.
+
+    Args:
+        f: File opened for writing
+        size: Final size of the file in bytes
+    """
+    if size <= 0:
+        return
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # Not supported by this filesystem
+    if os.fstat(f.fileno()).st_size < size:
+        f.truncate(size)
+
+
+def _raw_reader(response):
+    """Return the http.client response under response if its body can be read as-is, else None."""
+    encoding = (response.headers.get('Content-Encoding') or 'identity').lower()
+    if encoding != 'identity':
+        return None
+    reader = getattr(getattr(response, 'raw', None), '_fp', None)
+    return reader if isinstance(reader, http.client.HTTPResponse) else None
+
+
+def copy_response(response, f, limit=None, hasher=None):
+    """
+    Write the body of a streamed response to f at its current position.
+
+    Bytes written before an error are kept (f.tell() tells how many), so the
+    caller can resume after a broken transfer.
+
+    Args:
+        response: Streamed requests.Response
+        f: File opened for writing
+        limit: Stop after this many bytes (default: the whole body)
+        hasher: Optional hashlib object updated with the written bytes
+
+    Returns:
+        int: Bytes written
+
+    Raises:
+        requests.exceptions.ConnectionError: The connection failed or closed
+            before Content-Length bytes arrived
+    """
+    reader = _raw_reader(response)
+    if reader is None:
+        return _copy_chunks(response, f, limit, hasher)
+
+    buffer = _buffer()
+    view = memoryview(buffer)
+    written = 0
+    try:
+        while limit is None or written < limit:
+            # Fill the whole buffer, so the file gets full-size writes
+            filled = 0
+            size = len(buffer) if limit is None else min(len(buffer), limit - written)
+            while filled < size:
+                count = _read_into(reader, view[filled:size], written + filled)
+                if not count:
+                    break
+                filled += count
+            if filled:
+                f.write(view[:filled])
+                if hasher is not None:
+                    hasher.update(view[:filled])
+                written += filled
+            if filled < size:
+                break  # End of body
+    finally:
+        view.release()
+
+    if reader.isclosed():
+        # Body read to the end: give the keep-alive connection back to the pool
+        response.raw.release_conn()
+    expected = content_length(response)
+    if limit is None and expected is not None and written != expected:
+        raise requests.exceptions.ConnectionError(
+            f"Connection closed after {written} of {expected} bytes")
+    return written
+
+
+def _read_into(reader, view, received):
+    """readinto() that reports network failures as requests exceptions (so they are retried)."""
+    try:
+        return reader.readinto(view)
+    except (OSError, http.client.HTTPException) as e:
+        raise requests.exceptions.ConnectionError(f"Connection failed after {received} bytes: {e}") from e
+
+
+def _copy_chunks(response, f, limit, hasher):
+    """copy_response() through iter_content (decoded or test responses)."""
+    written = 0
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_BYTES):
+        if not chunk:
+            continue
+        if limit is not None:
+            chunk = chunk[:limit - written]
+        f.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        written += len(chunk)
+        if limit is not None and written >= limit:
+            break
+    return written
@@ -0,0 +1,342 @@
+"""
+Per-host concurrency limits for downloads and URL checks.
+
+Jobs are dispatched to a thread pool one host at a time in turn, so a slow
+host (Google Drive) only occupies its own slots while jobs for other hosts
+(GitHub) keep running. Each host starts at HOST_INITIAL_CONNECTIONS
+concurrent requests; successful responses raise its limit additively up to
+HOST_MAX_CONNECTIONS, and 429/503 answers or timeouts halve it (AIMD). The
+download scheduler also tunes its global worker count: it adds a worker
+while aggregate throughput keeps improving and removes one when it drops.
+HostCircuitBreaker stops sending requests to a host that keeps timing out.
+"""
+
+import collections
+import concurrent.futures
+import threading
+import time
+from urllib.parse import urlparse
+
+from .constants import (
+    HOST_INITIAL_CONNECTIONS, HOST_MAX_CONNECTIONS, HOST_BREAKER_THRESHOLD,
+    THROUGHPUT_SAMPLE_INTERVAL, THROUGHPUT_GAIN
+)
+
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+_host_limits = None
+_host_limits_lock = threading.Lock()
+
+
+def host_of(url):
+    """Return the lowercase host (netloc) of url, or '' if it can't be parsed."""
+    try:
+        return urlparse(url).netloc.lower()
+    except (ValueError, AttributeError):
+        return ''
+
+
+class HostLimits:
+    """AIMD concurrency limit and active request count of each host."""
+
+    def __init__(self, initial=HOST_INITIAL_CONNECTIONS, maximum=HOST_MAX_CONNECTIONS):
+        """
+        Initialize the limits.
+
+        Args:
+            initial: Limit of a host not seen before
+            maximum: Highest limit a host can reach
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self._lock = threading.Lock()
+        self._limits = {}  # host -> float limit
+        self._active = collections.Counter()
+
+    def limit(self, host):
+        """Return the number of concurrent requests currently allowed to host."""
+        with self._lock:
+            return int(self._limits.get(host, self.initial))
+
+    def try_acquire(self, host):
+        """
+        Take a request slot for host if it is below its limit.
+
+        Returns:
+            bool: True if a slot was taken (give it back with release())
+        """
+        with self._lock:
+            if self._active[host] >= int(self._limits.get(host, self.initial)):
+                return False
+            self._active[host] += 1
+            return True
+
+    def release(self, host):
+        """Give back a slot taken with try_acquire()."""
+        with self._lock:
+            self._active[host] -= 1
+            if self._active[host] <= 0:
+                del self._active[host]
+
+    def record_success(self, host):
+        """Additive increase: one more slot after about `limit` successful requests."""
+        with self._lock:
+            limit = self._limits.get(host, self.initial)
+            self._limits[host] = min(self.maximum, limit + 1.0 / limit)
+
+    def record_throttled(self, host):
+        """Multiplicative decrease after a 429/503 answer or a timeout."""
+        with self._lock:
+            self._limits[host] = max(1.0, self._limits.get(host, self.initial) / 2)
+
+    def record_response(self, url, status_code):
+        """
+        Adjust the limit of url's host from a response status.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the response
+        """
+        if not isinstance(status_code, int):
+            return
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_throttled(host_of(url))
+        elif status_code < 400:
+            self.record_success(host_of(url))
+
+
+def get_host_limits():
+    """Return the process-wide host limits shared by downloads and URL checks."""
+    global _host_limits
+    with _host_limits_lock:
+        if _host_limits is None:
+            _host_limits = HostLimits()
+        return _host_limits
+
+
+class HostCircuitBreaker:
+    """Per-host health: fail fast after repeated network failures, recover through one probe.
+
+    A host's breaker opens after `threshold` consecutive timeouts or connection
+    errors; allow() then refuses its requests. After half_open(), the next
+    request to the host is a probe and other requests wait for its outcome: a
+    success closes the breaker, a failure opens it again.
+    """
+
+    def __init__(self, threshold=HOST_BREAKER_THRESHOLD):
+        """
+        Initialize the breaker with every host closed (healthy).
+
+        Args:
+            threshold: Consecutive network failures that open a host's breaker
+        """
+        self.threshold = threshold
+        self._condition = threading.Condition()
+        self._failures = collections.Counter()  # host -> consecutive network failures
+        self._open = set()
+        self._half_open = set()  # Open hosts whose next request is a probe
+        self._probing = set()  # Hosts with a probe in flight
+
+    def allow(self, host):
+        """
+        Return True if a request to host may be sent (report its outcome with
+        record_success() or record_failure()), False if it should fail fast.
+
+        Blocks while a probe of the host is in flight.
+        """
+        with self._condition:
+            while host in self._probing:
+                self._condition.wait()
+            if host not in self._open:
+                return True
+            if host in self._half_open:
+                self._half_open.discard(host)
+                self._probing.add(host)
+                return True
+            return False
+
+    def is_open(self, host):
+        """Return True if requests to host currently fail fast."""
+        with self._condition:
+            return host in self._open
+
+    def failures(self, host):
+        """Return the consecutive network failures of host."""
+        with self._condition:
+            return self._failures[host]
+
+    def record_success(self, host):
+        """The host answered (any HTTP status): close its breaker."""
+        with self._condition:
+            self._failures.pop(host, None)
+            self._open.discard(host)
+            self._half_open.discard(host)
+            self._probing.discard(host)
+            self._condition.notify_all()
+
+    def record_failure(self, host):
+        """A request to host timed out or could not connect."""
+        with self._condition:
+            self._failures[host] += 1
+            if host in self._probing or self._failures[host] >= self.threshold:
+                self._open.add(host)
+            self._probing.discard(host)
+            self._condition.notify_all()
+
+    def half_open(self):
+        """Let one probe request through to each open host."""
+        with self._condition:
+            self._half_open.update(self._open)
+
+
+class HostScheduler:
+    """Runs jobs on a thread pool within per-host limits and a global worker cap."""
+
+    def __init__(self, max_workers, initial_workers=None, host_limits=None, adaptive=False):
+        """
+        Create the scheduler and its thread pool.
+
+        Args:
+            max_workers: Thread pool size; the worker count never exceeds it
+            initial_workers: Jobs running at once at the start (default: max_workers)
+            host_limits: HostLimits to respect (default: the shared get_host_limits())
+            adaptive: If True, tune the worker count from the throughput reported
+                      by map_unordered's result_bytes
+        """
+        self.max_workers = max_workers
+        self.min_workers = initial_workers or max_workers
+        self.workers = self.min_workers
+        self.host_limits = host_limits or get_host_limits()
+        self.adaptive = adaptive
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0  # Jobs of map_unordered not dispatched yet
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._last_rate = None
+
+    def _run(self, host, fn, args):
+        try:
+            return fn(*args)
+        finally:
+            self.host_limits.release(host)
+            with self._lock:
+                self._running -= 1
+
+    def _start(self, host, fn, args):
+        """Take a global and a host slot and submit fn(*args); returns the future or None."""
+        with self._lock:
+            if self._running >= self.workers:
+                return None
+            if not self.host_limits.try_acquire(host):
+                return None
+            self._running += 1
+        try:
+            return self.executor.submit(self._run, host, fn, args)
+        except RuntimeError:
+            # Pool shut down (installation canceled)
+            self.host_limits.release(host)
+            with self._lock:
+                self._running -= 1
+            raise
+
+    def try_submit(self, url, fn, *args):
+        """
+        Run an extra task against url's host if a slot is free and no job is waiting.
+
+        Used for additional connections of a job already running (e.g. byte ranges
+        of a large download), so they only take capacity no queued job needs.
+
+        Returns:
+            Future, or None if there is no spare capacity
+        """
+        if self._queued:
+            return None
+        try:
+            return self._start(host_of(url), fn, args)
+        except RuntimeError:
+            return None
+
+    def map_unordered(self, fn, items, url_of, result_bytes=None):
+        """
+        Run fn(item) for every item and yield (item, future) as jobs complete.
+
+        Jobs for different hosts are dispatched in turn, each host within its
+        limit. Dispatching stops if the pool is shut down.
+
+        Args:
+            fn: Callable taking one item
+            items: Iterable of items
+            url_of: Callable returning the URL an item targets
+            result_bytes: Optional callable(result) returning the bytes a job
+                          transferred (drives the adaptive worker count)
+
+        Yields:
+            tuple: (item, completed future)
+        """
+        pending = collections.OrderedDict()  # host -> deque of items, in first-seen order
+        for item in items:
+            pending.setdefault(host_of(url_of(item)), collections.deque()).append(item)
+        self._queued = sum(len(queue) for queue in pending.values())
+        futures = {}
+
+        try:
+            while pending or futures:
+                try:
+                    self._dispatch(pending, futures, fn)
+                except RuntimeError:
+                    pending.clear()
+                    self._queued = 0
+                if not futures:
+                    if pending:
+                        # Hosts busy with extra tasks (or throttled): check again shortly
+                        threading.Event().wait(0.05)
+                    continue
+
+                done, _ = concurrent.futures.wait(futures, timeout=0.5,
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    item = futures.pop(future)
+                    if self.adaptive and result_bytes and not future.cancelled() and future.exception() is None:
+                        self._record_bytes(result_bytes(future.result()))
+                    yield item, future
+        finally:
+            self._queued = 0
+
+    def _dispatch(self, pending, futures, fn):
+        """Start queued jobs, one per host in turn, while slots are free."""
+        started = True
+        while started and pending:
+            started = False
+            for host in list(pending):
+                future = self._start(host, fn, (pending[host][0],))
+                if future is None:
+                    continue
+                futures[future] = pending[host].popleft()
+                self._queued -= 1
+                if not pending[host]:
+                    del pending[host]
+                started = True
+
+    def _record_bytes(self, byte_count):
+        """Add transferred bytes and adjust the worker count once per sample interval."""
+        now = time.monotonic()
+        with self._lock:
+            self._window_bytes += byte_count
+            elapsed = now - self._window_start
+            if elapsed < THROUGHPUT_SAMPLE_INTERVAL:
+                return
+            rate = self._window_bytes / elapsed
+            if self._last_rate is None or rate > self._last_rate * (1 + THROUGHPUT_GAIN):
+                self.workers = min(self.max_workers, self.workers + 1)
+            elif rate < self._last_rate * (1 - THROUGHPUT_GAIN):
+                self.workers = max(self.min_workers, self.workers - 1)
+            self._last_rate = rate
+            self._window_start = now
+            self._window_bytes = 0
+
+    def shutdown(self, wait=True):
+        """Shut down the thread pool."""
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,85 @@
+"""
+Shared HTTP client for the Modlist Installer.
+URL validation and downloads go through one process-wide requests.Session, so
+requests to the same host (github.com, objects.githubusercontent.com, ...)
+reuse warm keep-alive connections instead of paying a new TCP and TLS
+handshake each time.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import (
+    HTTP_USER_AGENT, HTTP_POOL_HOSTS, HTTP_CONNECT_RETRIES, HOST_MAX_CONNECTIONS
+)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_maxsize=None):
+    """
+    Create a requests.Session configured for the installer.
+
+    The session sends a consistent User-Agent, keeps up to HTTP_POOL_HOSTS
+    per-host connection pools alive, and retries failed connection attempts
+    (including stale keep-alive connections) before any data was received.
+    HTTP error statuses are returned as-is; callers decide how to handle them.
+
+    Args:
+        pool_maxsize: Connections kept per host (default: HOST_MAX_CONNECTIONS, the
+                      most requests the host scheduler runs against one host)
+
+    Returns:
+        requests.Session: New session
+    """
+    if pool_maxsize is None:
+        pool_maxsize = HOST_MAX_CONNECTIONS
+
+    retry = Retry(
+        total=HTTP_CONNECT_RETRIES,
+        connect=HTTP_CONNECT_RETRIES,
+        read=1,
+        status=0,
+        backoff_factor=0.3,
+        allowed_methods=frozenset({'HEAD', 'GET'}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.headers['User-Agent'] = f"{HTTP_USER_AGENT} python-requests/{requests.__version__}"
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    requests.Session is safe to share between the download and validation
+    worker threads for plain GET/HEAD requests; the connection pools are
+    thread-safe.
+
+    Returns:
+        requests.Session: Shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections (a new one is created on next use)."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
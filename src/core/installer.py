@@ -11,6 +11,10 @@ import re
 import shutil
 import time
 import json
+import hashlib
+import threading
+import concurrent.futures
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 
 try:
@@ -20,20 +24,25 @@ except ImportError:
     HAS_7ZIP = False
 
 from .constants import (
-    REQUEST_TIMEOUT, CHUNK_SIZE, URL_VALIDATION_TIMEOUT_HEAD, 
-    MAX_VALIDATION_WORKERS, MAX_RETRIES, RETRY_DELAY, BACKOFF_MULTIPLIER
+    REQUEST_TIMEOUT, URL_VALIDATION_TIMEOUT_HEAD,
+    MAX_VALIDATION_WORKERS, MAX_SCAN_WORKERS, MAX_RETRIES, RETRY_DELAY, BACKOFF_MULTIPLIER,
+    SEGMENTED_DOWNLOAD_MIN_BYTES, DOWNLOAD_SEGMENT_BYTES, MAX_SEGMENT_CONNECTIONS,
+    ZIP_MEMBER_WORKERS, ZIP_PARALLEL_MIN_MEMBERS
 )
 from utils.mod_utils import (
     normalize_mod_name,
-    extract_mod_id_from_text,
-    extract_mod_name_from_text,
-    extract_mod_version_from_text,
-    extract_game_version_from_text,
     extract_all_metadata_from_text,
     compare_versions,
-    is_mod_name_match,
-    scan_installed_mods
+    is_mod_name_match
 )
+from utils.installed_mod_index import get_installed_mod_index
+from .http_client import get_session
+from .download_writer import copy_response, content_length, preallocate
+from .host_scheduler import HostCircuitBreaker, HostScheduler, get_host_limits, host_of
+from .url_probe import probe_url
+
+
+SEVEN_ZIP_SIGNATURE = b'7z\xbc\xaf\x27\x1c'  # First bytes of every 7z archive
 
 
 def retry_with_backoff(func, max_retries=MAX_RETRIES, delay=RETRY_DELAY, backoff=BACKOFF_MULTIPLIER, 
@@ -70,13 +79,92 @@ def retry_with_backoff(func, max_retries=MAX_RETRIES, delay=RETRY_DELAY, backoff
     raise last_exception
 
 
-def validate_mod_urls(mods, progress_callback=None):
+def _url_category(url):
+    """Return (category, domain) of a download URL: 'github', 'google_drive' or 'other'."""
+    domain = host_of(url)
+    if 'github.com' in domain:
+        return 'github', domain
+    if 'drive.google.com' in domain or 'drive.usercontent.google.com' in domain:
+        return 'google_drive', domain
+    return 'other', domain
+
+
+def _new_validation_results():
+    """Return an empty validation report (see validate_mod_urls())."""
+    return {'github': [], 'google_drive': [], 'other': {}, 'failed': []}
+
+
+def _file_validation_result(results, category, mod, domain, status, error):
+    """Add one checked mod to a validation report."""
+    if category == 'failed':
+        results['failed'].append({
+            'mod': mod,
+            'status': status,
+            'error': error
+        })
+    elif category == 'other':
+        results['other'].setdefault(domain, []).append(mod)
+    else:
+        results[category].append(mod)
+
+
+def _short_error(error):
+    """Return an error message cut to 50 characters for the validation report."""
+    error_msg = str(error)
+    if len(error_msg) > 50:
+        error_msg = error_msg[:47] + '...'
+    return error_msg
+
+
+class DownloadValidationReport:
+    """URL validation report built from the download requests themselves.
+    
+    Instead of a HEAD pass before the installation, each download reports the
+    status of its first response (a 304 of a conditional request counts as
+    reachable) or the error it finally gave up with. results has the same
+    shape as validate_mod_urls().
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.results = _new_validation_results()
+    
+    def record(self, mod, status, error=None):
+        """
+        File the outcome of a mod's download request.
+        
+        Args:
+            mod: Mod dictionary
+            status: HTTP status of the first response (0 if none was received)
+            error: Error message for failures (default: 'HTTP <status>')
+        """
+        category, domain = _url_category(mod.get('download_url', ''))
+        if not (200 <= status < 300 or status == 304):
+            category = 'failed'
+            error = error or f'HTTP {status}'
+        with self._lock:
+            _file_validation_result(self.results, category, mod, domain, status, error)
+
+
+def validate_mod_urls(mods, progress_callback=None, probe_cache=None, on_result=None, resolver=None):
     """
     Validate all mod URLs before installation using parallel requests.
     
+    Once a host has timed out or refused the connection HOST_BREAKER_THRESHOLD
+    times in a row, its remaining mods fail fast; in the retry pass one probe
+    request decides whether they are checked again.
+    
     Args:
         mods: List of mod dictionaries with 'download_url' and 'name'
         progress_callback: Optional callback function(current, total, mod_name)
+        probe_cache: Optional UrlProbeCache; fresh probes are reused instead of
+                     asking the server again, and new ones are saved to it
+        on_result: Optional callback(category, mod, domain, status, error) run on the
+                   calling thread as soon as a mod's result is final. Checks are
+                   started in list order per host. Network errors are only reported
+                   after their retry.
+        resolver: Optional UrlResolver; URLs are probed at their resolved target
+                  and the redirects of new probes are recorded into it
         
     Returns:
         dict: {
@@ -86,15 +174,10 @@ def validate_mod_urls(mods, progress_callback=None):
             'failed': [{'mod': mod, 'status': code, 'error': str}, ...]  # Inaccessible URLs
         }
     """
-    import concurrent.futures
-    from urllib.parse import urlparse
-    
-    results = {
-        'github': [],
-        'google_drive': [],
-        'other': {},
-        'failed': []
-    }
+    results = _new_validation_results()
+    host_limits = get_host_limits()
+    # Hosts that keep timing out fail fast instead of costing a timeout per mod
+    breaker = HostCircuitBreaker()
     
     def check_url(mod, index):
         """Check a single URL. Returns (index, category, mod, domain, status, error)."""
@@ -105,68 +188,67 @@ def validate_mod_urls(mods, progress_callback=None):
         if not url:
             return (index, 'failed', mod, None, 0, 'No download URL')
         
-        # Parse domain
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-        except (ValueError, AttributeError):
-            domain = 'unknown'
-        
         # Categorize by domain
-        is_github = 'github.com' in domain
-        is_gdrive = 'drive.google.com' in domain or 'drive.usercontent.google.com' in domain
+        category, domain = _url_category(url)
         
-        try:
-            # Try HEAD request first (fast), fallback to GET if blocked
+        # A fresh cached probe needs no request; otherwise the host must be healthy
+        probe = probe_cache.get(url) if probe_cache is not None else None
+        if probe is None:
+            if not breaker.allow(domain):
+                return (index, 'failed', mod, domain, 0,
+                        f'Skipped: {domain} did not respond {breaker.failures(domain)} times in a row')
+            host_down = False
             try:
-                response = requests.head(url, timeout=URL_VALIDATION_TIMEOUT_HEAD, allow_redirects=True)
-                # Some servers block HEAD requests with 403, try GET if that happens
-                if response.status_code == 403:
-                    raise requests.exceptions.RequestException("HEAD blocked, trying GET")
-            except (requests.exceptions.RequestException, requests.exceptions.Timeout):
-                # Fallback to GET request with minimal data (first byte only)
-                response = requests.get(url, timeout=URL_VALIDATION_TIMEOUT_HEAD, allow_redirects=True, 
-                                       headers={'Range': 'bytes=0-0'}, stream=True)
-                response.close()  # Close immediately, we just need the status
-            
-            if 200 <= response.status_code < 300:
-                if is_github:
-                    return (index, 'github', mod, domain, response.status_code, None)
-                elif is_gdrive:
-                    return (index, 'google_drive', mod, domain, response.status_code, None)
+                # HEAD (or a one-byte GET) on the shared session, to the resolved target if known
+                target = resolver.resolve(url) if resolver is not None else url
+                probe = probe_url(target)
+                if target != url and probe['status'] >= 400:
+                    # The recorded target stopped working: ask the URL itself
+                    resolver.forget(url)
+                    target, probe = url, probe_url(url)
+                if target == url and resolver is not None and probe.get('resolution'):
+                    resolver.store(url, probe['resolution']['resolved_url'], probe['resolution']['tag'])
+            except requests.exceptions.Timeout:
+                host_down = True
+                host_limits.record_throttled(domain)
+                return (index, 'failed', mod, domain, 0, f'Timeout ({URL_VALIDATION_TIMEOUT_HEAD}s)')
+            except requests.exceptions.ConnectionError as e:
+                host_down = True
+                return (index, 'failed', mod, domain, 0, _short_error(e))
+            except requests.exceptions.RequestException as e:
+                return (index, 'failed', mod, domain, 0, _short_error(e))
+            finally:
+                if host_down:
+                    breaker.record_failure(domain)
                 else:
-                    return (index, 'other', mod, domain, response.status_code, None)
-            else:
-                return (index, 'failed', mod, domain, response.status_code, f'HTTP {response.status_code}')
-        except requests.exceptions.Timeout:
-            return (index, 'failed', mod, domain, 0, 'Timeout (3s)')
-        except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            if len(error_msg) > 50:
-                error_msg = error_msg[:47] + '...'
-            return (index, 'failed', mod, domain, 0, error_msg)
+                    breaker.record_success(domain)
+            if probe_cache is not None:
+                probe_cache.store(url, probe)
+        
+        status = probe['status']
+        if 200 <= status < 300:
+            return (index, category, mod, domain, status, None)
+        else:
+            return (index, 'failed', mod, domain, status, f'HTTP {status}')
+    
+    def run_checks(mods_to_check, retrying=False):
+        """Check URLs in parallel (per-host limits, MAX_VALIDATION_WORKERS overall) and file the results."""
+        scheduler = HostScheduler(MAX_VALIDATION_WORKERS)
+        try:
+            checks = scheduler.map_unordered(lambda item: check_url(*item),
+                                             [(mod, i) for i, mod in enumerate(mods_to_check)],
+                                             url_of=lambda item: item[0].get('download_url', ''))
+            for _, future in checks:
+                _, category, mod, domain, status, error = future.result()
+                _file_validation_result(results, category, mod, domain, status, error)
+                # Network errors (status 0) get a second chance before being reported
+                if on_result and (retrying or category != 'failed' or status != 0):
+                    on_result(category, mod, domain, status, error)
+        finally:
+            scheduler.shutdown()
     
     # Run checks in parallel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_VALIDATION_WORKERS) as executor:
-        futures = [executor.submit(check_url, mod, i) for i, mod in enumerate(mods)]
-        
-        for future in concurrent.futures.as_completed(futures):
-            index, category, mod, domain, status, error = future.result()
-            
-            if category == 'github':
-                results['github'].append(mod)
-            elif category == 'google_drive':
-                results['google_drive'].append(mod)
-            elif category == 'other':
-                if domain not in results['other']:
-                    results['other'][domain] = []
-                results['other'][domain].append(mod)
-            elif category == 'failed':
-                results['failed'].append({
-                    'mod': mod,
-                    'status': status,
-                    'error': error
-                })
+    run_checks(mods)
     
     # Retry failed mods once (timeout/connection errors only, not 404s)
     if results['failed']:
@@ -184,45 +266,57 @@ def validate_mod_urls(mods, progress_callback=None):
             if progress_callback:
                 progress_callback(len(mods), len(mods), f"Retrying {len(retry_candidates)} failed...")
             
-            # Retry with same logic
+            # Retry with same logic; hosts that timed out now run fewer checks at once,
+            # and a single probe decides whether a failing host gets its mods checked again
             results['failed'] = permanent_failures  # Keep only permanent failures
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                retry_futures = [executor.submit(check_url, fail['mod'], i) 
-                                for i, fail in enumerate(retry_candidates)]
-                
-                for future in concurrent.futures.as_completed(retry_futures):
-                    index, category, mod, domain, status, error = future.result()
-                    
-                    if category == 'github':
-                        results['github'].append(mod)
-                    elif category == 'google_drive':
-                        results['google_drive'].append(mod)
-                    elif category == 'other':
-                        if domain not in results['other']:
-                            results['other'][domain] = []
-                        results['other'][domain].append(mod)
-                    elif category == 'failed':
-                        results['failed'].append({
-                            'mod': mod,
-                            'status': status,
-                            'error': error
-                        })
+            breaker.half_open()
+            run_checks([fail['mod'] for fail in retry_candidates], retrying=True)
     
+    if probe_cache is not None:
+        probe_cache.save()
+    if resolver is not None:
+        resolver.save()
     return results
 
 
+def _content_range_start(content_range):
+    """Return the first byte position of a 'bytes start-end/total' Content-Range, or None."""
+    match = re.match(r'\s*bytes\s+(\d+)-', content_range or '')
+    return int(match.group(1)) if match else None
+
+
+class _RangeIgnoredError(requests.exceptions.RequestException):
+    """The server answered a byte range request with the full (possibly changed) file."""
+
+
 class ModInstaller:
     """Handles the installation of mods from URLs."""
     
-    def __init__(self, log_callback):
+    def __init__(self, log_callback, download_cache=None, url_validators=None, url_resolver=None):
         """
         Initialize the mod installer.
         
         Args:
             log_callback: Function to call for logging messages
+            download_cache: Optional DownloadCache; downloads are served from and added to it
+            url_validators: Optional UrlValidatorStore; installed archives are revalidated
+                            with conditional requests instead of downloaded again
+            url_resolver: Optional UrlResolver; downloads go straight to the resolved
+                          target of redirecting URLs and record new redirects into it
         """
         self.log = log_callback
+        self.download_cache = download_cache
+        self.url_validators = url_validators
+        self.url_resolver = url_resolver
+        # Downloaded archive path -> (url, validators), recorded once the archive is installed
+        self._downloaded_validators = {}
+        # Host limits shared with URL validation; downloads report throttling into them
+        self.host_limits = get_host_limits()
+        # HostScheduler running the downloads; large archives hand byte ranges to its spare workers
+        self.download_scheduler = None
+        # Top-level mods folder -> lock held while an archive is checked against it and extracted into it
+        self._folder_locks = {}
+        self._folder_locks_lock = threading.Lock()
     
     def extract_mod_metadata(self, archive_path, is_7z=False):
         """
@@ -284,66 +378,129 @@ class ModInstaller:
             self.log(f"  ⚠ Warning: Could not extract metadata: {e}", debug=True)
             return None
     
-    def is_mod_already_installed(self, mod, mods_dir):
+    def is_mod_already_installed(self, mod, mods_dir, lookup=None):
         """
         Check if a mod is already installed with the expected version.
         Uses mod_id for precise matching, falls back to name normalization if mod_id unavailable.
         
+        Without a lookup, every call revalidates the installed-mods index and rebuilds
+        the lookup. To check many mods, use resolve_install_status(), or build the
+        lookup once with build_installed_lookup() and pass it to each call.
+        
         Args:
             mod: Mod dictionary with 'mod_id' (preferred) or 'name' and optional 'mod_version'
             mods_dir: Path to the Starsector mods directory
+            lookup: Optional lookup from build_installed_lookup()
             
         Returns:
             bool: True if mod is already installed with same/newer version, False otherwise
         """
-        mod_id = mod.get('mod_id', '')
-        mod_name = mod.get('name', '')
-        expected_version = mod.get('mod_version')
-        
-        if not mod_id and not mod_name:
+        if not mod.get('mod_id') and not mod.get('name'):
             return False
         
-        # Use centralized scanner to find matching mod
-        for folder, metadata in scan_installed_mods(mods_dir):
-            installed_mod_id = metadata.get('id')
-            installed_mod_name = metadata.get('name') or ''
-            
-            # Matching logic:
-            # 1. If config has mod_id AND installed mod has mod_id: match by mod_id
-            # 2. Otherwise: match by name normalization
-            is_match = False
+        if lookup is None:
+            lookup = self.build_installed_lookup(mods_dir)
+        return self._resolve_mod_status(mod, lookup) == 'installed'
+    
+    @staticmethod
+    def install_status_key(mod):
+        """Return the key of a modlist entry in resolve_install_status() results (mod_id, else name)."""
+        return mod.get('mod_id') or mod.get('name', '')
+    
+    def resolve_install_status(self, mods, mods_dir, refresh=True):
+        """
+        Resolve the installation status of many modlist entries in a single pass.
+        
+        The installed mods are indexed once by mod_id and normalized name, so the
+        cost is O(N + M) lookups instead of one full mods folder scan per entry.
+        
+        Args:
+            mods: List of mod dictionaries with 'name', optional 'mod_id' and 'mod_version'
+            mods_dir: Path to the Starsector mods directory
+            refresh: If True, revalidate the installed-mods index first
             
-            if mod_id and installed_mod_id:
-                # Both have mod_id: use precise ID matching
-                is_match = (mod_id == installed_mod_id)
-            else:
-                # At least one lacks mod_id: use name matching
-                is_match = is_mod_name_match(mod_name, folder.name, installed_mod_name)
+        Returns:
+            dict: {install_status_key(mod): 'installed' | 'outdated' | 'missing'},
+                  keyed by mod_id, or by name for entries without one
+        """
+        lookup = self.build_installed_lookup(mods_dir, refresh=refresh)
+        return {self.install_status_key(mod): self._resolve_mod_status(mod, lookup) for mod in mods}
+    
+    def build_installed_lookup(self, mods_dir, refresh=True):
+        """
+        Build hash maps over the installed mods for status resolution.
+        
+        Args:
+            mods_dir: Path to the Starsector mods directory
+            refresh: If True, revalidate the installed-mods index first
             
-            if not is_match:
-                continue  # Not the mod we're looking for
+        Returns:
+            dict: {
+                'by_id': {mod_id: InstalledMod},
+                'by_name': {normalized_name: InstalledMod},  # any installed mod
+                'by_name_no_id': {normalized_name: InstalledMod},  # installed mods without id
+                'folders': [(has_id, InstalledMod), ...]  # for partial folder name matches
+            }
+        """
+        lookup = {'by_id': {}, 'by_name': {}, 'by_name_no_id': {}, 'folders': []}
+        if not mods_dir or not Path(mods_dir).exists():
+            return lookup
+        
+        for folder, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan(refresh=refresh):
+            installed_id = installed.id
+            folder_normalized = normalize_mod_name(folder.name)
+            names = {folder_normalized, normalize_mod_name(installed.name)} - {''}
             
-            # Mod found! Now check version if expected_version is provided
-            if expected_version:
-                installed_version = metadata.get('version')
-                if not installed_version or installed_version == 'unknown':
-                    # Mod found but can't determine version - consider it installed
-                    return True
-                
-                # Compare versions using centralized function
-                comparison = compare_versions(expected_version, installed_version)
-                
-                if comparison <= 0:
-                    # Expected version is same or older than installed
-                    return True
-                else:
-                    # Installed version is older - needs update
-                    return False
-            else:
-                # No expected version specified, just check if mod exists
-                return True
+            if installed_id:
+                lookup['by_id'].setdefault(installed_id, installed)
+            for name in names:
+                lookup['by_name'].setdefault(name, installed)
+                if not installed_id:
+                    lookup['by_name_no_id'].setdefault(name, installed)
+            if folder_normalized:
+                lookup['folders'].append((bool(installed_id), installed))
         
-        return False
+        return lookup
+    
+    def _resolve_mod_status(self, mod, lookup):
+        """
+        Resolve the status of one modlist entry against a prebuilt lookup.
+        
+        Matching logic:
+        1. If config has mod_id AND an installed mod has that mod_id: match by mod_id
+        2. Otherwise: match by name normalization (exact first, then partial folder match),
+           only against installed mods without mod_id when the config has a mod_id
+        
+        Returns:
+            str: 'installed', 'outdated' or 'missing'
+        """
+        mod_id = mod.get('mod_id', '')
+        mod_name = mod.get('name', '')
+        normalized_name = normalize_mod_name(mod_name)
+        
+        installed = lookup['by_id'].get(mod_id) if mod_id else None
+        if installed is None and normalized_name:
+            names = lookup['by_name_no_id'] if mod_id else lookup['by_name']
+            installed = names.get(normalized_name)
+            if installed is None:
+                # Partial folder name match (exact matches were handled by the hash maps)
+                for has_id, candidate in lookup['folders']:
+                    if not (mod_id and has_id) and is_mod_name_match(mod_name, candidate.folder_name):
+                        installed = candidate
+                        break
+        
+        if installed is None:
+            return 'missing'
+        
+        # Mod found! Now check version if expected_version is provided
+        expected_version = mod.get('mod_version')
+        installed_version = installed.version
+        if not expected_version or not installed_version or installed_version == 'unknown':
+            # No expected version, or installed version can't be determined
+            return 'installed'
+        
+        # Expected version newer than installed means an update is needed
+        return 'outdated' if compare_versions(expected_version, installed_version) > 0 else 'installed'
     
     def install_mod(self, mod, mods_dir):
         """
@@ -385,49 +542,208 @@ class ModInstaller:
             self.log(f"  ✗ Unexpected error: {e}", error=True)
             return False
 
-    def download_archive(self, mod, skip_gdrive_check=False):
+    def download_archive(self, mod, skip_gdrive_check=False, mods_dir=None, report=None):
         """Download mod archive to a temporary file with retry logic.
-        Returns (path, is_7z) on success, (None, False) on network error, or ('GDRIVE_HTML', False) if HTML detected.
+        Returns (path, is_7z) on success, (None, False) on network error, ('GDRIVE_HTML', False) if HTML detected,
+        or ('UNCHANGED', False) if the archive installed from this URL is still current (304 Not Modified).
+        
+        The body is written to a '.part' file. When a transfer breaks, the retry asks
+        for the missing bytes only (Range + If-Range) and appends them if the server
+        answers 206 Partial Content; otherwise the download starts over.
+        
+        Archives of at least SEGMENTED_DOWNLOAD_MIN_BYTES from servers that accept byte
+        ranges are split into DOWNLOAD_SEGMENT_BYTES ranges written into a preallocated
+        file; spare workers of download_scheduler fetch ranges in parallel.
+        
+        With mods_dir and url_validators set, a URL whose archive is installed there is
+        requested with If-None-Match / If-Modified-Since first. Otherwise, with
+        download_cache set, a URL with a cached archive is requested with the cached
+        validators, and a 304 answer is served from the cache without a body.
+        
+        With url_resolver set, the request goes to the recorded target of the URL
+        (e.g. the concrete release of a GitHub "latest" link); the caches stay keyed
+        by the URL itself.
         
         Args:
             mod: Mod dictionary with download_url
             skip_gdrive_check: If True, skip Google Drive HTML detection (used after user confirmation)
+            mods_dir: Path to the Starsector mods directory (enables conditional requests)
+            report: Optional DownloadValidationReport; the first response (or the final
+                    network error) is recorded as the URL check of the mod
         """
-        temp_path = None
+        cache = self.download_cache
+        conditional_headers = None
+        if self.url_validators is not None and mods_dir is not None:
+            conditional_headers = self.url_validators.conditional_headers(mod['download_url'], mods_dir)
+        # Otherwise a cached archive of the URL is revalidated by the download request itself
+        cache_headers = None
+        if cache is not None and not conditional_headers:
+            cache_headers = cache.conditional_headers(mod['download_url'])
+        url = mod['download_url']
+        resolver = self.url_resolver
+        target = resolver.resolve(url) if resolver is not None else url  # URL actually requested
+        # State shared by the attempts, so a retry can resume the previous one
+        part_path = None  # '.part' file holding the bytes received so far
+        received = 0
+        resume_validator = None  # ETag / Last-Modified the received bytes belong to
+        validators = None  # Download cache validators of the full response
+        hasher = hashlib.sha256()
+        is_7z = False
+        segments = None  # (start, end) byte ranges still missing from a segmented download
+        url_validators = None  # Validators recorded for the URL once the archive is installed
+        reported = report is None  # First response already filed as the URL check
+        
+        def report_check(status, error=None):
+            nonlocal reported
+            if not reported:
+                reported = True
+                report.record(mod, status, error)
         
         def attempt_download():
             """Single download attempt (will be retried by retry_with_backoff)."""
-            nonlocal temp_path
+            nonlocal part_path, received, resume_validator, validators, hasher, is_7z, segments, url_validators, target, \
+                cache_headers
             
-            response = requests.get(mod['download_url'], stream=True, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            url_lower = mod['download_url'].lower()
-            content_type = response.headers.get('Content-Type', '').lower()
+            if segments and resume_validator:
+                # Segmented download interrupted: fetch the missing ranges only
+                self.log(f"  ↻ Resuming {mod.get('name')} ({len(segments)} ranges left)", debug=True)
+                try:
+                    self._download_segments(target, part_path, segments, resume_validator)
+                except _RangeIgnoredError:
+                    segments = resume_validator = None  # Start over on the next attempt
+                    raise
+                return finish_download()
             
-            # Check if we received HTML instead of a file (Google Drive virus scan page)
-            if not skip_gdrive_check:
-                is_gdrive_url = 'drive.google.com' in url_lower or 'drive.usercontent.google.com' in url_lower
+            request_kwargs = {}
+            if received and resume_validator:
+                request_kwargs['headers'] = {'Range': f'bytes={received}-', 'If-Range': resume_validator}
+            elif conditional_headers:
+                request_kwargs['headers'] = conditional_headers
+            elif cache_headers:
+                request_kwargs['headers'] = cache_headers
+            response = self._get(target, **request_kwargs)
+            if target != url and isinstance(response.status_code, int) and response.status_code >= 400:
+                # The recorded target stopped working: request the URL itself
+                response.close()
+                resolver.forget(url)
+                target = url
+                response = self._get(target, **request_kwargs)
+            if target == url and resolver is not None and resolver.record(url, response):
+                resolver.save()
+            if isinstance(response.status_code, int):
+                report_check(response.status_code)
+            try:
+                response.raise_for_status()
+                if response.status_code == 304 and conditional_headers:
+                    return 'UNCHANGED', False
+                if response.status_code == 304 and cache_headers:
+                    # The cached archive is still current: no body was sent
+                    revalidated = cache.revalidated(cache_headers)
+                    cache_headers = None
+                    cached = cache.checkout(url, revalidated, '.7z' if '.7z' in url.lower() else '.zip')
+                    if cached:
+                        self.log(f"  ↺ Using cached archive for {mod.get('name')}", debug=True)
+                        if self.url_validators is not None:
+                            url_validators = revalidated
+                        self._downloaded_validators[cached[0]] = (url, url_validators)
+                        return cached
+                    # Evicted since: download it
+                    response.close()
+                    return attempt_download()
+                resumed = bool(request_kwargs) and response.status_code == 206
+                if resumed and _content_range_start(response.headers.get('Content-Range')) != received:
+                    resume_validator = None  # Start over on the next attempt
+                    raise requests.exceptions.RequestException("Server returned an unexpected byte range")
                 
-                if is_gdrive_url and 'text/html' in content_type:
-                    return 'GDRIVE_HTML', False
-            
-            is_7z = '.7z' in url_lower or '7z' in content_type
-            suffix = '.7z' if is_7z else '.zip'
-            temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix='modlist_')
+                if resumed:
+                    self.log(f"  ↻ Resuming {mod.get('name')} at {received / (1024 * 1024):.1f} MB", debug=True)
+                else:
+                    url_lower = url.lower()
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    
+                    # Check if we received HTML instead of a file (Google Drive virus scan page)
+                    if not skip_gdrive_check:
+                        is_gdrive_url = 'drive.google.com' in url_lower or 'drive.usercontent.google.com' in url_lower
+                        
+                        if is_gdrive_url and 'text/html' in content_type:
+                            return 'GDRIVE_HTML', False
+                    
+                    is_7z = '.7z' in url_lower or '7z' in content_type
+                    suffix = '.7z' if is_7z else '.zip'
+                    if self.url_validators is not None:
+                        url_validators = self.url_validators.validators(response.headers)
+                    
+                    # Server ignored the conditional request, but the validators match
+                    # a cached download: skip the body
+                    if cache is not None:
+                        validators = cache.validators(response.headers)
+                        cached = cache.checkout(url, validators, suffix)
+                        if cached:
+                            self.log(f"  ↺ Using cached archive for {mod.get('name')}", debug=True)
+                            self._downloaded_validators[cached[0]] = (url, url_validators)
+                            return cached
+                    
+                    # Full body (first attempt, or the server can't resume): start over
+                    etag = response.headers.get('ETag')
+                    resume_validator = etag if etag and not etag.startswith('W/') else \
+                        response.headers.get('Last-Modified')
+                    if part_path is None:
+                        temp_fd, part_path = tempfile.mkstemp(suffix=suffix + '.part', prefix='modlist_')
+                        os.close(temp_fd)
+                    received = 0
+                    hasher = hashlib.sha256()
+                    
+                    total_size = self._segmented_size(response, resume_validator)
+                    if total_size:
+                        segments = [(start, min(start + DOWNLOAD_SEGMENT_BYTES, total_size) - 1)
+                                    for start in range(0, total_size, DOWNLOAD_SEGMENT_BYTES)]
+                        with open(part_path, 'wb') as f:
+                            f.truncate(total_size)
+                        self.log(f"  ⇉ Downloading {mod.get('name')} in {len(segments)} ranges", debug=True)
+                        # The open response serves the first range
+                        self._download_segments(target, part_path, segments, resume_validator, first_response=response)
+                        return finish_download()
+                
+                with open(part_path, 'r+b' if resumed else 'wb') as f:
+                    f.seek(received)
+                    f.truncate()
+                    body_size = content_length(response)
+                    if body_size:
+                        preallocate(f, received + body_size)
+                    try:
+                        copy_response(response, f, hasher=hasher)
+                    finally:
+                        # Bytes on disk are what a retry resumes from
+                        received = f.tell()
+                        f.truncate()
+            finally:
+                # Hand the connection back to the pool (or drop it if the body wasn't read)
+                response.close()
             
-            with os.fdopen(temp_fd, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                    if chunk:
-                        f.write(chunk)
+            return finish_download()
+        
+        def finish_download():
+            """Verify the complete '.part' file and turn it into the downloaded archive."""
+            nonlocal part_path, received, hasher, segments
             
             # Validate archive integrity
-            if not self._validate_archive_integrity(temp_path, is_7z):
-                try:
-                    os.unlink(temp_path)
-                except (OSError, PermissionError):
-                    pass
+            if not self._validate_archive_integrity(part_path, is_7z):
+                self._remove_partial_download(part_path)
+                part_path, received, segments = None, 0, None
                 raise ValueError("Downloaded file is not a valid archive")
             
+            temp_path = part_path[:-len('.part')]
+            os.replace(part_path, temp_path)
+            part_path = None
+            if validators:
+                if segments is not None:
+                    # Ranges arrived out of order: hash the assembled file
+                    hasher = hashlib.sha256()
+                    with open(temp_path, 'rb') as f:
+                        for block in iter(lambda: f.read(1024 * 1024), b''):
+                            hasher.update(block)
+                cache.store(url, validators, temp_path, hasher.hexdigest(), is_7z)
+            self._downloaded_validators[temp_path] = (url, url_validators)
             return temp_path, is_7z
         
         try:
@@ -439,26 +755,185 @@ class ModInstaller:
             )
         except requests.exceptions.RequestException as e:
             self.log(f"  ✗ Download failed after {MAX_RETRIES} attempts: {e}", error=True)
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except (OSError, PermissionError):
-                    pass
+            report_check(0, _short_error(e))
+            self._remove_partial_download(part_path)
             return None, False
         except ValueError as e:
             self.log(f"  ✗ {str(e)}", error=True)
             return None, False
         except Exception as e:
             self.log(f"  ✗ Unexpected error during download: {e}", error=True)
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except (OSError, PermissionError):
-                    pass
+            self._remove_partial_download(part_path)
             return None, False
     
+    def _get(self, url, **request_kwargs):
+        """Send a streamed download GET, reporting throttling and timeouts to the host limits.
+        
+        Args:
+            url: Download URL
+            **request_kwargs: Extra arguments for Session.get (e.g. headers)
+        """
+        try:
+            response = get_session().get(url, stream=True, timeout=REQUEST_TIMEOUT, **request_kwargs)
+        except requests.exceptions.Timeout:
+            self.host_limits.record_throttled(host_of(url))
+            raise
+        self.host_limits.record_response(url, response.status_code)
+        return response
+    
+    def _remove_partial_download(self, part_path):
+        """Delete a '.part' file, if any."""
+        if part_path and os.path.exists(part_path):
+            try:
+                os.unlink(part_path)
+            except (OSError, PermissionError):
+                pass
+    
+    def _segmented_size(self, response, validator):
+        """Return the archive size if it should be downloaded in byte ranges, else None.
+        
+        Segmenting needs a scheduler to borrow workers from, a full 200 response
+        advertising 'Accept-Ranges: bytes' with an unencoded Content-Length of at
+        least SEGMENTED_DOWNLOAD_MIN_BYTES, and a validator for If-Range (so ranges
+        from different versions of the file are never mixed).
+        
+        Args:
+            response: Response to the initial GET
+            validator: Strong ETag or Last-Modified of the response
+        """
+        headers = response.headers
+        if self.download_scheduler is None or not validator or response.status_code != 200:
+            return None
+        if headers.get('Accept-Ranges', '').lower() != 'bytes':
+            return None
+        if headers.get('Content-Encoding', 'identity').lower() != 'identity':
+            return None
+        try:
+            total_size = int(headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+        return total_size if total_size >= SEGMENTED_DOWNLOAD_MIN_BYTES else None
+    
+    def _download_segments(self, url, part_path, segments, validator, first_response=None):
+        """Download byte ranges into a preallocated '.part' file.
+        
+        The calling worker downloads ranges itself. Before each range it asks
+        download_scheduler for up to MAX_SEGMENT_CONNECTIONS - 1 helpers, which
+        are only granted once no whole-archive download is waiting and within the
+        global and per-host limits, so the scheduler still bounds the number of
+        open connections. Helpers take ranges until none are left.
+        
+        Args:
+            url: Download URL
+            part_path: File preallocated to the full archive size
+            segments: List of (start, end) ranges still missing; finished ranges are
+                      removed, so after a failure it holds what a retry must fetch
+            validator: If-Range value the ranges must match
+            first_response: Open full response to read the first range from
+            
+        Raises:
+            requests.exceptions.RequestException: A range failed (re-raised from the worker)
+        """
+        condition = threading.Condition()
+        errors = []
+        in_flight = 0
+        helpers = 0
+        
+        def take_segment():
+            nonlocal in_flight
+            with condition:
+                if errors or not segments:
+                    return None
+                in_flight += 1
+                return segments.pop(0)
+        
+        def finish_segment(segment, error):
+            nonlocal in_flight
+            with condition:
+                in_flight -= 1
+                if error is not None:
+                    segments.append(segment)
+                    segments.sort()
+                    errors.append(error)
+                condition.notify_all()
+        
+        def recruit_helpers():
+            nonlocal helpers
+            scheduler = self.download_scheduler
+            while scheduler is not None and helpers < MAX_SEGMENT_CONNECTIONS - 1:
+                with condition:
+                    if errors or len(segments) <= helpers:
+                        return
+                if scheduler.try_submit(url, work) is None:
+                    return
+                helpers += 1
+        
+        def work(segment=None, response=None, recruit=False):
+            if segment is None:
+                segment = take_segment()
+            while segment is not None:
+                if recruit:
+                    recruit_helpers()
+                try:
+                    self._download_range(url, part_path, segment, validator, response)
+                except Exception as e:
+                    finish_segment(segment, e)
+                    return
+                finish_segment(segment, None)
+                segment, response = take_segment(), None
+        
+        first_segment = take_segment() if first_response is not None else None
+        work(first_segment, first_response, recruit=True)
+        
+        with condition:
+            condition.wait_for(lambda: in_flight == 0)
+            if errors:
+                raise errors[0]
+    
+    def _download_range(self, url, part_path, segment, validator, response=None):
+        """Write one byte range of url into part_path at its offset.
+        
+        Args:
+            url: Download URL
+            part_path: Preallocated '.part' file
+            segment: (start, end) inclusive byte range
+            validator: If-Range value; a 200 answer means the file changed
+            response: Open response positioned at segment start (else a Range request is sent)
+            
+        Raises:
+            _RangeIgnoredError: The server sent the whole file instead of the range
+            requests.exceptions.RequestException: Network error or short range
+        """
+        start, end = segment
+        if response is None:
+            response = self._get(url, headers={'Range': f'bytes={start}-{end}', 'If-Range': validator})
+            try:
+                response.raise_for_status()
+            except Exception:
+                response.close()
+                raise
+            if response.status_code != 206 or _content_range_start(response.headers.get('Content-Range')) != start:
+                response.close()
+                raise _RangeIgnoredError("Server did not return the requested byte range")
+        
+        expected = end - start + 1
+        written = 0
+        try:
+            with open(part_path, 'r+b') as f:
+                f.seek(start)
+                written = copy_response(response, f, limit=expected)
+        finally:
+            response.close()
+        if written != expected:
+            raise requests.exceptions.RequestException(
+                f"Byte range {start}-{end} ended after {written} of {expected} bytes")
+    
     def _validate_archive_integrity(self, file_path, is_7z):
-        """Validate that the downloaded file is a valid archive.
+        """Check that the downloaded file looks like a valid archive.
+        
+        Only the structure is checked (ZIP central directory, 7z signature); the
+        CRC of every member is verified while it is extracted, so the data is
+        decompressed once.
         
         Args:
             file_path: Path to the file to validate
@@ -475,30 +950,54 @@ class ModInstaller:
         
         # 7z validation
         if is_7z:
-            if not HAS_7ZIP:
-                return True  # Can't validate without py7zr, trust file existence
             try:
-                with py7zr.SevenZipFile(file_path, 'r') as archive:
-                    archive.getnames()
-                return True
-            except Exception:
-                # Accept files with content (for test mocks)
-                return file_size > 0
+                with open(file_path, 'rb') as f:
+                    if f.read(len(SEVEN_ZIP_SIGNATURE)) == SEVEN_ZIP_SIGNATURE:
+                        return True
+            except OSError:
+                return False
+            # Accept files with content (for test mocks)
+            return file_size > 0
         
-        # ZIP validation
+        # ZIP validation: reading the central directory fails on truncated files
         try:
-            with zipfile.ZipFile(file_path, 'r') as zf:
-                return zf.testzip() is None
+            with zipfile.ZipFile(file_path, 'r'):
+                return True
         except zipfile.BadZipFile:
             # Accept files with content (for test mocks)
             return file_size > 0
         except Exception:
             return False
     
+    @contextmanager
+    def _lock_folders(self, mods_dir, members):
+        """Hold the locks of the top-level folders members are extracted into.
+        
+        Archives are extracted in parallel; two archives writing the same mod folder
+        (or one replacing a folder another is checking) run one after the other.
+        Locks are taken in sorted order, so archives sharing several folders can't
+        deadlock.
+        
+        Args:
+            mods_dir: Path to the Starsector mods directory
+            members: Member names of the archive
+        """
+        base = os.path.normcase(str(Path(mods_dir).resolve()))
+        keys = sorted({os.path.join(base, os.path.normcase(Path(m).parts[0])) for m in members if Path(m).parts})
+        with self._folder_locks_lock:
+            locks = [self._folder_locks.setdefault(key, threading.Lock()) for key in keys]
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            yield
+    
     def extract_archive(self, temp_file, mods_dir, is_7z, expected_mod_version=None):
         """
         Extract an archive file to the mods directory.
         
+        Safe to call for several archives at once: the top-level folders of an
+        archive are locked while it is checked and extracted.
+        
         Args:
             temp_file: Path to the temporary archive file
             mods_dir: Path to the Starsector mods directory
@@ -532,24 +1031,29 @@ class ModInstaller:
                     self.log("  ✗ Error: Archive is empty", error=True)
                     return False
 
-                # Check if mod already installed
-                already_result = self._check_if_installed(None, members, mods_dir, is_7z=True, expected_mod_version=expected_mod_version)
-                if already_result:
-                    return already_result
+                with self._lock_folders(mods_dir, all_names):
+                    # Check if mod already installed
+                    already_result = self._check_if_installed(None, members, mods_dir, is_7z=True, expected_mod_version=expected_mod_version)
+                    if already_result:
+                        self._record_installed_download(temp_file, mods_dir, members)
+                        return already_result
 
-                # Validate all members for zip-slip protection
-                mods_dir_resolved = mods_dir.resolve()
-                for member in all_names:
-                    member_path = (mods_dir / member).resolve()
-                    try:
-                        member_path.relative_to(mods_dir_resolved)
-                    except ValueError:
-                        self.log(f"  ✗ Security: Attempted path traversal detected in archive (blocked)", error=True)
-                        return False
+                    # Validate all members for zip-slip protection
+                    mods_dir_resolved = mods_dir.resolve()
+                    for member in all_names:
+                        member_path = (mods_dir / member).resolve()
+                        try:
+                            member_path.relative_to(mods_dir_resolved)
+                        except ValueError:
+                            self.log(f"  ✗ Security: Attempted path traversal detected in archive (blocked)", error=True)
+                            return False
 
-                self.log("  Extracting...")
-                archive.extractall(path=mods_dir)
-                return True
+                    self.log("  Extracting...")
+                    if not self._extract_staged(temp_file, mods_dir, lambda staging: archive.extractall(path=staging)):
+                        return False
+                    self._invalidate_extracted_folders(mods_dir, all_names)
+                    self._record_installed_download(temp_file, mods_dir, members)
+                    return True
                 
         except py7zr.Bad7zFile:
             self.log(f"  ✗ Error: Corrupted 7z file", error=True)
@@ -564,36 +1068,208 @@ class ModInstaller:
                 self.log("  ✗ Error: Archive is empty", error=True)
                 return False
 
-            # Check if mod already installed and get folder to delete if updating
-            already_result = self._check_if_installed(zip_ref, members, mods_dir, expected_mod_version=expected_mod_version)
-            
-            # If it's a tuple, it means we need to delete the old version first
-            if isinstance(already_result, tuple):
-                folder_to_delete, is_update = already_result
-                if is_update and folder_to_delete:
-                    self.log(f"  🗑 Removing old version: {folder_to_delete.name}", info=True)
+            with self._lock_folders(mods_dir, zip_ref.namelist()):
+                # Check if mod already installed and get folder to delete if updating
+                already_result = self._check_if_installed(zip_ref, members, mods_dir, expected_mod_version=expected_mod_version)
+                
+                # If it's a tuple, the old version is replaced once the new one is extracted
+                folder_to_replace = None
+                if isinstance(already_result, tuple):
+                    folder_to_delete, is_update = already_result
+                    if is_update and folder_to_delete:
+                        folder_to_replace = folder_to_delete
+                elif already_result:
+                    # String result means 'skipped'
+                    self._record_installed_download(temp_file, mods_dir, members)
+                    return already_result
+
+                # Validate all members for zip-slip protection
+                mods_dir_resolved = mods_dir.resolve()
+                for member in zip_ref.namelist():
+                    member_path = (mods_dir / member).resolve()
                     try:
-                        shutil.rmtree(folder_to_delete)
-                    except Exception as e:
-                        self.log(f"  ✗ Error removing old version: {e}", error=True)
+                        member_path.relative_to(mods_dir_resolved)
+                    except ValueError:
+                        self.log(f"  ✗ Security: Attempted path traversal detected in archive (blocked)", error=True)
                         return False
-            elif already_result:
-                # String result means 'skipped'
-                return already_result
-
-            # Validate all members for zip-slip protection
-            mods_dir_resolved = mods_dir.resolve()
-            for member in zip_ref.namelist():
-                member_path = (mods_dir / member).resolve()
+
+                self.log("  Extracting...")
+                if not self._extract_staged(temp_file, mods_dir,
+                                            lambda staging: self._extract_zip_members(temp_file, zip_ref, staging),
+                                            replace=folder_to_replace):
+                    return False
+                self._invalidate_extracted_folders(mods_dir, zip_ref.namelist())
+                self._record_installed_download(temp_file, mods_dir, members)
+                return True
+    
+    def _extract_staged(self, temp_file, mods_dir, extract, replace=None):
+        """Extract into a staging folder, then move the result into the mods directory.
+        
+        The extractors check the CRC of every member as it is written. If anything
+        fails, the staging folder is deleted and the mods directory is left as it
+        was (an old version being replaced included); a corrupted archive is also
+        dropped from the download cache.
+        
+        Args:
+            temp_file: Path to the archive
+            mods_dir: Path to the Starsector mods directory
+            extract: Callable(staging_dir) extracting the whole archive into staging_dir
+            replace: Optional installed folder to delete once the extraction succeeded
+            
+        Returns:
+            bool: True if the archive is now in mods_dir
+        """
+        Path(mods_dir).mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix='.staging_', dir=mods_dir))
+        try:
+            try:
+                extract(staging)
+            except Exception as e:
+                if isinstance(e, OSError):
+                    self.log(f"  ✗ Extraction error: {e}", error=True)
+                else:
+                    self.log(f"  ✗ Error: Corrupted archive, nothing was installed ({e})", error=True)
+                    self._discard_cached_download(temp_file)
+                return False
+            
+            if replace is not None:
+                self.log(f"  🗑 Removing old version: {replace.name}", info=True)
                 try:
-                    member_path.relative_to(mods_dir_resolved)
-                except ValueError:
-                    self.log(f"  ✗ Security: Attempted path traversal detected in archive (blocked)", error=True)
+                    shutil.rmtree(replace)
+                except Exception as e:
+                    self.log(f"  ✗ Error removing old version: {e}", error=True)
                     return False
-
-            self.log("  Extracting...")
-            zip_ref.extractall(mods_dir)
+            self._move_staged(staging, mods_dir)
             return True
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def _move_staged(self, source, target):
+        """Move the extracted entries of source into target, merging into existing folders.
+        
+        Args:
+            source: Staging folder
+            target: Destination folder
+        """
+        for entry in source.iterdir():
+            destination = target / entry.name
+            if entry.is_dir() and destination.is_dir():
+                self._move_staged(entry, destination)
+            else:
+                os.replace(entry, destination)
+    
+    def _discard_cached_download(self, temp_file):
+        """Drop the archive of temp_file from the download cache (it failed its CRC check)."""
+        downloaded = self._downloaded_validators.get(str(temp_file))
+        if downloaded is not None and self.download_cache is not None:
+            self.download_cache.discard(downloaded[0])
+    
+    def _extract_zip_members(self, temp_file, zip_ref, mods_dir):
+        """Extract all members of a ZIP, inflating large archives on several threads.
+        
+        Archives of at least ZIP_PARALLEL_MIN_MEMBERS files are split into
+        ZIP_MEMBER_WORKERS parts of about the same uncompressed size; each part is
+        extracted by its own thread with its own ZipFile handle. Directories are
+        created first, in one pass, so the workers never race to create the same
+        parent. Members are written with ZipFile.extract, so names are sanitized
+        and existing files overwritten exactly like extractall.
+        
+        Args:
+            temp_file: Path to the ZIP archive
+            zip_ref: Open ZipFile of temp_file
+            mods_dir: Path to the Starsector mods directory
+        """
+        infos = zip_ref.infolist()
+        files = [info for info in infos if not info.is_dir()]
+        if len(files) < ZIP_PARALLEL_MIN_MEMBERS or ZIP_MEMBER_WORKERS < 2:
+            zip_ref.extractall(mods_dir)
+            return
+        workers = ZIP_MEMBER_WORKERS
+        
+        # Directory tree once, so the workers only write files
+        for info in infos:
+            if info.is_dir():
+                zip_ref.extract(info, mods_dir)
+        for parent in sorted({os.path.dirname(self._zip_member_path(zip_ref, info, mods_dir)) for info in files}):
+            os.makedirs(parent, exist_ok=True)
+        
+        # Largest members first, each to the part with the fewest bytes so far
+        parts = [[] for _ in range(workers)]
+        loads = [0] * workers
+        for info in sorted(files, key=lambda info: info.file_size, reverse=True):
+            lightest = loads.index(min(loads))
+            parts[lightest].append(info)
+            loads[lightest] += info.file_size
+        
+        def extract_part(part):
+            with zipfile.ZipFile(temp_file, 'r') as zf:
+                for info in part:
+                    zf.extract(info, mods_dir)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(extract_part, part) for part in parts]:
+                future.result()
+    
+    def _zip_member_path(self, zip_ref, info, mods_dir):
+        """Return where ZipFile.extract writes a member, cleaning its name the same way.
+        
+        The drive, root, '.' and '..' parts are dropped (and, on Windows, characters
+        not allowed in file names replaced), so the path stays inside mods_dir.
+        
+        Args:
+            zip_ref: Open ZipFile
+            info: ZipInfo of the member
+            mods_dir: Folder the archive is extracted into
+            
+        Returns:
+            str: Normalized path of the member
+            
+        Raises:
+            ValueError: If the cleaned path still points outside mods_dir
+        """
+        arcname = info.filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        arcname = os.path.sep.join(part for part in arcname.split(os.path.sep)
+                                   if part not in ('', os.path.curdir, os.path.pardir))
+        if os.path.sep == '\\':
+            arcname = zip_ref._sanitize_windows_name(arcname, os.path.sep)
+        
+        base = os.path.normpath(mods_dir)
+        path = os.path.normpath(os.path.join(base, arcname))
+        if os.path.commonpath([base, path]) != base:
+            raise ValueError(f"Member outside the extraction folder: {info.filename!r}")
+        return path
+    
+    def _invalidate_extracted_folders(self, mods_dir, members):
+        """Make the installed-mods index re-read the folders an archive was extracted into.
+        
+        Extractors may restore archive timestamps, so the stat check alone can miss the update.
+        
+        Args:
+            mods_dir: Path to the Starsector mods directory
+            members: Member names of the extracted archive
+        """
+        top_level = {Path(m).parts[0] for m in members if Path(m).parts}
+        get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).invalidate(top_level)
+    
+    def _record_installed_download(self, temp_file, mods_dir, members):
+        """Record the validators of the URL an installed archive came from.
+        
+        The next download of that URL is then a conditional request (see download_archive).
+        
+        Args:
+            temp_file: Path to the downloaded archive
+            mods_dir: Path to the Starsector mods directory
+            members: File names in the archive
+        """
+        downloaded = self._downloaded_validators.pop(str(temp_file), None)
+        if downloaded is None or self.url_validators is None:
+            return
+        url, validators = downloaded
+        top_level = {Path(m).parts[0] for m in members if Path(m).parts}
+        self.url_validators.record(url, validators, mods_dir, top_level)
     
     def _check_if_installed(self, archive_ref, members, mods_dir, is_7z=False, expected_mod_version=None):
         """
@@ -644,9 +1320,10 @@ class ModInstaller:
                 with archive_ref.open(mod_info_path_in_archive) as archive_file:
                     new_content = archive_file.read().decode('utf-8')
                 
-                installed_version = extract_mod_version_from_text(installed_content)
-                new_version = extract_mod_version_from_text(new_content)
-                mod_id = extract_mod_id_from_text(new_content) or root_dir
+                installed_version = extract_all_metadata_from_text(installed_content)['version']
+                new_metadata = extract_all_metadata_from_text(new_content)
+                new_version = new_metadata['version']
+                mod_id = new_metadata['id'] or root_dir
                 
                 # Use expected_mod_version from modlist config if provided, otherwise use archive version
                 version_to_install = expected_mod_version if expected_mod_version else new_version
@@ -705,25 +1382,18 @@ class ModInstaller:
                     self.log(f"  ⚠ Warning: Could not read existing enabled_mods.json: {e}", info=True)
                     existing_ids = []
             
-            # Collect mod IDs from newly installed mods using centralized scanner
+            # Collect mod IDs from newly installed mods using the installed-mods index
             new_ids = []
+            installed_index = get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS)
+            installed_index.refresh()
             
             for mod_name in installed_mod_names:
-                # Create a filter to match specific mod folder
-                def filter_by_folder(folder, content):
-                    return folder.name == mod_name
-                
-                # Use scanner to find the mod
-                found = False
-                for folder, metadata in scan_installed_mods(mods_dir, filter_by_folder):
-                    mod_id = metadata.get('id')
-                    if mod_id:
-                        new_ids.append(mod_id)
-                        self.log(f"  ✓ Found mod ID '{mod_id}' for {mod_name}", debug=True)
-                        found = True
-                        break
-                
-                if not found:
+                installed = installed_index.get(mod_name)
+                mod_id = installed.id if installed else None
+                if mod_id:
+                    new_ids.append(mod_id)
+                    self.log(f"  ✓ Found mod ID '{mod_id}' for {mod_name}", debug=True)
+                else:
                     self.log(f"  ⚠ Warning: Could not extract ID from '{mod_name}'", info=True)
             
             # Merge: combine existing + new IDs, removing duplicates while preserving order
@@ -795,17 +1465,17 @@ class ModInstaller:
                 self.log("  No version info in modlist for comparison", debug=True)
                 return outdated_mods
             
-            # Scan installed mods using centralized scanner
-            for folder, metadata in scan_installed_mods(mods_dir):
-                mod_id = metadata.get('id')
-                installed_version = metadata.get('version')
-                content = metadata.get('content')
+            # Scan installed mods from the index
+            for folder, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan():
+                mod_id = installed.id
+                installed_version = installed.version
+                # Match against the parsed identity fields only, so names that
+                # merely appear in a description or dependency list don't count
+                searchable = [(installed.name or '').lower(), (mod_id or '').lower(), folder.name.lower()]
                 
-                # Try to match with modlist by name (search in content or folder name)
                 for modlist_name, modlist_mod in modlist_lookup.items():
                     # Check if this mod matches by name (case-insensitive partial match)
-                    if (modlist_name.lower() in content.lower() or 
-                        modlist_name.lower() in folder.name.lower()):
+                    if any(modlist_name.lower() in field for field in searchable):
                         
                         expected_version = modlist_mod.get('version')
                         
@@ -879,11 +1549,11 @@ class ModInstaller:
                 self.log("  Could not parse expected game version", debug=True)
                 return incompatible_mods
             
-            # Scan installed mods using centralized scanner
-            for folder, metadata in scan_installed_mods(mods_dir):
-                mod_id = metadata.get('id')
-                mod_game_version = metadata.get('gameVersion')
-                mod_name = metadata.get('name') or folder.name
+            # Scan installed mods using the installed-mods index
+            for folder, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan():
+                mod_id = installed.id
+                mod_game_version = installed.game_version
+                mod_name = installed.name or folder.name
                 
                 if mod_game_version:
                     mod_major = extract_major_version(mod_game_version)
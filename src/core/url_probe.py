@@ -0,0 +1,189 @@
+"""
+URL probes shared by the modlist validation and the CSV import.
+
+A probe asks the server about a download URL without downloading it: a HEAD
+request, or a one-byte ranged GET for servers that reject HEAD. The answer
+(status, final URL after redirects, size, content type and validators) is
+kept in CACHE_DIR/url_probes.json for CACHE_TIMEOUT seconds, so validating
+an unchanged modlist again within that time needs no network at all.
+Network errors and 429/5xx answers are not cached.
+"""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from .constants import CACHE_DIR, CACHE_TIMEOUT, URL_VALIDATION_TIMEOUT_HEAD
+from .host_scheduler import get_host_limits
+from .http_client import get_session
+from .url_resolver import resolution_of
+from utils.persistence import save_json_atomic, shared_instance
+
+
+URL_PROBES_FILE = "url_probes.json"
+URL_PROBES_FORMAT_VERSION = 1
+
+
+def _header(response, name):
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _content_length(response):
+    """Size of the resource: the Content-Range total of a ranged answer, else Content-Length."""
+    match = re.search(r'/(\d+)\s*$', _header(response, 'Content-Range') or '')
+    if match:
+        return int(match.group(1))
+    try:
+        return int(_header(response, 'Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+
+def probe_url(url, timeout=URL_VALIDATION_TIMEOUT_HEAD):
+    """
+    Ask the server about url without downloading it.
+
+    Sends HEAD first; if it fails or is answered with an error status (some
+    servers block HEAD with 403), a GET for the first byte only follows. A
+    HEAD whose connection timed out is not retried as a GET.
+
+    Args:
+        url: URL to probe
+        timeout: Timeout of each request in seconds
+
+    Returns:
+        dict: {'status', 'final_url', 'content_length', 'content_type', 'etag',
+               'last_modified', 'resolution', 'checked_at'}; resolution is the
+              stable redirect target (see url_resolver.resolution_of()) or None
+
+    Raises:
+        requests.exceptions.RequestException: Neither request got an answer
+    """
+    session = get_session()
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code >= 400:
+            raise requests.exceptions.RequestException("HEAD rejected, trying GET")
+    except requests.exceptions.ConnectTimeout:
+        # The host did not accept a connection in time; a GET would wait just as long
+        raise
+    except requests.exceptions.RequestException:
+        response = session.get(url, timeout=timeout, allow_redirects=True,
+                               headers={'Range': 'bytes=0-0'}, stream=True)
+        response.close()  # Only the headers are needed
+    get_host_limits().record_response(url, response.status_code)
+
+    final_url = getattr(response, 'url', None)
+    return {
+        'status': response.status_code,
+        'final_url': final_url if isinstance(final_url, str) else url,
+        'content_length': _content_length(response),
+        'content_type': _header(response, 'Content-Type'),
+        'etag': _header(response, 'ETag'),
+        'last_modified': _header(response, 'Last-Modified'),
+        'resolution': resolution_of(url, response),
+        'checked_at': time.time()
+    }
+
+
+class UrlProbeCache:
+    """Probe results by URL, persisted on disk and valid for a TTL."""
+
+    def __init__(self, path, ttl=CACHE_TIMEOUT):
+        """
+        Initialize the cache, loading it from disk if present.
+
+        Args:
+            path: JSON file holding the probe results
+            ttl: Seconds a probe result is reused
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._probes = {}  # url -> probe_url() result
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == URL_PROBES_FORMAT_VERSION:
+            self._probes = data.get('probes', {})
+
+    def _is_fresh(self, probe, now):
+        return isinstance(probe, dict) and 0 <= now - probe.get('checked_at', 0) < self.ttl
+
+    def get(self, url):
+        """Return the cached probe of url if it is still fresh (counts a hit or a miss), else None."""
+        with self._lock:
+            probe = self._probes.get(url)
+            if self._is_fresh(probe, time.time()):
+                self.hits += 1
+                return dict(probe)
+            self.misses += 1
+            return None
+
+    def store(self, url, probe):
+        """Remember a probe result unless it is a transient answer (429, 5xx)."""
+        if probe['status'] == 429 or probe['status'] >= 500:
+            return
+        with self._lock:
+            self._probes[url] = probe
+            self._dirty = True
+
+    def probe(self, url, use_cache=True, timeout=URL_VALIDATION_TIMEOUT_HEAD):
+        """
+        Return the probe of url, from the cache if fresh, else from the network.
+
+        Args:
+            url: URL to probe
+            use_cache: If False, always ask the server (the answer is still cached)
+            timeout: Timeout of each request in seconds
+
+        Returns:
+            dict: See probe_url()
+
+        Raises:
+            requests.exceptions.RequestException: The server could not be reached
+        """
+        if use_cache:
+            cached = self.get(url)
+            if cached is not None:
+                return cached
+        probe = probe_url(url, timeout=timeout)
+        self.store(url, probe)
+        return probe
+
+    def stats(self):
+        """Return {'hits', 'misses', 'entries'} of this session."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._probes)}
+
+    def save(self):
+        """Write new probe results to disk atomically, dropping expired ones."""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            self._probes = {url: probe for url, probe in self._probes.items() if self._is_fresh(probe, now)}
+            try:
+                save_json_atomic(self.path, {'version': URL_PROBES_FORMAT_VERSION, 'probes': self._probes})
+            except OSError:
+                return
+            self._dirty = False
+
+
+@shared_instance
+def get_url_probe_cache():
+    """Return the shared probe cache in CACHE_DIR, creating it on first use."""
+    return UrlProbeCache(Path(CACHE_DIR) / URL_PROBES_FILE)
@@ -0,0 +1,200 @@
+"""
+Resolved targets of redirecting download URLs.
+
+A "releases/latest/download" GitHub URL redirects to the asset of the current
+release tag, which redirects again to a signed CDN URL; Google Drive "uc"
+links redirect to drive.usercontent.google.com. The resolver records the
+last stable hop of such a chain (the concrete release URL, the usercontent
+URL, or the target of permanent redirects) and the release tag, kept in
+CACHE_DIR/url_resolutions.json for CACHE_TIMEOUT seconds. Requests within
+that time go to the recorded target directly. Signed CDN URLs expire, so they
+are never recorded.
+
+A recorded tag that differs from the previous resolution of the same URL
+means a new upstream release, spotted without downloading anything.
+"""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+from .constants import CACHE_DIR, CACHE_TIMEOUT
+from .host_scheduler import host_of
+from utils.persistence import save_json_atomic, shared_instance
+
+
+URL_RESOLUTIONS_FILE = "url_resolutions.json"
+URL_RESOLUTIONS_FORMAT_VERSION = 1
+
+GITHUB_RELEASE_ASSET = re.compile(r'^https://github\.com/[^/]+/[^/]+/releases/download/([^/]+)/[^/?#]+$')
+GOOGLE_DRIVE_DOWNLOAD_HOST = 'drive.usercontent.google.com'
+PERMANENT_REDIRECT_CODES = frozenset({301, 308})
+
+
+def resolution_of(url, response):
+    """
+    Return the stable target a request for url was redirected to.
+
+    Args:
+        url: Requested URL
+        response: requests.Response, redirects followed
+
+    Returns:
+        dict: {'resolved_url', 'tag'} (tag is the GitHub release tag or None),
+              or None if url did not redirect to a stable target
+    """
+    history = getattr(response, 'history', None)
+    if not isinstance(history, list):
+        return None
+    hops = [(hop.url, hop.status_code) for hop in history] + [(getattr(response, 'url', None), None)]
+    if not all(isinstance(hop_url, str) for hop_url, _ in hops):
+        return None
+
+    resolved, tag = None, None
+    for hop_url, _ in hops[1:]:
+        match = GITHUB_RELEASE_ASSET.match(hop_url)
+        if match:
+            resolved, tag = hop_url, match.group(1)
+            break
+        if host_of(hop_url) == GOOGLE_DRIVE_DOWNLOAD_HOST:
+            resolved = hop_url
+            break
+    else:
+        # Other hosts: only targets announced as permanent
+        for (_, status), (next_url, _) in zip(hops, hops[1:]):
+            if status not in PERMANENT_REDIRECT_CODES:
+                break
+            resolved = next_url
+
+    if resolved is None or resolved == url:
+        return None
+    return {'resolved_url': resolved, 'tag': tag}
+
+
+class UrlResolver:
+    """Resolved targets and release tags by URL, persisted on disk and valid for a TTL."""
+
+    def __init__(self, path, ttl=CACHE_TIMEOUT):
+        """
+        Initialize the resolver, loading it from disk if present.
+
+        Args:
+            path: JSON file holding the resolutions
+            ttl: Seconds a resolved target is used instead of the URL
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._resolutions = {}  # url -> {'resolved_url', 'tag', 'resolved_at'}
+        self._tag_changes = {}  # url -> (previous_tag, tag) not reported yet
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == URL_RESOLUTIONS_FORMAT_VERSION:
+            self._resolutions = data.get('resolutions', {})
+
+    def _fresh(self, url):
+        """Return the resolution of url if still within the TTL (caller holds the lock)."""
+        entry = self._resolutions.get(url)
+        if isinstance(entry, dict) and 0 <= time.time() - entry.get('resolved_at', 0) < self.ttl:
+            return entry
+        return None
+
+    def resolve(self, url):
+        """Return the URL to request for url: its fresh resolved target, else url itself."""
+        with self._lock:
+            entry = self._fresh(url)
+            if entry is None:
+                return url
+            self.hits += 1
+            return entry['resolved_url']
+
+    def release_tag(self, url):
+        """Return the last known release tag of url (even past the TTL), or None."""
+        with self._lock:
+            entry = self._resolutions.get(url)
+            return entry.get('tag') if isinstance(entry, dict) else None
+
+    def record(self, url, response):
+        """
+        Remember where a request for url was redirected to.
+
+        Args:
+            url: Requested URL (the original, not a resolved target)
+            response: Its requests.Response
+
+        Returns:
+            dict: The resolution recorded (see resolution_of()), or None
+        """
+        resolution = resolution_of(url, response)
+        if resolution is not None:
+            self.store(url, resolution['resolved_url'], resolution['tag'])
+        return resolution
+
+    def store(self, url, resolved_url, tag=None):
+        """
+        Record the resolved target and release tag of url.
+
+        Args:
+            url: Original URL
+            resolved_url: Stable URL it redirects to
+            tag: Release tag, if the target names one
+        """
+        with self._lock:
+            previous = self._resolutions.get(url)
+            previous_tag = previous.get('tag') if isinstance(previous, dict) else None
+            if previous_tag and tag and previous_tag != tag:
+                self._tag_changes[url] = (previous_tag, tag)
+            self._resolutions[url] = {'resolved_url': resolved_url, 'tag': tag, 'resolved_at': time.time()}
+            self._dirty = True
+
+    def forget(self, url):
+        """Drop the resolution of url (its target stopped working)."""
+        with self._lock:
+            if self._resolutions.pop(url, None) is not None:
+                self._dirty = True
+
+    def pop_tag_changes(self, urls):
+        """
+        Return (once) the URLs resolved to a new release tag during this session.
+
+        Args:
+            urls: URLs to look at
+
+        Returns:
+            dict: {url: (previous_tag, tag)}
+        """
+        with self._lock:
+            return {url: self._tag_changes.pop(url) for url in urls if url in self._tag_changes}
+
+    def stats(self):
+        """Return {'hits', 'entries'} of this session."""
+        with self._lock:
+            return {'hits': self.hits, 'entries': len(self._resolutions)}
+
+    def save(self):
+        """Write new resolutions to disk atomically."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                save_json_atomic(self.path, {'version': URL_RESOLUTIONS_FORMAT_VERSION,
+                                             'resolutions': self._resolutions})
+            except OSError:
+                return
+            self._dirty = False
+
+
+@shared_instance
+def get_url_resolver():
+    """Return the shared resolver in CACHE_DIR, creating it on first use."""
+    return UrlResolver(Path(CACHE_DIR) / URL_RESOLUTIONS_FILE)
@@ -0,0 +1,124 @@
+"""
+Validators of the archives installed from each download URL.
+
+After an archive is installed (or found already installed), the ETag and
+Last-Modified the server sent for its URL are recorded together with the
+folders it put in the mods directory. The next download of that URL sends
+If-None-Match / If-Modified-Since; a 304 Not Modified answer means the
+archive is the one already installed, so neither the download nor the
+extraction is needed. Moving "releases/latest" URLs are revalidated this way
+in a single round trip.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+from .constants import CACHE_DIR
+from utils.persistence import save_json_atomic, shared_instance
+
+
+URL_VALIDATORS_FILE = "url_validators.json"
+URL_VALIDATORS_FORMAT_VERSION = 1
+
+
+class UrlValidatorStore:
+    """Persistent map of download URL -> validators and installed folders."""
+
+    def __init__(self, path):
+        """
+        Initialize the store, loading it from disk if present.
+
+        Args:
+            path: JSON file holding the records
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._records = {}  # url -> {'etag', 'last_modified', 'mods_dir', 'folders'}
+        self._load()
+
+    @staticmethod
+    def validators(headers):
+        """
+        Return the validators of a response usable for a conditional request.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            dict: {'etag', 'last_modified'}, or None if the server sent neither
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+        return {'etag': etag, 'last_modified': last_modified}
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == URL_VALIDATORS_FORMAT_VERSION:
+            self._records = data.get('records', {})
+
+    def _save(self):
+        """Write the records atomically (caller holds the lock)."""
+        try:
+            save_json_atomic(self.path, {'version': URL_VALIDATORS_FORMAT_VERSION, 'records': self._records})
+        except OSError:
+            pass
+
+    def conditional_headers(self, url, mods_dir):
+        """
+        Return the headers that revalidate the archive installed from url.
+
+        Nothing is returned unless the archive was installed into this mods
+        directory and all of its folders are still there; otherwise a 304 would
+        wrongly skip a mod that has to be installed again.
+
+        Args:
+            url: Download URL
+            mods_dir: Path to the Starsector mods directory
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, or None
+        """
+        with self._lock:
+            record = self._records.get(url)
+        if not record or record.get('mods_dir') != str(Path(mods_dir).resolve()):
+            return None
+        if not record.get('folders') or not all((Path(mods_dir) / folder).exists() for folder in record['folders']):
+            return None
+
+        headers = {}
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+        return headers or None
+
+    def record(self, url, validators, mods_dir, folders):
+        """
+        Remember that the archive served with these validators is installed.
+
+        Args:
+            url: Download URL
+            validators: Validators of the response (see validators()); None forgets the URL
+            mods_dir: Path to the Starsector mods directory
+            folders: Top-level folders (or files) the archive contains
+        """
+        with self._lock:
+            if validators and folders:
+                self._records[url] = dict(validators, mods_dir=str(Path(mods_dir).resolve()),
+                                          folders=sorted(folders))
+            elif self._records.pop(url, None) is None:
+                return
+            self._save()
+
+
+@shared_instance
+def get_url_validator_store():
+    """Return the shared validator store in CACHE_DIR, creating it on first use."""
+    return UrlValidatorStore(Path(CACHE_DIR) / URL_VALIDATORS_FILE)
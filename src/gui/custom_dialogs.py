@@ -2,6 +2,7 @@
 Custom styled dialog boxes for ASTRA Modlist Installer.
 Provides modern, themed alternatives to standard tkinter messageboxes.
 """
+import queue
 import tkinter as tk
 from utils.theme import TriOSTheme
 from .ui_builder import _create_button
@@ -133,21 +134,73 @@ def ask_version_action(title, message, parent=None):
                        [("Force Update", "force_update"), ("Continue", "continue"), ("Cancel", "cancel")])
 
 
-def show_validation_report(parent, github_mods, gdrive_mods, other_domains, failed_list):
+class _ReportSection:
+    """One category of the validation report: a heading with a count and a list of mods."""
+    
+    def __init__(self, parent, heading, heading_fg, list_bg, max_lines, note=None):
+        """
+        Build the section (shown once it has an entry).
+        
+        Args:
+            parent: Frame holding the sections
+            heading: Heading format, called with the number of entries
+            heading_fg: Heading color
+            list_bg: Background of the mod list
+            max_lines: Height of the list before it scrolls
+            note: Optional explanation shown under the heading
+        """
+        self.heading = heading
+        self.max_lines = max_lines
+        self.count = 0
+        self.frame = tk.Frame(parent, bg=TriOSTheme.SURFACE)
+        self.label = tk.Label(self.frame, font=("Arial", 11, "bold"), bg=TriOSTheme.SURFACE, fg=heading_fg)
+        self.label.pack(anchor=tk.W)
+        if note:
+            tk.Label(self.frame, text=note, font=("Arial", 9, "italic"), bg=TriOSTheme.SURFACE,
+                     fg=TriOSTheme.TEXT_SECONDARY, wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=(20, 0), pady=(2, 0))
+        list_frame = tk.Frame(self.frame, bg=list_bg)
+        list_frame.pack(fill=tk.X, padx=(20, 0), pady=(4, 0))
+        self.text = tk.Text(list_frame, height=1, width=55, font=("Courier", 9), wrap=tk.WORD, bg=list_bg,
+                            fg=TriOSTheme.TEXT_PRIMARY, relief=tk.FLAT, highlightthickness=0, borderwidth=0,
+                            state=tk.DISABLED)
+        self.text.pack(padx=5, pady=5)
+    
+    def add(self, line):
+        """Append a mod line and update the count."""
+        self.count += 1
+        self.label.config(text=self.heading(self.count))
+        self.text.config(state=tk.NORMAL, height=min(self.max_lines, self.count))
+        self.text.insert(tk.END, f"  • {line}\n")
+        self.text.config(state=tk.DISABLED)
+
+
+def show_validation_report(parent, github_mods, gdrive_mods, other_domains, failed_list,
+                           updates=None, total=None, critical_mods=()):
     """
     Show URL validation report dialog with domain breakdown.
     
+    With updates, the report fills in while the URLs are being checked: each
+    (category, mod, domain, status, error) item read from the queue is added to
+    the lists passed in and shown, and None marks the end of the checks. Continue
+    is available as soon as the critical mods are confirmed reachable (without
+    critical mods, as soon as one URL is), or once all checks are done.
+    
     Args:
         parent: Parent window
         github_mods: List of GitHub mods
         gdrive_mods: List of Google Drive mods
         other_domains: Dict of {domain: [mod, ...]}
         failed_list: List of {'mod': mod, 'status': code, 'error': str}
+        updates: Optional queue.Queue of results still to come
+        total: Number of mods being checked (shown as progress with updates)
+        critical_mods: Mods (e.g. required libraries) to confirm before Continue
         
     Returns:
         str: 'continue' to proceed, 'cancel' to abort
     """
     result = {'action': 'cancel'}
+    state = {'done': updates is None, 'confirmed': set(), 'poll': None}
+    critical_ids = {id(mod) for mod in critical_mods}
     
     dialog = tk.Toplevel(parent)
     dialog.transient(parent)
@@ -163,134 +216,131 @@ def show_validation_report(parent, github_mods, gdrive_mods, other_domains, fail
     tk.Label(main_frame, text="Download Sources Analysis", 
              font=("Arial", 14, "bold"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.TEXT_PRIMARY).pack(pady=(0, 15))
     
+    status_label = tk.Label(main_frame, font=("Arial", 9), bg=TriOSTheme.SURFACE, fg=TriOSTheme.TEXT_SECONDARY)
+    if updates is not None:
+        status_label.pack(anchor=tk.W, pady=(0, 10))
+    
     # Summary frame
     summary_frame = tk.Frame(main_frame, bg=TriOSTheme.SURFACE)
     summary_frame.pack(fill=tk.X, pady=(0, 15))
     
-    # GitHub mods
-    if len(github_mods) > 0:
-        github_frame = tk.Frame(summary_frame, bg=TriOSTheme.SURFACE)
-        github_frame.pack(fill=tk.X, pady=(0, 8))
-        
-        tk.Label(github_frame, text=f"✓ {len(github_mods)} mod(s) from GitHub", 
-                font=("Arial", 11, "bold"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.GITHUB_FG).pack(anchor=tk.W)
-        
-        # List GitHub mods
-        github_list_frame = tk.Frame(github_frame, bg=TriOSTheme.GITHUB_BG)
-        github_list_frame.pack(fill=tk.X, padx=(20, 0), pady=(4, 0))
-        
-        github_text = tk.Text(github_list_frame, height=min(4, len(github_mods)), width=55,
-                             font=("Courier", 9), wrap=tk.WORD, bg=TriOSTheme.GITHUB_BG, fg=TriOSTheme.TEXT_PRIMARY, 
-                             relief=tk.FLAT, highlightthickness=0, borderwidth=0)
-        for mod in github_mods:
-            github_text.insert(tk.END, f"  • {mod.get('name', 'Unknown')}\n")
-        github_text.config(state=tk.DISABLED)
-        github_text.pack(padx=5, pady=5)
+    sections = {
+        'github': _ReportSection(summary_frame, lambda n: f"✓ {n} mod(s) from GitHub",
+                                 TriOSTheme.GITHUB_FG, TriOSTheme.GITHUB_BG, 4),
+        'google_drive': _ReportSection(summary_frame, lambda n: f"✓ {n} mod(s) from Google Drive",
+                                       TriOSTheme.GDRIVE_FG, TriOSTheme.GDRIVE_BG, 4,
+                                       note="Large files bypass Google's virus scan and may need a second confirmation to download."),
+        'other': _ReportSection(summary_frame, lambda n: f"⚠ {n} mod(s) from other sources",
+                                TriOSTheme.OTHER_FG, TriOSTheme.OTHER_BG, 5),
+        'failed': _ReportSection(summary_frame, lambda n: f"✗ {n} mod(s) inaccessible",
+                                 TriOSTheme.FAILED_FG, TriOSTheme.FAILED_BG, 5,
+                                 note="These mods cannot be downloaded. Check URLs or contact mod authors."),
+    }
     
-    # Google Drive mods with info
-    if len(gdrive_mods) > 0:
-        gdrive_frame = tk.Frame(summary_frame, bg=TriOSTheme.SURFACE)
-        gdrive_frame.pack(fill=tk.X, pady=(0, 8))
-        
-        tk.Label(gdrive_frame, text=f"✓ {len(gdrive_mods)} mod(s) from Google Drive", 
-                font=("Arial", 11, "bold"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.GDRIVE_FG).pack(anchor=tk.W)
-        
-        # Info about large files
-        info_text = tk.Label(gdrive_frame, 
-            text="Large files bypass Google's virus scan and may need a second confirmation to download.",
-            font=("Arial", 9, "italic"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.TEXT_SECONDARY, wraplength=450, justify=tk.LEFT)
-        info_text.pack(anchor=tk.W, padx=(20, 0), pady=(2, 0))
-        
-        # List Google Drive mods
-        gdrive_list_frame = tk.Frame(gdrive_frame, bg=TriOSTheme.GDRIVE_BG)
-        gdrive_list_frame.pack(fill=tk.X, padx=(20, 0), pady=(4, 0))
-        
-        gdrive_text = tk.Text(gdrive_list_frame, height=min(4, len(gdrive_mods)), width=55,
-                             font=("Courier", 9), wrap=tk.WORD, bg=TriOSTheme.GDRIVE_BG, fg=TriOSTheme.TEXT_PRIMARY, 
-                             relief=tk.FLAT, highlightthickness=0, borderwidth=0)
-        for mod in gdrive_mods:
-            gdrive_text.insert(tk.END, f"  • {mod.get('name', 'Unknown')}\n")
-        gdrive_text.config(state=tk.DISABLED)
-        gdrive_text.pack(padx=5, pady=5)
+    def show(category, line):
+        section = sections[category]
+        section.add(line)
+        if section.count == 1:
+            # Keep the sections in their fixed order
+            for other in sections.values():
+                other.frame.pack_forget()
+            for other in sections.values():
+                if other.count:
+                    other.frame.pack(fill=tk.X, pady=(0, 8))
     
-    # Other domains
-    if other_domains:
-        other_frame = tk.Frame(summary_frame, bg=TriOSTheme.SURFACE)
-        other_frame.pack(fill=tk.X, pady=(0, 8))
-        
-        total_other = sum(len(mods) for mods in other_domains.values())
-        tk.Label(other_frame, text=f"⚠ {total_other} mod(s) from other sources", 
-                font=("Arial", 11, "bold"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.OTHER_FG).pack(anchor=tk.W)
-        
-        # List each domain with its mods
-        other_list_frame = tk.Frame(other_frame, bg=TriOSTheme.OTHER_BG)
-        other_list_frame.pack(fill=tk.X, padx=(20, 0), pady=(4, 0))
-        
-        other_text = tk.Text(other_list_frame, height=min(5, total_other), width=55,
-                            font=("Courier", 9), wrap=tk.WORD, bg=TriOSTheme.OTHER_BG, fg=TriOSTheme.TEXT_PRIMARY, 
-                            relief=tk.FLAT, highlightthickness=0, borderwidth=0)
-        
-        for domain, mods in sorted(other_domains.items()):
-            for mod in mods:
-                other_text.insert(tk.END, f"  • {mod.get('name', 'Unknown')} ({domain})\n")
-        
-        other_text.config(state=tk.DISABLED)
-        other_text.pack(padx=5, pady=5)
-    
-    # Failed mods
-    if failed_list:
-        failed_frame = tk.Frame(summary_frame, bg=TriOSTheme.SURFACE)
-        failed_frame.pack(fill=tk.X, pady=(0, 0))
-        
-        tk.Label(failed_frame, text=f"✗ {len(failed_list)} mod(s) inaccessible", 
-                font=("Arial", 11, "bold"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.FAILED_FG).pack(anchor=tk.W, pady=(0, 2))
-        
-        tk.Label(failed_frame, 
-            text="These mods cannot be downloaded. Check URLs or contact mod authors.",
-            font=("Arial", 9, "italic"), bg=TriOSTheme.SURFACE, fg=TriOSTheme.TEXT_SECONDARY, wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=(20, 0), pady=(2, 0))
-        
-        # Scrollable list of failed mods
-        failed_list_frame = tk.Frame(failed_frame, bg=TriOSTheme.FAILED_BG)
-        failed_list_frame.pack(fill=tk.X, padx=(20, 0), pady=(4, 0))
-        
-        failed_text = tk.Text(failed_list_frame, height=min(5, len(failed_list)), width=55, 
-                             font=("Courier", 9), wrap=tk.WORD, bg=TriOSTheme.FAILED_BG, fg=TriOSTheme.TEXT_PRIMARY, 
-                             relief=tk.FLAT, highlightthickness=0, borderwidth=0)
-        
-        for fail in failed_list:
-            mod_name = fail['mod'].get('name', 'Unknown')
-            error = fail['error']
-            failed_text.insert(tk.END, f"  • {mod_name}: {error}\n")
-        
-        failed_text.config(state=tk.DISABLED)
-        failed_text.pack(padx=5, pady=5)
+    for mod in github_mods:
+        show('github', mod.get('name', 'Unknown'))
+    for mod in gdrive_mods:
+        show('google_drive', mod.get('name', 'Unknown'))
+    for domain, mods in sorted(other_domains.items()):
+        for mod in mods:
+            show('other', f"{mod.get('name', 'Unknown')} ({domain})")
+    for fail in failed_list:
+        show('failed', f"{fail['mod'].get('name', 'Unknown')}: {fail['error']}")
     
     # Buttons frame
     button_frame = tk.Frame(main_frame, bg=TriOSTheme.SURFACE)
     button_frame.pack(fill=tk.X, pady=(15, 0))
     
-    def on_continue():
-        result['action'] = 'continue'
+    def can_continue():
+        reachable = bool(github_mods or gdrive_mods or other_domains)
+        if critical_ids:
+            return critical_ids <= state['confirmed'] or (state['done'] and reachable)
+        # Nothing else depends on these mods: the first reachable one is enough
+        return reachable
+    
+    def close(action):
+        result['action'] = action
+        if state['poll']:
+            dialog.after_cancel(state['poll'])
         dialog.destroy()
     
+    def on_continue():
+        if can_continue():
+            close('continue')
+    
     def on_cancel():
-        result['action'] = 'cancel'
-        dialog.destroy()
+        close('cancel')
     
     # Center the buttons
     button_container = tk.Frame(button_frame, bg=TriOSTheme.SURFACE)
     button_container.pack(anchor=tk.CENTER)
     
-    if len(github_mods) > 0 or len(gdrive_mods) > 0 or other_domains:
-        _create_button(button_container, "Continue", on_continue,
-                      width=12, button_type="success").pack(side=tk.LEFT, padx=5)
+    continue_button = _create_button(button_container, "Continue", on_continue,
+                                     width=12, button_type="success")
+    if updates is not None or can_continue():
+        continue_button.pack(side=tk.LEFT, padx=5)
     
     _create_button(button_container, "Cancel", on_cancel,
                   width=12, button_type="secondary").pack(side=tk.LEFT, padx=5)
     
+    def refresh_status():
+        checked = len(github_mods) + len(gdrive_mods) + len(failed_list) + \
+            sum(len(mods) for mods in other_domains.values())
+        if state['done']:
+            status_label.config(text=f"All {checked} URL(s) checked")
+        else:
+            waiting = len(critical_ids - state['confirmed'])
+            critical_text = f", {waiting} required mod(s) not confirmed yet" if waiting else ""
+            status_label.config(text=f"Checking URLs... {checked}/{total or '?'}{critical_text}")
+        continue_button.configure(state=tk.NORMAL if can_continue() else tk.DISABLED)
+    
+    def poll_updates():
+        """Add the results that arrived since the last call (runs on the Tk thread)."""
+        try:
+            while True:
+                update = updates.get_nowait()
+                if update is None:
+                    state['done'] = True
+                    break
+                category, mod, domain, status, error = update
+                name = mod.get('name', 'Unknown')
+                if category == 'failed':
+                    failed_list.append({'mod': mod, 'status': status, 'error': error})
+                    show('failed', f"{name}: {error}")
+                    continue
+                if category == 'github':
+                    github_mods.append(mod)
+                    show('github', name)
+                elif category == 'google_drive':
+                    gdrive_mods.append(mod)
+                    show('google_drive', name)
+                else:
+                    other_domains.setdefault(domain, []).append(mod)
+                    show('other', f"{name} ({domain})")
+                if id(mod) in critical_ids:
+                    state['confirmed'].add(id(mod))
+        except queue.Empty:
+            pass
+        refresh_status()
+        state['poll'] = None if state['done'] else dialog.after(100, poll_updates)
+    
     # Keyboard bindings
     dialog.bind("<Escape>", lambda e: on_cancel())
-    dialog.bind("<Return>", lambda e: on_continue() if len(github_mods) > 0 or len(gdrive_mods) > 0 or other_domains else None)
+    dialog.bind("<Return>", lambda e: on_continue())
+    
+    if updates is not None:
+        poll_updates()
     
     # Center on parent
     dialog.update_idletasks()
@@ -5,28 +5,35 @@ Simplified version using modular components.
 
 import tkinter as tk
 from tkinter import filedialog, ttk
-import requests
 import re
 from . import custom_dialogs
 from pathlib import Path
 import threading
+import queue
 import concurrent.futures
+import contextlib
 from datetime import datetime
 import sys
 import os
 import shutil
-import time
 
 # Import from our modules
 from core import (
     LOG_FILE,
-    URL_VALIDATION_TIMEOUT_HEAD, MIN_FREE_SPACE_GB,
-    MAX_DOWNLOAD_WORKERS, CACHE_TIMEOUT,
+    MIN_FREE_SPACE_GB,
+    MAX_DOWNLOAD_WORKERS, MAX_ADAPTIVE_DOWNLOAD_WORKERS, MAX_SCAN_WORKERS, MAX_EXTRACTION_WORKERS,
+    MODS_WATCH_POLL_INTERVAL, MODS_WATCH_FULL_SCAN_INTERVAL,
     UI_MIN_WINDOW_WIDTH, UI_MIN_WINDOW_HEIGHT,
     UI_DEFAULT_WINDOW_WIDTH, UI_DEFAULT_WINDOW_HEIGHT,
     ModInstaller, ConfigManager
 )
-from core.installer import validate_mod_urls
+from core.installer import validate_mod_urls, DownloadValidationReport
+from core.http_client import close_session
+from core.download_cache import get_download_cache
+from core.url_validators import get_url_validator_store
+from core.url_probe import get_url_probe_cache
+from core.url_resolver import get_url_resolver
+from core.host_scheduler import HostScheduler
 from .dialogs import (
     open_add_mod_dialog,
     open_manage_categories_dialog,
@@ -50,9 +57,11 @@ from utils.mod_utils import (
     extract_mod_name_from_text,
     extract_mod_version_from_text,
     extract_game_version_from_text,
-    is_mod_name_match,
-    scan_installed_mods
+    is_mod_name_match
 )
+from utils.installed_mod_index import get_installed_mod_index
+from utils.dependency_graph import DependencyGraph, DependencyScheduler
+from utils.mods_watcher import ModsFolderWatcher
 from utils.backup_manager import BackupManager
 from utils.path_validator import StarsectorPathValidator
 
@@ -60,6 +69,13 @@ from utils.path_validator import StarsectorPathValidator
 class ModlistInstaller:
     """Main application window for the Modlist Installer."""
     
+    # Install status -> (icon, text tag) in the mod list
+    STATUS_DISPLAY = {
+        'installed': ("✓", 'installed'),
+        'outdated': ("↑", 'outdated'),
+        'missing': ("○", 'not_installed'),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("ASTRA Modlist Installer")
@@ -88,10 +104,23 @@ class ModlistInstaller:
         self.current_executor = None  # Track active ThreadPoolExecutor for cancellation
         self.downloaded_temp_files = []  # Track downloaded temp files for cleanup on cancel
         self.current_mod_name = tk.StringVar(value="")  # Track current mod being processed
-        self.url_validation_cache = {}  # Cache for URL validation results {url: (is_valid, timestamp)}
-        
-        # Mod installer
-        self.mod_installer = ModInstaller(self.log)
+        self.install_stage_text = tk.StringVar(value="")  # Download / install counts of the running installation
+        self.url_probe_cache = get_url_probe_cache()  # URL checks shared by the CSV import and validation
+        self.url_resolver = get_url_resolver()  # Redirect targets and release tags of the mod URLs
+        self.preflight_url_check = True  # Check URLs in a separate pass before installing (else during downloads)
+        self.extraction_workers = MAX_EXTRACTION_WORKERS  # Archives extracted at once
+        self._extraction_lock = threading.Lock()  # Guards the extraction counters shared by the workers
+        self._log_groups = threading.local()  # Log lines held back by _grouped_log(), per thread
+        self.mods_watcher = None  # Reports mods folder changes made outside the installer
+        self._mod_rows = {}  # Displayed mods {mod_name: (line, status, mod)} for targeted row refreshes
+        
+        # Mod installer (archives are kept in the download cache for reinstalls,
+        # installed archives are revalidated with conditional requests, and
+        # redirecting URLs are requested at their resolved target)
+        self.download_cache = get_download_cache()
+        self.mod_installer = ModInstaller(self.log, download_cache=self.download_cache,
+                                          url_validators=get_url_validator_store(),
+                                          url_resolver=self.url_resolver)
         
         # Load preferences and auto-detect
         self.load_preferences()
@@ -112,7 +141,7 @@ class ModlistInstaller:
         self.root.protocol("WM_DELETE_WINDOW", self.safe_quit)
         
         # Keyboard shortcuts
-        self.root.bind('<Control-q>', lambda e: self.root.destroy())
+        self.root.bind('<Control-q>', lambda e: (self._stop_mods_watcher(), self.root.destroy()))
         # Bind Ctrl+S to save configuration
         self.root.bind('<Control-s>', lambda e: self.save_modlist_config(log_message=True))
         self.root.bind('<Control-a>', lambda e: self.open_add_mod_dialog())
@@ -298,7 +327,8 @@ class ModlistInstaller:
             'export_csv': self.open_export_csv_dialog,
             'refresh': self.refresh_mod_metadata,
             'enable_mods': self.enable_all_installed_mods,
-            'restore_backup': self.restore_backup_dialog
+            'restore_backup': self.restore_backup_dialog,
+            'download_cache': self.manage_download_cache
         }
         
         buttons = create_button_panel(modlist_container, left_container, button_callbacks)
@@ -328,7 +358,8 @@ class ModlistInstaller:
         
         log_frame, self.install_progress_bar, self.log_text = create_log_section(
             right_frame, 
-            self.current_mod_name
+            self.current_mod_name,
+            self.install_stage_text
         )
         
         # Set initial sash position (60% left, 40% right)
@@ -383,6 +414,8 @@ class ModlistInstaller:
         
         # Save configuration before closing
         self.save_modlist_config()
+        self._stop_mods_watcher()
+        close_session()
         
         # Cleanup and exit
         self.log("Application closing...")
@@ -425,50 +458,19 @@ class ModlistInstaller:
     # Mod Management
     # ============================================
     
-    def _is_url_cached(self, url):
-        """Check if URL validation result is in cache and still valid.
-        
-        Returns:
-            tuple: (is_cached, is_valid) - (True, bool) if cached, (False, None) if not
-        """
-        if url in self.url_validation_cache:
-            is_valid, timestamp = self.url_validation_cache[url]
-            if time.time() - timestamp < CACHE_TIMEOUT:
-                return (True, is_valid)
-        return (False, None)
-    
-    def _cache_url_result(self, url, is_valid):
-        """Store URL validation result in cache."""
-        self.url_validation_cache[url] = (is_valid, time.time())
-    
     def validate_url(self, url: str, use_cache: bool = True) -> bool:
         """Return True if the URL appears reachable.
         
         Args:
             url: URL to validate
-            use_cache: If True, use cached validation results (default: True)
+            use_cache: If True, use a fresh cached probe of the URL (default: True)
         """
-        # Check cache first
-        if use_cache:
-            is_cached, is_valid = self._is_url_cached(url)
-            if is_cached:
-                return is_valid
-        
         try:
-            # Try HEAD first (lighter)
-            resp = requests.head(url, timeout=URL_VALIDATION_TIMEOUT_HEAD, allow_redirects=True)
-            if 200 <= resp.status_code < 400:
-                result = True
-            else:
-                # Some servers don't support HEAD, fallback to GET
-                resp = requests.get(url, stream=True, timeout=URL_VALIDATION_TIMEOUT_HEAD, allow_redirects=True)
-                result = 200 <= resp.status_code < 400
-            
-            self._cache_url_result(url, result)
-            return result
+            probe = self.url_probe_cache.probe(url, use_cache=use_cache)
         except Exception:
-            self._cache_url_result(url, False)
             return False
+        self.url_probe_cache.save()
+        return 200 <= probe['status'] < 400
 
     def add_mod_to_config(self, mod: dict) -> None:
         """Append a mod entry to the config."""
@@ -752,29 +754,121 @@ class ModlistInstaller:
             cat = mod.get('category', 'Uncategorized')
             categories.setdefault(cat, []).append(mod)
         
-        # Check installation status
+        # Check installation status of all displayed mods in one pass
         starsector_path = self.starsector_path.get()
         mods_dir = Path(starsector_path) / "mods" if starsector_path else None
+        statuses = {}
+        if mods_dir and mods_dir.exists():
+            # While the mods folder is watched, the index is already up to date
+            watched = self.mods_watcher is not None and self.mods_watcher.is_running \
+                and self.mods_watcher.mods_dir == mods_dir
+            statuses = self.mod_installer.resolve_install_status(mods, mods_dir, refresh=not watched)
         
         # Display all categories (even empty ones)
+        self._mod_rows = {}
+        line = 0
         for cat in self.categories:
             self.mod_listbox.insert(tk.END, f"{cat}\n", 'category')
+            line += 1
             
             # Display mods in this category (if any)
             if cat in categories:
                 for mod in categories[cat]:
-                    # Check if mod is installed
-                    is_installed = False
-                    if mods_dir and mods_dir.exists():
-                        is_installed = self.mod_installer.is_mod_already_installed(mod, mods_dir)
-                    
                     # Choose icon based on installation status
-                    icon = "✓" if is_installed else "○"
-                    tag = 'installed' if is_installed else 'not_installed'
+                    status = statuses.get(ModInstaller.install_status_key(mod), 'missing')
+                    icon, tag = self.STATUS_DISPLAY[status]
                     
                     self.mod_listbox.insert(tk.END, f"  {icon} {mod['name']}\n", ('mod', tag))
+                    line += 1
+                    self._mod_rows[mod['name']] = (line, status, mod)
+        
+        self.mod_listbox.config(state=tk.DISABLED)
+    
+    def refresh_mod_rows(self):
+        """Update the status icon of displayed mods from the installed-mods index.
+        
+        Only rows whose status changed are rewritten; the index is not rescanned.
+        """
+        starsector_path = self.starsector_path.get()
+        if not self._mod_rows or not starsector_path:
+            return
         
+        mods = [mod for _, _, mod in self._mod_rows.values()]
+        statuses = self.mod_installer.resolve_install_status(mods, Path(starsector_path) / "mods", refresh=False)
+        
+        self.mod_listbox.config(state=tk.NORMAL)
+        for name, (line, old_status, mod) in list(self._mod_rows.items()):
+            status = statuses.get(ModInstaller.install_status_key(mod), 'missing')
+            if status == old_status:
+                continue
+            icon, tag = self.STATUS_DISPLAY[status]
+            self.mod_listbox.delete(f"{line}.0", f"{line}.end")
+            self.mod_listbox.insert(f"{line}.0", f"  {icon} {name}", ('mod', tag))
+            self._mod_rows[name] = (line, status, mod)
         self.mod_listbox.config(state=tk.DISABLED)
+        
+        # Rewritten rows lose their selection highlight
+        self.highlight_selected_mod()
+    
+    def _start_mods_watcher(self):
+        """Watch the current mods folder (restarts the watcher if the path changed)."""
+        starsector_path = self.starsector_path.get()
+        mods_dir = Path(starsector_path) / "mods" if starsector_path else None
+        if self.mods_watcher and self.mods_watcher.mods_dir == mods_dir:
+            return
+        
+        self._stop_mods_watcher()
+        if not mods_dir or not mods_dir.is_dir():
+            return
+        
+        # The index is revalidated on the watcher thread; only the result goes to the Tk main loop
+        self.mods_watcher = ModsFolderWatcher(
+            mods_dir,
+            lambda folder_names: self._on_mods_folder_changed(mods_dir, folder_names),
+            poll_interval=MODS_WATCH_POLL_INTERVAL,
+            full_scan_interval=MODS_WATCH_FULL_SCAN_INTERVAL
+        )
+        self.mods_watcher.start()
+    
+    def _stop_mods_watcher(self):
+        """Stop watching the mods folder."""
+        if self.mods_watcher:
+            self.mods_watcher.stop()
+            self.mods_watcher = None
+    
+    def _on_mods_folder_changed(self, mods_dir, folder_names):
+        """Update the index after a mods folder change (runs on the watcher thread).
+        
+        The changed mods are handed over to the Tk main loop, which only redraws rows.
+        
+        Args:
+            mods_dir: Watched mods directory
+            folder_names: Changed mod folder names, or None to rescan the whole folder
+        """
+        if not self.modlist_data:
+            return
+        
+        index = get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS)
+        if folder_names is None:
+            changed = index.refresh()
+        else:
+            changed = index.refresh_folders(folder_names)
+        
+        if changed:
+            self.root.after(0, self._show_mods_folder_changes, mods_dir, changed)
+    
+    def _show_mods_folder_changes(self, mods_dir, changed):
+        """Redraw the rows of mods changed outside the installer (Tk main loop).
+        
+        Args:
+            mods_dir: Mods directory the changes were found in
+            changed: Names of the changed mod folders
+        """
+        if not self.mods_watcher or self.mods_watcher.mods_dir != mods_dir:
+            # The watched folder changed meanwhile
+            return
+        self.log(f"Mods folder changed: {', '.join(sorted(changed))}", debug=True)
+        self.refresh_mod_rows()
     
     def highlight_selected_mod(self):
         """Highlight the selected mod."""
@@ -851,6 +945,19 @@ class ModlistInstaller:
         
         return None
     
+    @contextlib.contextmanager
+    def _grouped_log(self):
+        """Hold back the log lines of this thread and write them in one block at the end.
+        
+        Keeps the lines of one mod together while several mods extract in parallel.
+        """
+        lines = self._log_groups.lines = []
+        try:
+            yield
+        finally:
+            self._log_groups.lines = None
+            self.root.after(0, lambda: [self.log(message, **levels) for message, levels in lines])
+    
     def log(self, message, error=False, info=False, warning=False, debug=False, success=False):
         """Append a message to the log with different severity levels.
         
@@ -862,6 +969,10 @@ class ModlistInstaller:
             debug: If True, display in gray (for debug messages)
             success: If True, display in green (for success messages)
         """
+        held = getattr(self._log_groups, 'lines', None)
+        if held is not None:
+            held.append((message, dict(error=error, info=info, warning=warning, debug=debug, success=success)))
+            return
         if threading.current_thread() is not threading.main_thread():
             self.root.after(0, lambda: self.log(message, error=error, info=info, warning=warning, debug=debug, success=success))
             return
@@ -931,12 +1042,25 @@ class ModlistInstaller:
                 self.starsector_path.set(str(path))
         if 'theme' in prefs:
             self.current_theme = prefs['theme']
+        if 'download_cache_max_mb' in prefs:
+            try:
+                self.download_cache.set_max_bytes(int(prefs['download_cache_max_mb']) * 1024 * 1024)
+            except (TypeError, ValueError):
+                pass
+        self.preflight_url_check = bool(prefs.get('preflight_url_check', True))
+        try:
+            self.extraction_workers = max(1, int(prefs.get('extraction_workers', MAX_EXTRACTION_WORKERS)))
+        except (TypeError, ValueError):
+            pass
     
     def save_preferences(self):
         """Save user preferences."""
         prefs = {
             'last_starsector_path': self.starsector_path.get(),
-            'theme': self.current_theme
+            'theme': self.current_theme,
+            'download_cache_max_mb': self.download_cache.max_bytes // (1024 * 1024),
+            'preflight_url_check': self.preflight_url_check,
+            'extraction_workers': self.extraction_workers
         }
         self.config_manager.save_preferences(prefs)
     
@@ -1009,16 +1133,19 @@ class ModlistInstaller:
         path = self.starsector_path.get()
         
         if not path:
+            self._stop_mods_watcher()
             self.path_status_label.config(text="⚠ No Starsector installation detected", fg="#e67e22")
             return
         
         is_valid, message = self.validate_starsector_path(path)
         if is_valid:
+            self._start_mods_watcher()
             if hasattr(self, '_auto_detected') and self._auto_detected:
                 self.path_status_label.config(text="✓ Auto-detected", fg="#27ae60")
             else:
                 self.path_status_label.config(text="✓ Valid path", fg="#27ae60")
         else:
+            self._stop_mods_watcher()
             self.path_status_label.config(text=f"✗ {message}", fg="#e74c3c")
     
     # ============================================
@@ -1096,10 +1223,9 @@ class ModlistInstaller:
         
         try:
             # Scan all installed mods
-            all_installed_folders = []
-            for folder, metadata in scan_installed_mods(mods_dir):
-                all_installed_folders.append(folder.name)
-                self.log(f"  Found: {folder.name}", debug=True)
+            all_installed_folders = get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).folder_names()
+            for folder_name in all_installed_folders:
+                self.log(f"  Found: {folder_name}", debug=True)
             
             if not all_installed_folders:
                 custom_dialogs.showwarning("No Mods Found", "No mods were found in the mods directory.")
@@ -1117,6 +1243,22 @@ class ModlistInstaller:
             self.log(f"✗ Error enabling mods: {e}", error=True)
             custom_dialogs.showerror("Error", f"Failed to enable mods: {e}")
     
+    def manage_download_cache(self):
+        """Show the download cache usage and offer to clear it."""
+        stats = self.download_cache.stats()
+        size_mb = stats['size_bytes'] / (1024 * 1024)
+        max_mb = stats['max_bytes'] / (1024 * 1024)
+        message = (f"{stats['archives']} archive(s) for {stats['urls']} URL(s)\n"
+                   f"{size_mb:.1f} MB used of {max_mb:.0f} MB\n"
+                   f"Location: {stats['cache_dir']}\n\n"
+                   f"Reinstalls reuse cached archives when the server reports them unchanged.")
+        if not stats['archives']:
+            custom_dialogs.showinfo("Download Cache", message)
+            return
+        if custom_dialogs.askyesno("Download Cache", message + "\n\nClear the download cache?"):
+            freed = self.download_cache.purge()
+            self.log(f"Download cache cleared ({freed / (1024 * 1024):.1f} MB freed)", success=True)
+    
     def restore_backup_dialog(self):
         """Show dialog to restore a backup."""
         starsector_dir = self.starsector_path.get()
@@ -1299,8 +1441,6 @@ class ModlistInstaller:
         Returns:
             dict: {mod_name: [list of missing dependency IDs]}
         """
-        from utils.mod_utils import extract_dependencies_from_text, check_missing_dependencies
-        
         # First, extract dependencies from modlist mods
         for mod in self.modlist_data.get('mods', []):
             mod_id = mod.get('mod_id')
@@ -1311,19 +1451,21 @@ class ModlistInstaller:
             if 'dependencies' not in mod:
                 mod['dependencies'] = []
         
-        # Get installed mod IDs
-        installed_mod_ids = set()
-        for folder, metadata in scan_installed_mods(mods_dir):
-            mod_id = metadata.get('id')
-            if mod_id:
-                installed_mod_ids.add(mod_id)
+        # Get installed mods and their IDs
+        installed_mods = [installed for _, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan()]
+        installed_mod_ids = {installed.id for installed in installed_mods if installed.id}
         
         # Add modlist mod IDs (they will be installed)
-        modlist_mod_ids = {m.get('mod_id') for m in self.modlist_data.get('mods', []) if m.get('mod_id')}
-        all_available_ids = installed_mod_ids | modlist_mod_ids
+        modlist_mod_ids = [m.get('mod_id') for m in self.modlist_data.get('mods', []) if m.get('mod_id')]
+        all_available_ids = installed_mod_ids | set(modlist_mod_ids)
+        
+        # Build the dependency graph (modlist entries + installed mod_info.json dependencies)
+        graph = DependencyGraph.from_mods(self.modlist_data.get('mods', []), installed_mods)
+        for cycle in graph.find_cycles():
+            self.log(f"⚠ Dependency cycle: {' → '.join(cycle + cycle[:1])}", warning=True)
         
-        # Check for missing dependencies
-        missing_deps_by_id = check_missing_dependencies(self.modlist_data.get('mods', []), all_available_ids)
+        # Check for missing dependencies, including indirect ones
+        missing_deps_by_id = graph.missing_dependencies(modlist_mod_ids, all_available_ids)
         
         # Convert to user-friendly format (mod name instead of ID)
         dependency_issues = {}
@@ -1382,6 +1524,12 @@ class ModlistInstaller:
             return
         self.log("✓ All pre-installation checks passed")
         
+        if not self.preflight_url_check:
+            # The first response of each download doubles as its URL check
+            self.log("Mod URLs are checked by the downloads themselves", debug=True)
+            self._begin_installation()
+            return
+        
         # Validate URLs asynchronously
         self.log("Validating mod URLs (this may take a moment)...")
         self.install_modlist_btn.config(text="Validating URLs...")
@@ -1389,15 +1537,8 @@ class ModlistInstaller:
         # _validate_urls_async now handles the rest asynchronously
         self._validate_urls_async()
     
-    def _continue_installation_after_validation(self, results):
-        """Continue installation after URL validation completes."""
-        if not results:
-            return
-        
-        # Show validation summary and check if user wants to continue
-        if not self._show_validation_summary(results):
-            return
-        
+    def _begin_installation(self):
+        """Report outdated mods and start the installation thread."""
         # Get starsector directory again
         starsector_dir = Path(self.starsector_path.get())
         
@@ -1434,57 +1575,91 @@ class ModlistInstaller:
         thread.start()
     
     def _validate_urls_async(self):
-        """Run URL validation in background thread and wait for results.
+        """Check the mod URLs in a background thread while the report dialog fills in.
         
-        Returns:
-            dict: Validation results or None if timeout/error
+        The dialog opens right away and lists each result as it arrives; the
+        installation starts when the user continues.
         """
-        validation_result = {'data': None, 'error': None}
+        mods = self.modlist_data['mods']
+        mods_dir = Path(self.starsector_path.get()) / "mods"
+        
+        # Mods already installed at the expected version won't be downloaded
+        statuses = self.mod_installer.resolve_install_status(mods, mods_dir)
+        mods_to_check = [mod for mod in mods
+                         if statuses.get(ModInstaller.install_status_key(mod)) != 'installed']
+        if len(mods_to_check) < len(mods):
+            self.log(f"Skipping URL check of {len(mods) - len(mods_to_check)} up-to-date mod(s)", debug=True)
+        if not mods_to_check:
+            self.install_modlist_btn.config(text="Install Modlist")
+            self._begin_installation()
+            return
+        
+        # Mods other modlist entries depend on must be confirmed before continuing; check them first
+        graph = DependencyGraph.from_mods(mods)
+        critical_mods = [mod for mod in mods_to_check
+                         if mod.get('mod_id') and graph.dependents(mod['mod_id'])]
+        mods_to_check = critical_mods + [mod for mod in mods_to_check if mod not in critical_mods]
+        
+        updates = queue.Queue()
         
         def run_validation():
             try:
-                validation_result['data'] = validate_mod_urls(
-                    self.modlist_data['mods'], 
-                    progress_callback=None
+                validate_mod_urls(
+                    mods_to_check,
+                    probe_cache=self.url_probe_cache,
+                    on_result=lambda *result: updates.put(result),
+                    resolver=self.url_resolver
                 )
+                stats = self.url_probe_cache.stats()
+                self.log(f"URL probe cache: {stats['hits']} hit(s), {stats['misses']} miss(es) this session", debug=True)
+                self._log_release_updates(mods_to_check)
             except Exception as e:
-                validation_result['error'] = str(e)
+                self.log(f"URL validation failed: {e}", error=True)
+            finally:
+                updates.put(None)
         
-        validation_thread = threading.Thread(target=run_validation, daemon=True)
-        validation_thread.start()
+        threading.Thread(target=run_validation, daemon=True).start()
         
-        # Wait with periodic UI updates (using after instead of update to prevent blocking)
-        max_wait = 60
-        start_time = time.time()
+        results = {'github': [], 'google_drive': [], 'other': {}, 'failed': []}
+        proceed = self._show_validation_summary(results, updates=updates, total=len(mods_to_check),
+                                                critical_mods=critical_mods)
+        self.install_modlist_btn.config(text="Install Modlist")
+        if proceed:
+            self._begin_installation()
+    
+    def _log_download_validation(self, results):
+        """Log the URL check results gathered by the downloads.
         
-        def check_validation_status():
-            if validation_result['error']:
-                custom_dialogs.showerror("Validation Error", f"Failed to validate URLs: {validation_result['error']}")
-                self.install_modlist_btn.config(text="Install Modlist")
-                return
-            
-            if validation_result['data']:
-                # Validation complete
-                self.install_modlist_btn.config(text="Install Modlist")
-                self._continue_installation_after_validation(validation_result['data'])
-                return
-            
-            elapsed = time.time() - start_time
-            if elapsed >= max_wait:
-                custom_dialogs.showerror("Validation Timeout", "URL validation took too long. Try again or check your internet connection.")
-                self.install_modlist_btn.config(text="Install Modlist")
-                return
-            
-            # Check again in 100ms
-            self.root.after(100, check_validation_status)
+        Args:
+            results: DownloadValidationReport.results
+        """
+        total_other = sum(len(mods) for mods in results['other'].values())
+        self.log(f"\nURL check: GitHub: {len(results['github'])}, Google Drive: {len(results['google_drive'])}, "
+                 f"Other: {total_other}, Failed: {len(results['failed'])}")
+        for fail in results['failed']:
+            self.log(f"  ✗ {fail['mod'].get('name', 'Unknown')}: {fail['error']}", error=True)
+    
+    def _log_release_updates(self, mods):
+        """Log the mods whose download URL now resolves to a different release tag.
         
-        # Start checking
-        self.root.after(100, check_validation_status)
-        return None  # Will be handled asynchronously
+        Args:
+            mods: Mod dictionaries to look at
+        """
+        changes = self.url_resolver.pop_tag_changes([mod.get('download_url') for mod in mods])
+        for mod in mods:
+            if mod.get('download_url') in changes:
+                previous, tag = changes[mod['download_url']]
+                self.log(f"  ⬆ {mod.get('name', 'Unknown')}: new upstream release {previous} → {tag}", info=True)
     
-    def _show_validation_summary(self, results):
+    def _show_validation_summary(self, results, updates=None, total=None, critical_mods=()):
         """Show validation results summary and prompt user to continue.
         
+        Args:
+            results: validate_mod_urls() result; filled in by the dialog when updates is given
+            updates: Optional queue of results still to come (see show_validation_report)
+            total: Number of mods being checked
+            critical_mods: Mods to confirm reachable before the user can continue early
+        
         Returns:
             bool: True if user wants to continue, False otherwise
         """
@@ -1493,21 +1668,26 @@ class ModlistInstaller:
         other_domains = results['other']
         failed_list = results['failed']
         
-        total_other = sum(len(mods) for mods in other_domains.values())
-        self.log(f"GitHub: {len(github_mods)}, Google Drive: {len(gdrive_mods)}, Other: {total_other}, Failed: {len(failed_list)}")
-        
-        if github_mods or gdrive_mods or other_domains or failed_list:
+        action = 'continue'
+        if updates is not None or github_mods or gdrive_mods or other_domains or failed_list:
             action = custom_dialogs.show_validation_report(
                 self.root,
                 github_mods,
                 gdrive_mods,
                 other_domains,
-                failed_list
+                failed_list,
+                updates=updates,
+                total=total,
+                critical_mods=critical_mods
             )
-            
-            if action == 'cancel':
-                self.log("Installation cancelled by user")
-                return False
+        
+        # Results checked so far (the rest keep arriving in the background if the user continued early)
+        total_other = sum(len(mods) for mods in other_domains.values())
+        self.log(f"GitHub: {len(github_mods)}, Google Drive: {len(gdrive_mods)}, Other: {total_other}, Failed: {len(failed_list)}")
+        
+        if action == 'cancel':
+            self.log("Installation cancelled by user")
+            return False
         
         return True
     
@@ -1580,13 +1760,26 @@ class ModlistInstaller:
         if deleted_count > 0:
             self.log(f"Cleaned up {deleted_count} temporary file(s)")
     
-    def _download_mods_parallel(self, mods_to_download, skip_gdrive_check=False, max_workers=None):
+    def _download_mods_parallel(self, mods_to_download, skip_gdrive_check=False, max_workers=None,
+                                on_downloaded=None, on_failed=None, progress=None,
+                                mods_dir=None, on_unchanged=None, report=None):
         """Download mods in parallel using ThreadPoolExecutor.
         
         Args:
             mods_to_download: List of mod dictionaries to download
             skip_gdrive_check: If True, skip Google Drive HTML detection
-            max_workers: Number of parallel download workers (default: MAX_DOWNLOAD_WORKERS)
+            max_workers: Downloads running at once at the start (default: MAX_DOWNLOAD_WORKERS);
+                         grows up to MAX_ADAPTIVE_DOWNLOAD_WORKERS while throughput improves
+            on_downloaded: Optional callback(mod, temp_path, is_7z) run on this thread after
+                           each successful download, while the other downloads continue
+            on_failed: Optional callback(mod) run on this thread after each failed download
+                       (including Google Drive HTML pages)
+            progress: Optional progress dict shared with the extraction step
+            mods_dir: Path to Starsector mods directory; archives installed there are
+                      revalidated with conditional requests
+            on_unchanged: Optional callback(mod) run on this thread when the server reports
+                          that the installed archive is unchanged (304 Not Modified)
+            report: Optional DownloadValidationReport filled from the download responses
             
         Returns:
             tuple: (download_results, gdrive_failed)
@@ -1602,14 +1795,21 @@ class ModlistInstaller:
         if max_workers is None:
             max_workers = MAX_DOWNLOAD_WORKERS
         
-        self.current_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        # Per-host limits keep a slow host from holding every worker; large archives
+        # borrow spare workers of the scheduler for byte ranges
+        scheduler = HostScheduler(max(max_workers, MAX_ADAPTIVE_DOWNLOAD_WORKERS), initial_workers=max_workers,
+                                  adaptive=True)
+        self.current_executor = scheduler.executor
+        self.mod_installer.download_scheduler = scheduler
         try:
-            future_to_mod = {
-                self.current_executor.submit(self.mod_installer.download_archive, mod, skip_gdrive_check): mod
-                for mod in mods_to_download
-            }
+            downloads = scheduler.map_unordered(
+                lambda mod: self.mod_installer.download_archive(mod, skip_gdrive_check, mods_dir, report),
+                mods_to_download,
+                url_of=lambda mod: mod.get('download_url', ''),
+                result_bytes=self._downloaded_bytes
+            )
             completed = 0
-            for future in concurrent.futures.as_completed(future_to_mod):
+            for mod, future in downloads:
                 # Check if installation was canceled
                 if not self.is_installing:
                     self.log("Installation canceled by user", error=True)
@@ -1618,33 +1818,63 @@ class ModlistInstaller:
                 while self.is_paused:
                     threading.Event().wait(0.1)
                     
-                mod = future_to_mod[future]
                 mod_name = mod.get('name', 'Unknown')
                 self.current_mod_name.set(f"⬇ Downloading: {mod_name}")
+                downloaded = None
+                failed = True
+                unchanged = False
                 
                 try:
                     temp_path, is_7z = future.result()
-                    if temp_path == 'GDRIVE_HTML':
+                    if temp_path == 'UNCHANGED':
+                        self.log(f"  ✓ Unchanged since last install: {mod.get('name')}", info=True)
+                        unchanged = True
+                        failed = False
+                    elif temp_path == 'GDRIVE_HTML':
                         gdrive_failed.append(mod)
                         self.log(f"  ⚠️  Google Drive returned HTML (virus scan warning): {mod.get('name')}", error=True)
                     elif temp_path:
                         download_results.append((mod, temp_path, is_7z))
                         self.downloaded_temp_files.append(temp_path)  # Track for cleanup
                         self.log(f"  ✓ Downloaded: {mod.get('name')}")
+                        downloaded = (mod, temp_path, is_7z)
+                        failed = False
                     else:
                         self.log(f"  ✗ Failed to download: {mod.get('name')}", error=True)
                 except Exception as e:
                     self.log(f"  ✗ Download error for {mod.get('name')}: {e}", error=True)
                     
                 completed += 1
-                self.install_progress_bar['value'] = (completed / len(mods_to_download)) * 50
+                if progress is not None:
+                    progress['downloaded'] = completed
+                    self._update_install_progress(progress)
+                else:
+                    self.install_progress_bar['value'] = (completed / len(mods_to_download)) * 100
                 self.root.update_idletasks()
+                
+                if downloaded and on_downloaded:
+                    on_downloaded(*downloaded)
+                elif unchanged and on_unchanged:
+                    on_unchanged(mod)
+                elif failed and on_failed:
+                    on_failed(mod)
         finally:
-            if self.current_executor:
-                self.current_executor.shutdown(wait=True)
-                self.current_executor = None
+            self.mod_installer.download_scheduler = None
+            scheduler.shutdown(wait=True)
+            self.current_executor = None
         
         return download_results, gdrive_failed
+    
+    @staticmethod
+    def _downloaded_bytes(result):
+        """Return the size of a download_archive() result (0 for sentinels and failures)."""
+        temp_path = result[0]
+        if not temp_path or temp_path in ('GDRIVE_HTML', 'UNCHANGED'):
+            return 0
+        try:
+            return os.path.getsize(temp_path)
+        except OSError:
+            return 0
 
     def _install_mods_internal(self, mods_to_install, skip_gdrive_check=False):
         """Internal method to install a list of mods.
@@ -1684,24 +1914,20 @@ class ModlistInstaller:
         self.log("Checking for missing or outdated mods...")
         mods_to_download = []
         pre_skipped = 0
+        statuses = self.mod_installer.resolve_install_status(mods_to_install, mods_dir)
         
         for mod in mods_to_install:
             mod_name = mod.get('name', 'Unknown')
             mod_version = mod.get('mod_version')
+            install_status = statuses.get(ModInstaller.install_status_key(mod), 'missing')
             
-            if self.mod_installer.is_mod_already_installed(mod, mods_dir):
+            if install_status == 'installed':
                 version_str = f" v{mod_version}" if mod_version else ""
                 self.log(f"  ✓ Already up-to-date: '{mod_name}'{version_str}", info=True)
                 pre_skipped += 1
             else:
-                # Check if it's an update or new install
-                is_update = False
-                for folder, metadata in scan_installed_mods(mods_dir):
-                    if metadata.get('id') == mod.get('mod_id'):
-                        is_update = True
-                        break
-                
-                status = "update" if is_update else "install"
+                # Outdated means an installed mod matched but needs an update
+                status = "update" if install_status == 'outdated' else "install"
                 self.log(f"  → Will {status}: '{mod_name}'", info=True)
                 mods_to_download.append(mod)
         
@@ -1714,21 +1940,67 @@ class ModlistInstaller:
             self._finalize_installation(mods_dir, [], 0, pre_skipped, [], [], total_mods)
             return
 
-        # Step 1: parallel downloads
-        self.log(f"Starting parallel downloads (workers={MAX_DOWNLOAD_WORKERS})...")
-        download_results, gdrive_failed = self._download_mods_parallel(
-            mods_to_download, 
-            skip_gdrive_check=skip_gdrive_check
+        # Pipeline: downloads run on the download workers while the extraction workers
+        # install each archive as soon as it lands and the libraries it depends on
+        # (LazyLib, MagicLib, ...) are installed
+        self.log(f"Starting parallel downloads (workers={MAX_DOWNLOAD_WORKERS}, adaptive up to "
+                 f"{MAX_ADAPTIVE_DOWNLOAD_WORKERS}, limited per host)...")
+        scheduler = self._create_dependency_scheduler(mods_to_download, mods_dir)
+        extraction = {'total': len(mods_to_download), 'downloaded': 0, 'download_failures': 0,
+                      'queued': 0, 'unchanged': 0, 'started': 0, 'processed': 0, 'extracted': 0, 'skipped': 0,
+                      'failures': [], 'cancel_logged': False}
+        self._update_install_progress(extraction)
+        extraction_queue = queue.Queue()
+        extractor = threading.Thread(
+            target=self._run_extraction_stage,
+            args=(extraction_queue, scheduler, mods_dir, extraction),
+            daemon=True
         )
+        extractor.start()
+        
+        def extract_when_ready(mod, temp_path, is_7z):
+            extraction['queued'] += 1
+            extraction_queue.put(('downloaded', mod, temp_path, is_7z))
+        
+        def release_dependents(mod):
+            # A failed download will not be installed: its dependents stop waiting
+            extraction['download_failures'] += 1
+            extraction_queue.put(('released', mod))
+        
+        def skip_unchanged(mod):
+            # 304 Not Modified: the installed archive is current, nothing to extract
+            extraction_queue.put(('unchanged', mod))
+        
+        # Step 1: downloads (extraction runs alongside); their responses are the URL checks
+        report = DownloadValidationReport()
+        try:
+            download_results, gdrive_failed = self._download_mods_parallel(
+                mods_to_download, 
+                skip_gdrive_check=skip_gdrive_check,
+                on_downloaded=extract_when_ready,
+                on_failed=release_dependents,
+                progress=extraction,
+                mods_dir=mods_dir,
+                on_unchanged=skip_unchanged,
+                report=report
+            )
+        finally:
+            canceled_during_downloads = not self.is_installing
+            # Step 2: the extraction thread installs what is still queued, dependencies first
+            extraction_queue.put(None)
+            extractor.join()
         
         # Check if installation was canceled during downloads
-        if not self.is_installing:
+        if canceled_during_downloads:
             self._finalize_installation_cancelled()
             return
         
-        # Step 2: sequential extraction
-        extraction_results = self._extract_downloaded_mods(download_results, mods_dir)
-        extracted, skipped, extraction_failures = extraction_results
+        self._log_download_validation(report.results)
+        self._log_release_updates(mods_to_install)
+        if not download_results:
+            self.log("All mods were skipped (already installed or failed to download)", info=True)
+            self.install_progress_bar['value'] = 100
+        extracted, skipped, extraction_failures = extraction['extracted'], extraction['skipped'], extraction['failures']
         
         # Add pre-skipped mods to total skipped count
         total_skipped = skipped + pre_skipped
@@ -1746,106 +2018,247 @@ class ModlistInstaller:
     def _finalize_installation_cancelled(self):
         """Cleanup and reset UI after installation cancellation."""
         self.log("Installation aborted")
+        self.install_stage_text.set("")
         self.install_modlist_btn.config(state=tk.NORMAL, text="Install Modlist")
         self.pause_install_btn.config(state=tk.DISABLED)
     
-    def _extract_downloaded_mods(self, download_results, mods_dir):
-        """Extract all downloaded mods sequentially.
+    def _create_dependency_scheduler(self, mods_to_download, mods_dir):
+        """Create the scheduler that orders extractions by dependencies.
         
         Args:
-            download_results: List of (mod, temp_path, is_7z) tuples
+            mods_to_download: List of mod dictionaries in this batch
             mods_dir: Path to Starsector mods directory
             
         Returns:
-            tuple: (extracted_count, skipped_count, extraction_failures_list)
+            DependencyScheduler: Scheduler over the batch's mod IDs
+        """
+        installed_mods = [installed for _, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan()]
+        graph = DependencyGraph.from_mods(self.modlist_data.get('mods', []), installed_mods)
+        batch_ids = [mod['mod_id'] for mod in mods_to_download if mod.get('mod_id')]
+        return DependencyScheduler(graph, batch_ids)
+    
+    def _queue_for_extraction(self, scheduler, mod, temp_path, is_7z):
+        """Queue a downloaded mod, registering the dependencies from its mod_info.json.
+        
+        Args:
+            scheduler: DependencyScheduler of the current batch
+            mod: Mod dictionary
+            temp_path: Path to downloaded archive
+            is_7z: Whether archive is 7z format
         """
-        self.log("Starting sequential extraction...")
-        extracted = 0
-        skipped = 0
-        extraction_failures = []
+        metadata = self.mod_installer.extract_mod_metadata(Path(temp_path), is_7z) or {}
+        mod_id = metadata.get('id') or mod.get('mod_id')
+        scheduler.add(mod_id, (mod, temp_path, is_7z, metadata), metadata.get('dependencies', ()))
+    
+    def _run_extraction_stage(self, extraction_queue, scheduler, mods_dir, extraction):
+        """Extraction side of the install pipeline (runs on its own thread).
         
-        if not download_results:
-            self.log("All mods were skipped (already installed or failed to download)", info=True)
-            self.install_progress_bar['value'] = 100
-            return (0, 0, [])
+        Consumes download events while the downloads continue. Each mod is handed
+        to one of `extraction_workers` threads once it and the mods it depends on
+        are available, so independent archives extract at the same time. A None
+        event means the downloads are over: the stage ends once everything queued
+        is extracted. On cancellation, archives that were not extracted are deleted.
         
-        for i, (mod, temp_path, is_7z) in enumerate(download_results, 1):
-            # Check cancellation
-            if not self.is_installing:
-                self.log("\nInstallation canceled during extraction", error=True)
-                self._cleanup_remaining_downloads(download_results, i-1)
-                break
+        Args:
+            extraction_queue: Queue of ('downloaded', mod, temp_path, is_7z),
+                              ('released', mod) and ('unchanged', mod) events, then None;
+                              the workers add ('extracted', mod, metadata) events
+            scheduler: DependencyScheduler of the current batch (only used on this thread)
+            mods_dir: Path to Starsector mods directory
+            extraction: Shared counters dict, updated in place
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.extraction_workers)
+        running = 0
+        downloads_over = False
+        
+        def extract(item):
+            try:
+                self._extract_queued_mod(item, mods_dir, extraction)
+            finally:
+                extraction_queue.put(('extracted', item[0], item[3]))
+        
+        try:
+            while True:
+                if downloads_over and not running:
+                    # Left over: mods waiting on a batch mod that never arrived; dependencies first
+                    for item in scheduler.drain():
+                        self._extract_queued_mod(item, mods_dir, extraction)
+                    return
                 
-            while self.is_paused:
-                threading.Event().wait(0.1)
-            
-            mod_name = mod.get('name', 'Unknown')
-            mod_version = self._get_mod_game_version(mod)
-            
-            # Update progress indicator
-            self.current_mod_name.set(f"📦 Extracting: {mod_name}")
+                event = extraction_queue.get()
+                try:
+                    if event is None:
+                        downloads_over = True
+                        continue
+                    
+                    kind, mod = event[0], event[1]
+                    if kind == 'extracted':
+                        # Installed, skipped or failed: dependents no longer wait on it
+                        running -= 1
+                        scheduler.finish(mod.get('mod_id'))
+                        scheduler.finish(event[2].get('id'))
+                    elif not self.is_installing:
+                        # Canceled: drop what was not extracted
+                        if kind == 'downloaded':
+                            self._cleanup_remaining_downloads([event[2]])
+                        continue
+                    elif kind == 'downloaded':
+                        self._queue_for_extraction(scheduler, mod, event[2], event[3])
+                    else:
+                        if kind == 'unchanged':
+                            with self._extraction_lock:
+                                extraction['unchanged'] += 1
+                                extraction['processed'] += 1
+                                extraction['skipped'] += 1
+                            self._update_install_progress(extraction)
+                        scheduler.finish(mod.get('mod_id'))
+                    
+                    for item in scheduler.pop_ready():
+                        executor.submit(extract, item)
+                        running += 1
+                except Exception as e:
+                    self.log(f"  ✗ Extraction error: {e}", error=True)
+        finally:
+            executor.shutdown(wait=True)
+    
+    def _extract_queued_mod(self, item, mods_dir, extraction):
+        """Extract a mod released by the dependency scheduler (runs on an extraction worker).
+        
+        Waits while the installation is paused; if it was canceled, deletes the
+        archive instead. The mod's log lines are written together when it is done.
+        
+        Args:
+            item: (mod, temp_path, is_7z, metadata) from the scheduler
+            mods_dir: Path to Starsector mods directory
+            extraction: Shared counters dict, updated in place
+        """
+        mod, temp_path, is_7z, metadata = item
+        while self.is_paused and self.is_installing:
+            threading.Event().wait(0.1)
+        if not self.is_installing:
+            with self._extraction_lock:
+                first = not extraction['cancel_logged']
+                extraction['cancel_logged'] = True
+            if first:
+                self.log("\nInstallation canceled during extraction", error=True)
+            self._cleanup_remaining_downloads([temp_path])
+            return
+        
+        with self._grouped_log():
+            self._extract_one_mod(mod, temp_path, is_7z, metadata, mods_dir, extraction)
+    
+    def _extract_one_mod(self, mod, temp_path, is_7z, metadata, mods_dir, extraction):
+        """Extract one downloaded mod and update the shared counters.
+        
+        Args:
+            mod: Mod dictionary
+            temp_path: Path to downloaded archive
+            is_7z: Whether archive is 7z format
+            metadata: mod_info.json metadata read from the archive (may be empty)
+            mods_dir: Path to Starsector mods directory
+            extraction: Shared counters dict, updated in place
+        """
+        mod_name = mod.get('name', 'Unknown')
+        mod_version = self._get_mod_game_version(mod)
+        
+        # Update progress indicator
+        self.current_mod_name.set(f"📦 Extracting: {mod_name}")
+        
+        version_str = f" v{mod_version}" if mod_version else ""
+        with self._extraction_lock:
+            extraction['started'] += 1
+            number = extraction['started'] + extraction['unchanged']
+        self.log(f"\n[{number}/{extraction['total']}] Installing {mod_name}{version_str}...")
+        
+        try:
+            # Auto-detect game_version BEFORE extraction
+            self._auto_detect_game_version(mod, temp_path, is_7z, metadata)
             
-            version_str = f" v{mod_version}" if mod_version else ""
-            self.log(f"\n[{i}/{len(download_results)}] Installing {mod_name}{version_str}...")
+            # Pass mod_version to enable version comparison during extraction
+            expected_mod_version = mod.get('mod_version')
+            success = self.mod_installer.extract_archive(Path(temp_path), mods_dir, is_7z, expected_mod_version)
             
+            # Clean up temp file
             try:
-                # Auto-detect game_version BEFORE extraction
-                self._auto_detect_game_version(mod, temp_path, is_7z)
-                
-                # Pass mod_version to enable version comparison during extraction
-                expected_mod_version = mod.get('mod_version')
-                success = self.mod_installer.extract_archive(Path(temp_path), mods_dir, is_7z, expected_mod_version)
-                
-                # Clean up temp file
-                try:
-                    Path(temp_path).unlink()
-                except Exception:
-                    pass
-                
-                if success == 'skipped':
-                    skipped += 1
-                elif success:
-                    self.log(f"  ✓ {mod['name']} installed successfully", success=True)
-                    extracted += 1
-                else:
-                    self.log(f"  ✗ Failed to install {mod['name']}", error=True)
-                    extraction_failures.append(mod)
-                    skipped += 1
-            except Exception as e:
-                self.log(f"  ✗ Unexpected extraction error for {mod.get('name')}: {e}", error=True)
-                extraction_failures.append(mod)
-                skipped += 1
+                Path(temp_path).unlink()
+            except Exception:
+                pass
             
-            # Update progress bar
-            progress = 50 + ((extracted + skipped) / len(download_results)) * 50
-            self.install_progress_bar['value'] = progress
-            self.root.update_idletasks()
+            if success == 'skipped':
+                outcome = 'skipped'
+            elif success:
+                self.log(f"  ✓ {mod['name']} installed successfully", success=True)
+                outcome = 'extracted'
+            else:
+                self.log(f"  ✗ Failed to install {mod['name']}", error=True)
+                outcome = 'failed'
+        except Exception as e:
+            self.log(f"  ✗ Unexpected extraction error for {mod.get('name')}: {e}", error=True)
+            outcome = 'failed'
         
-        return (extracted, skipped, extraction_failures)
+        # Counters are shared by the extraction workers
+        with self._extraction_lock:
+            if outcome == 'extracted':
+                extraction['extracted'] += 1
+            else:
+                extraction['skipped'] += 1
+                if outcome == 'failed':
+                    extraction['failures'].append(mod)
+            extraction['processed'] += 1
+        
+        # Update progress bar
+        self._update_install_progress(extraction)
+    
+    def _update_install_progress(self, progress):
+        """Show per-stage progress of the install pipeline.
+        
+        The stage label shows how many mods are downloaded, waiting for extraction
+        and installed; the bar shows the mods that are finished (installed, skipped
+        or failed). Safe to call from the worker threads.
+        
+        Args:
+            progress: Dict with 'total', 'downloaded', 'download_failures', 'queued',
+                      'unchanged' and 'processed' counts
+        """
+        if threading.current_thread() is not threading.main_thread():
+            snapshot = dict(progress)
+            self.root.after(0, lambda: self._update_install_progress(snapshot))
+            return
+        
+        total = progress['total']
+        finished = progress['processed'] + progress.get('download_failures', 0)
+        waiting = max(0, progress.get('queued', 0) - progress['processed'] + progress.get('unchanged', 0))
+        self.install_progress_bar['value'] = finished / (total or 1) * 100
+        self.install_stage_text.set(
+            f"⬇ Downloaded {progress['downloaded']}/{total}   "
+            f"⏳ Waiting to extract {waiting}   "
+            f"📦 Installed {progress['processed']}/{total}"
+        )
     
-    def _cleanup_remaining_downloads(self, download_results, start_index):
+    def _cleanup_remaining_downloads(self, temp_paths):
         """Clean up unprocessed downloaded files after cancellation.
         
         Args:
-            download_results: List of (mod, temp_path, is_7z) tuples
-            start_index: Index from which to start cleanup
+            temp_paths: Iterable of downloaded archive paths
         """
-        for _, remaining_temp_path, _ in download_results[start_index:]:
+        for remaining_temp_path in temp_paths:
             try:
                 Path(remaining_temp_path).unlink()
             except Exception:
                 pass
     
-    def _auto_detect_game_version(self, mod, temp_path, is_7z):
+    def _auto_detect_game_version(self, mod, temp_path, is_7z, metadata=None):
         """Auto-detect and update game_version and mod_version from mod archive.
         
         Args:
             mod: Mod dictionary
             temp_path: Path to downloaded archive
             is_7z: Whether archive is 7z format
+            metadata: Optional metadata already read from the archive
         """
         try:
-            metadata = self.mod_installer.extract_mod_metadata(Path(temp_path), is_7z)
+            if not metadata:
+                metadata = self.mod_installer.extract_mod_metadata(Path(temp_path), is_7z)
             if metadata:
                 # Update in modlist_data
                 for m in self.modlist_data.get('mods', []):
@@ -1880,8 +2293,8 @@ class ModlistInstaller:
                 installed_mod_ids.add(mod_id)
         
         # Scan all installed mods and match by mod_id
-        for folder, metadata in scan_installed_mods(mods_dir):
-            mod_id = metadata.get('id')
+        for folder, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan():
+            mod_id = installed.id
             if mod_id and mod_id in installed_mod_ids:
                 successfully_installed_mods.append(folder.name)
                 self.log(f"  ✓ Will enable: {folder.name} (ID: {mod_id})", debug=True)
@@ -1902,12 +2315,12 @@ class ModlistInstaller:
         # Get all mods from config
         mods = self.modlist_data.get('mods', [])
         
-        # Scan all installed mod folders using centralized scanner
-        for folder, metadata in scan_installed_mods(mods_dir):
-            installed_id = metadata.get('id')
-            installed_name = metadata.get('name')
-            installed_version = metadata.get('version')
-            installed_game_version = metadata.get('gameVersion')
+        # Scan all installed mod folders using the installed-mods index
+        for folder, installed in get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).scan():
+            installed_id = installed.id
+            installed_name = installed.name
+            installed_version = installed.version
+            installed_game_version = installed.game_version
             
             if not installed_id:
                 continue
@@ -1991,6 +2404,7 @@ class ModlistInstaller:
         # Final statistics
         self.install_progress_bar['value'] = 100
         self.current_mod_name.set("")  # Clear progress indicator
+        self.install_stage_text.set("")
         
         # Calculate statistics correctly
         # skipped = mods that were skipped because already up-to-date (from pre-check + extraction skips)
@@ -2028,9 +2442,7 @@ class ModlistInstaller:
         successfully_installed_mods = self._collect_installed_mod_folders(download_results, mods_dir)
         
         # Update enabled_mods.json - collect ALL installed mods, not just newly installed ones
-        all_installed_folders = []
-        for folder, metadata in scan_installed_mods(mods_dir):
-            all_installed_folders.append(folder.name)
+        all_installed_folders = get_installed_mod_index(mods_dir, MAX_SCAN_WORKERS).folder_names()
         
         if all_installed_folders:
             # Use merge=False to replace the list entirely with all installed mods
@@ -403,6 +403,9 @@ def create_button_panel(main_container, left_container, callbacks):
     restore_backup_btn = _create_button(management_section, "Restore Backup", callbacks.get('restore_backup', lambda: None), button_type="warning")
     restore_backup_btn.pack(pady=(0, 3), fill=tk.X)
     
+    download_cache_btn = _create_button(management_section, "Download Cache", callbacks.get('download_cache', lambda: None), button_type="plain")
+    download_cache_btn.pack(pady=(0, 3), fill=tk.X)
+    
     enable_mods_btn = _create_button(management_section, "Enable All Mods", callbacks.get('enable_mods', lambda: None), button_type="success")
     enable_mods_btn.pack(pady=(0, 0), fill=tk.X)
     
@@ -419,12 +422,13 @@ def create_button_panel(main_container, left_container, callbacks):
         'export': export_btn,
         'refresh': refresh_btn,
         'enable_mods': enable_mods_btn,
-        'restore_backup': restore_backup_btn
+        'restore_backup': restore_backup_btn,
+        'download_cache': download_cache_btn
     }
 
 
-def create_log_section(main_frame, current_mod_var=None):
-    """Create the log section with progress bar and optional current mod label."""
+def create_log_section(main_frame, current_mod_var=None, stage_var=None):
+    """Create the log section with progress bar, optional current mod label and optional stage counts label."""
     log_frame = tk.LabelFrame(main_frame, text="Installation Log", padx=5, pady=5,
                              bg=TriOSTheme.SURFACE, fg=TriOSTheme.TEXT_PRIMARY)
     log_frame.pack(fill=tk.BOTH, expand=True)
@@ -444,6 +448,18 @@ def create_log_section(main_frame, current_mod_var=None):
     progress_bar = ttk.Progressbar(log_frame, mode='determinate')
     progress_bar.pack(fill=tk.X, pady=(0, 5))
     
+    # Per-stage counts (downloads and installs run at the same time)
+    if stage_var:
+        stage_label = tk.Label(
+            log_frame,
+            textvariable=stage_var,
+            font=("Arial", 9),
+            fg=TriOSTheme.TEXT_SECONDARY,
+            bg=TriOSTheme.SURFACE,
+            anchor=tk.W
+        )
+        stage_label.pack(fill=tk.X, pady=(0, 3))
+    
     log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, state=tk.DISABLED, height=35,
                                          bg=TriOSTheme.SURFACE_DARK, fg=TriOSTheme.TEXT_PRIMARY,
                                          insertbackground=TriOSTheme.PRIMARY,
@@ -0,0 +1,305 @@
+"""
+Dependency graph over mod ids.
+Builds the graph from modlist entries and installed mods, and provides
+transitive resolution, cycle detection, topological ordering and a scheduler
+that releases mods for installation once their dependencies are installed.
+"""
+
+
+class DependencyGraph:
+    """Directed graph of mod id -> ids of the mods it depends on.
+
+    Mods that are only referenced as dependencies are known ids without
+    dependencies of their own. Insertion order is kept so that every ordering
+    this class returns is deterministic.
+    """
+
+    def __init__(self):
+        self._dependencies = {}  # mod_id -> list of dependency ids
+
+    @classmethod
+    def from_mods(cls, modlist_mods=(), installed_mods=()):
+        """Build a graph from modlist entries and installed mods.
+
+        Args:
+            modlist_mods: Modlist dicts with 'mod_id' and optional 'dependencies'
+            installed_mods: InstalledMod records (their mod_info.json dependencies)
+
+        Returns:
+            DependencyGraph: New graph
+        """
+        graph = cls()
+        for mod in installed_mods:
+            if mod.id:
+                graph.add_mod(mod.id, mod.dependencies)
+        for mod in modlist_mods:
+            if mod.get('mod_id'):
+                graph.add_mod(mod['mod_id'], mod.get('dependencies') or ())
+        return graph
+
+    def add_mod(self, mod_id, dependencies=()):
+        """Add a mod and its direct dependencies (merged with any already known).
+
+        Args:
+            mod_id: Mod id
+            dependencies: Iterable of dependency mod ids
+        """
+        known = self._dependencies.setdefault(mod_id, [])
+        for dep in dependencies:
+            if dep not in known:
+                known.append(dep)
+            self._dependencies.setdefault(dep, [])
+
+    def __contains__(self, mod_id):
+        return mod_id in self._dependencies
+
+    def __len__(self):
+        return len(self._dependencies)
+
+    def mod_ids(self):
+        """Return all known mod ids in insertion order."""
+        return list(self._dependencies)
+
+    def dependencies(self, mod_id):
+        """Return the direct dependencies of a mod (empty if unknown)."""
+        return list(self._dependencies.get(mod_id, ()))
+
+    def dependents(self, mod_id):
+        """Return the mods that depend directly on mod_id."""
+        return [other for other, deps in self._dependencies.items() if mod_id in deps]
+
+    def transitive_dependencies(self, mod_id):
+        """
+        Return every mod that mod_id depends on, directly or indirectly.
+
+        Args:
+            mod_id: Mod id
+
+        Returns:
+            list: Dependency ids, dependencies before their dependents
+                  (mod_id itself is excluded, even inside a cycle)
+        """
+        result = []
+        visited = {mod_id}
+        # Iterative post-order DFS: (node, iterator over its dependencies)
+        stack = [(mod_id, iter(self._dependencies.get(mod_id, ())))]
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                if dep not in visited:
+                    visited.add(dep)
+                    stack.append((dep, iter(self._dependencies.get(dep, ()))))
+                    break
+            else:
+                stack.pop()
+                if node != mod_id:
+                    result.append(node)
+        return result
+
+    def missing_dependencies(self, mod_ids, available_ids):
+        """
+        Find dependencies, including indirect ones, that are not available.
+
+        Args:
+            mod_ids: Mods to check
+            available_ids: Ids of mods that are installed or will be installed
+
+        Returns:
+            dict: {mod_id: [missing dependency ids]} for mods with missing dependencies
+        """
+        available = set(available_ids)
+        missing = {}
+        for mod_id in mod_ids:
+            absent = [dep for dep in self.transitive_dependencies(mod_id) if dep not in available]
+            if absent:
+                missing[mod_id] = absent
+        return missing
+
+    def find_cycles(self):
+        """
+        Find dependency cycles.
+
+        Returns:
+            list: One list of mod ids per cycle (strongly connected component with
+                  more than one mod, or a mod depending on itself). A cycle is
+                  listed after any cycle it depends on.
+        """
+        # Iterative Tarjan's algorithm
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        component_stack = []
+        cycles = []
+        counter = 0
+        position = {mod_id: i for i, mod_id in enumerate(self._dependencies)}
+
+        for root in self._dependencies:
+            if root in index:
+                continue
+            work = [(root, iter(self._dependencies[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            component_stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = counter
+                        counter += 1
+                        component_stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(self._dependencies[dep])))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = component_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in self._dependencies[node]:
+                            cycles.append(sorted(component, key=position.get))
+        return cycles
+
+    def topological_order(self, mod_ids=None):
+        """
+        Order mods so that every mod comes after its dependencies.
+
+        Cycles cannot be ordered; their members are emitted in insertion
+        order once nothing outside the cycle blocks them.
+
+        Args:
+            mod_ids: Optional subset of mods to order (default: all known mods).
+                     Dependencies outside the subset still constrain the order.
+
+        Returns:
+            list: Mod ids, dependencies first
+        """
+        remaining = {mod_id: len(set(deps)) for mod_id, deps in self._dependencies.items()}
+        dependents = {mod_id: [] for mod_id in self._dependencies}
+        for mod_id, deps in self._dependencies.items():
+            for dep in set(deps):
+                dependents[dep].append(mod_id)
+
+        order = []
+        emitted = set()
+        pending = list(self._dependencies)
+        ready = [mod_id for mod_id in pending if remaining[mod_id] == 0]
+        cycles = None
+
+        while len(order) < len(pending):
+            if not ready:
+                # Everything left waits on a cycle. find_cycles() lists cycles
+                # dependencies first, so release the first unfinished one as a whole
+                if cycles is None:
+                    cycles = self.find_cycles()
+                cycle = next(cycle for cycle in cycles if any(mod_id not in emitted for mod_id in cycle))
+                ready = [mod_id for mod_id in cycle if mod_id not in emitted]
+            next_ready = []
+            for mod_id in ready:
+                if mod_id in emitted:
+                    continue
+                emitted.add(mod_id)
+                order.append(mod_id)
+                for dependent in dependents[mod_id]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and dependent not in emitted:
+                        next_ready.append(dependent)
+            ready = next_ready
+
+        if mod_ids is None:
+            return order
+        wanted = set(mod_ids)
+        return [mod_id for mod_id in order if mod_id in wanted]
+
+
+class DependencyScheduler:
+    """Releases items for installation once the batch mods they depend on are done.
+
+    Items (e.g. downloaded archives) are added as they become available. An
+    item is ready when none of its direct or indirect dependencies is a batch
+    mod that has not been finished yet. Dependencies outside the batch
+    (already installed or missing) never block.
+    """
+
+    def __init__(self, graph, batch_ids):
+        """Initialize the scheduler.
+
+        Args:
+            graph: DependencyGraph (updated with dependencies passed to add())
+            batch_ids: Ids of the mods being installed in this batch
+        """
+        self.graph = graph
+        self._unfinished = set(batch_ids)
+        self._waiting = []  # (mod_id, item) in arrival order
+        self._closures = {}  # mod_id -> transitive dependencies, until the next add()
+
+    def add(self, mod_id, item, dependencies=()):
+        """Queue an item.
+
+        Args:
+            mod_id: Mod id of the item (None if unknown: never blocked, never blocks)
+            item: Value handed back by pop_ready()/drain()
+            dependencies: Direct dependencies learned for this mod (e.g. from its archive)
+        """
+        if mod_id:
+            self.graph.add_mod(mod_id, dependencies)
+            # New edges can extend any closure that reaches mod_id
+            self._closures.clear()
+        self._waiting.append((mod_id, item))
+
+    def finish(self, mod_id):
+        """Mark a batch mod as done (installed, skipped or failed) so its dependents can proceed."""
+        self._unfinished.discard(mod_id)
+
+    def _closure(self, mod_id):
+        """Return the transitive dependencies of mod_id, computed once per graph change."""
+        closure = self._closures.get(mod_id)
+        if closure is None:
+            closure = self._closures[mod_id] = frozenset(self.graph.transitive_dependencies(mod_id))
+        return closure
+
+    def is_blocked(self, mod_id):
+        """Return True if mod_id depends on an unfinished batch mod.
+
+        Mods in the same dependency cycle don't block each other.
+        """
+        if not mod_id:
+            return False
+        for dep in self._closure(mod_id):
+            if dep in self._unfinished and mod_id not in self._closure(dep):
+                return True
+        return False
+
+    def pop_ready(self):
+        """Remove and return the queued items that are ready, in arrival order."""
+        ready = []
+        waiting = []
+        for mod_id, item in self._waiting:
+            if self.is_blocked(mod_id):
+                waiting.append((mod_id, item))
+            else:
+                ready.append(item)
+        self._waiting = waiting
+        return ready
+
+    def drain(self):
+        """Remove and return all queued items, dependencies first (cycles in arrival order)."""
+        position = {mod_id: i for i, mod_id in enumerate(self.graph.topological_order())}
+        waiting = self._waiting
+        self._waiting = []
+        ordered = sorted(enumerate(waiting), key=lambda entry: (position.get(entry[1][0], -1), entry[0]))
+        return [item for _, (_, item) in ordered]
+
+    def __len__(self):
+        return len(self._waiting)
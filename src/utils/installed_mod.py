@@ -0,0 +1,121 @@
+"""
+Compact record for an installed mod.
+Holds the parsed mod_info.json fields of one mod folder; the raw file text is
+only read when a consumer asks for it.
+"""
+
+from pathlib import Path
+
+
+def read_mod_info_text(folder):
+    """Return the mod_info.json text of folder, or None if it is missing or not valid UTF-8.
+
+    Shared by the mods folder scan and InstalledMod.content, so a record's raw
+    text decodes exactly like the text it was parsed from.
+    """
+    try:
+        # Opening directly saves a separate exists() round trip on network drives
+        with open(Path(folder) / "mod_info.json", 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        # Missing file, not a directory, or unreadable
+        return None
+
+
+class InstalledMod:
+    """Parsed metadata of one installed mod folder.
+
+    Uses __slots__ and keeps no per-instance dict, so large scans and the
+    long-lived installed mods index stay small. The raw mod_info.json text is
+    not kept after parsing; the content property reads it again on demand.
+    """
+
+    __slots__ = ('folder', 'id', 'name', 'version', 'game_version', 'dependencies', 'jars', '_content')
+
+    def __init__(self, folder, id=None, name=None, version='unknown', game_version=None,
+                 dependencies=(), jars=(), content=None):
+        """Initialize the record.
+
+        Args:
+            folder: Path to the mod folder
+            id: Mod id from mod_info.json
+            name: Mod name from mod_info.json
+            version: Mod version string ('unknown' if missing)
+            game_version: Required Starsector version
+            dependencies: Ids of the mods this mod depends on
+            jars: Jar paths listed in mod_info.json
+            content: Optional raw mod_info.json text to keep (default: load lazily)
+        """
+        self.folder = Path(folder)
+        self.id = id
+        self.name = name
+        self.version = version
+        self.game_version = game_version
+        self.dependencies = tuple(dependencies)
+        self.jars = tuple(jars)
+        self._content = content
+
+    @classmethod
+    def from_metadata(cls, folder, metadata, content=None):
+        """Build a record from an extract_all_metadata_from_text() dict.
+
+        Args:
+            folder: Path to the mod folder
+            metadata: Dict with 'id', 'name', 'version', 'gameVersion' and
+                      optionally 'dependencies' and 'jars'
+            content: Optional raw mod_info.json text to keep
+
+        Returns:
+            InstalledMod: New record
+        """
+        return cls(
+            folder,
+            id=metadata.get('id'),
+            name=metadata.get('name'),
+            version=metadata.get('version') or 'unknown',
+            game_version=metadata.get('gameVersion'),
+            dependencies=metadata.get('dependencies') or (),
+            jars=metadata.get('jars') or (),
+            content=content
+        )
+
+    def to_metadata(self):
+        """Return the parsed fields as an extract_all_metadata_from_text()-style dict."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'version': self.version,
+            'gameVersion': self.game_version,
+            'dependencies': list(self.dependencies),
+            'jars': list(self.jars)
+        }
+
+    @property
+    def folder_name(self):
+        """Name of the mod folder."""
+        return self.folder.name
+
+    @property
+    def content(self):
+        """Raw mod_info.json text, read from disk on first access (None if unreadable)."""
+        if self._content is None:
+            self._content = read_mod_info_text(self.folder)
+        return self._content
+
+    def release_content(self):
+        """Drop the cached raw text; it is read again on the next access."""
+        self._content = None
+
+    def __eq__(self, other):
+        if not isinstance(other, InstalledMod):
+            return NotImplemented
+        return (self.folder, self.id, self.name, self.version, self.game_version,
+                self.dependencies, self.jars) == (other.folder, other.id, other.name, other.version,
+                                                  other.game_version, other.dependencies, other.jars)
+
+    def __hash__(self):
+        # Over a subset of the __eq__ fields, so equal records hash alike
+        return hash((self.folder, self.id, self.version))
+
+    def __repr__(self):
+        return f"InstalledMod(folder={self.folder.name!r}, id={self.id!r}, version={self.version!r})"
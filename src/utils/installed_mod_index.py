@@ -0,0 +1,314 @@
+"""
+Persistent index of installed mods.
+Caches parsed mod_info.json metadata per mod folder so that repeated scans
+only re-read folders whose mod_info.json changed on disk.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from .installed_mod import InstalledMod
+from .mod_utils import extract_all_metadata_from_text, map_ordered, read_mod_info_json
+from .persistence import save_json_atomic
+
+
+INDEX_FILE_NAME = "modlist_installed_index.json"
+INDEX_FORMAT_VERSION = 3
+
+
+class InstalledModIndex:
+    """Incrementally revalidated index of a Starsector mods directory.
+
+    Each entry maps a mod folder name to the (mtime, ctime, size) of its
+    mod_info.json and the InstalledMod record parsed from it (None if the file
+    could not be read, so broken mods are not re-read on every refresh). A
+    refresh is a single stat pass over the mods directory; only folders whose
+    mod_info.json stat changed are re-read. ctime is compared too because
+    extractors may restore archive mtimes. The index is saved next to the mods
+    directory and reloaded on startup.
+    """
+
+    def __init__(self, mods_dir, index_file=None, max_workers=1):
+        """Initialize the index.
+
+        Args:
+            mods_dir: Path to Starsector mods directory
+            index_file: Optional path of the saved index
+                        (default: <starsector>/modlist_installed_index.json)
+            max_workers: Number of concurrent stats/reads during a refresh
+                         (default: 1, sequential)
+        """
+        self.mods_dir = Path(mods_dir)
+        self.max_workers = max_workers
+        self.index_file = Path(index_file) if index_file else self.mods_dir.parent / INDEX_FILE_NAME
+        self._entries = {}  # folder_name -> (mtime_ns, ctime_ns, size, InstalledMod or None)
+        self._order = []  # names of valid mod folders in directory listing order
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+
+    def load(self):
+        """Load the saved index from disk (missing or invalid files are ignored)."""
+        with self._lock:
+            self._loaded = True
+            if not self.index_file.exists():
+                return
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+                return
+
+            if data.get('format') != INDEX_FORMAT_VERSION:
+                return
+
+            entries = data.get('entries', {})
+            if not isinstance(entries, dict):
+                return
+            for name, entry in entries.items():
+                try:
+                    metadata = entry['metadata']
+                    mod = InstalledMod.from_metadata(self.mods_dir / name, metadata) if metadata is not None else None
+                    self._entries[name] = (entry['mtime_ns'], entry['ctime_ns'], entry['size'], mod)
+                except (KeyError, TypeError, AttributeError):
+                    continue
+            self._order = [name for name, entry in self._entries.items() if entry[3] is not None]
+
+    def save(self):
+        """Save the index atomically if it changed since the last save.
+
+        Returns:
+            bool: True if the index is persisted, False if writing failed
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            entries = {}
+            for name, (mtime_ns, ctime_ns, size, mod) in self._entries.items():
+                entries[name] = {'mtime_ns': mtime_ns, 'ctime_ns': ctime_ns, 'size': size,
+                                 'metadata': mod.to_metadata() if mod is not None else None}
+            data = {
+                'format': INDEX_FORMAT_VERSION,
+                'mods_dir': str(self.mods_dir),
+                'entries': entries
+            }
+            try:
+                save_json_atomic(self.index_file, data, ensure_ascii=False)
+            except OSError:
+                # Read-only install location: keep working from memory
+                return False
+
+            self._dirty = False
+            return True
+
+    def refresh(self, save=True):
+        """Revalidate the index against the mods directory.
+
+        Args:
+            save: If True, persist the index when something changed
+
+        Returns:
+            set: Folder names that were added, changed or removed
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+
+            changed = set()
+            seen = []
+
+            try:
+                dir_entries = list(os.scandir(self.mods_dir))
+            except OSError:
+                dir_entries = []
+
+            cached_entries = dict(self._entries)
+
+            def check_entry(entry):
+                # Runs on worker threads. Returns (name, index entry or None, changed)
+                try:
+                    if not entry.is_dir():
+                        return entry.name, None, False
+                except OSError:
+                    return entry.name, None, False
+                return (entry.name,) + self._check_folder(entry.name, cached_entries.get(entry.name))
+
+            # Skip hidden folders
+            visible = [entry for entry in dir_entries if not entry.name.startswith('.')]
+            for name, index_entry, updated in map_ordered(check_entry, visible, self.max_workers):
+                if index_entry is None:
+                    continue
+                if updated:
+                    self._store(name, index_entry, changed)
+                seen.append(name)
+
+            seen_set = set(seen)
+            for name in list(self._entries):
+                if name not in seen_set:
+                    self._store(name, None, changed)
+
+            self._order = [name for name in seen if self._entries[name][3] is not None]
+
+            if save and self._dirty:
+                self.save()
+
+            return changed
+
+    def refresh_folders(self, folder_names, save=True):
+        """Revalidate only some mod folders (e.g. the ones a ModsFolderWatcher reported).
+
+        Args:
+            folder_names: Names of the mod folders to check
+            save: If True, persist the index when something changed
+
+        Returns:
+            set: Folder names that were added, changed or removed
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+
+            changed = set()
+            for name in folder_names:
+                if name.startswith('.'):
+                    continue
+                index_entry, updated = self._check_folder(name, self._entries.get(name))
+                if index_entry is None or updated:
+                    self._store(name, index_entry, changed)
+
+                is_valid = index_entry is not None and index_entry[3] is not None
+                if is_valid and name not in self._order:
+                    self._order.append(name)
+                elif not is_valid and name in self._order:
+                    self._order.remove(name)
+
+            if save and self._dirty:
+                self.save()
+
+            return changed
+
+    def invalidate(self, folder_names):
+        """Forget the cached metadata of some folders so the next refresh re-reads them.
+
+        Used after extracting into those folders, for filesystems where neither
+        mtime nor ctime reliably changes (e.g. restored timestamps on FAT/SMB).
+
+        Args:
+            folder_names: Names of the mod folders
+        """
+        with self._lock:
+            for name in folder_names:
+                entry = self._entries.get(name)
+                if entry is not None:
+                    self._entries[name] = (None, None, None, entry[3])
+
+    def _store(self, name, index_entry, changed):
+        """Set (or with None, remove) one entry and record whether a valid mod changed."""
+        old = self._entries.pop(name, None)
+        if index_entry is not None:
+            self._entries[name] = index_entry
+        if (old and old[3] is not None) or (index_entry and index_entry[3] is not None):
+            changed.add(name)
+        if old is not None or index_entry is not None:
+            self._dirty = True
+
+    def _check_folder(self, name, cached):
+        """Stat a folder's mod_info.json and re-read it only if it changed.
+
+        Args:
+            name: Mod folder name
+            cached: Current index entry of the folder, or None
+
+        Returns:
+            tuple: (index entry or None if the folder has no mod_info.json, True if re-read).
+                   The entry's record is None if mod_info.json is unreadable.
+        """
+        path = os.path.join(self.mods_dir, name)
+        try:
+            stat = os.stat(os.path.join(path, "mod_info.json"))
+        except OSError:
+            return None, False
+
+        signature = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+        if cached and cached[:3] == signature:
+            return cached, False
+
+        content = read_mod_info_json(path)
+        if content is None:
+            # Unreadable: skipped like the scanner does, but remembered until the file changes
+            return signature + (None,), True
+
+        # The record keeps only the parsed fields, not the raw text
+        mod = InstalledMod.from_metadata(self.mods_dir / name, extract_all_metadata_from_text(content))
+        return signature + (mod,), True
+
+    def scan(self, refresh=True):
+        """Iterate over installed mods, like scan_installed_mods() but from the index.
+
+        Args:
+            refresh: If True, revalidate the index before iterating
+
+        Yields:
+            tuple: (folder_path, InstalledMod)
+        """
+        with self._lock:
+            if refresh:
+                self.refresh()
+            mods = [self._entries[name][3] for name in self._order]
+
+        for mod in mods:
+            yield mod.folder, mod
+
+    def get(self, folder_name, refresh=False):
+        """Return the InstalledMod of one mod folder, or None if it is not a valid mod.
+
+        Args:
+            folder_name: Name of the mod folder
+            refresh: If True, revalidate the index first
+        """
+        with self._lock:
+            if refresh or not self._loaded:
+                self.refresh()
+            entry = self._entries.get(folder_name)
+            return entry[3] if entry else None
+
+    def folder_names(self, refresh=True):
+        """Return the names of all indexed mod folders in listing order."""
+        with self._lock:
+            if refresh:
+                self.refresh()
+            return list(self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_installed_mod_index(mods_dir, max_workers=None):
+    """Return the shared InstalledModIndex for a mods directory.
+
+    One index is kept per mods directory for the lifetime of the process, so
+    every caller benefits from the metadata already read by the others.
+
+    Args:
+        mods_dir: Path to Starsector mods directory
+        max_workers: Optional number of concurrent stats/reads for refreshes
+                     (None keeps the index's current setting)
+
+    Returns:
+        InstalledModIndex: Shared index instance
+    """
+    key = os.path.abspath(str(mods_dir))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = InstalledModIndex(mods_dir)
+            _indexes[key] = index
+        if max_workers is not None:
+            index.max_workers = max_workers
+        return index
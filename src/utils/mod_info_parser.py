@@ -0,0 +1,343 @@
+"""
+Lenient parser for Starsector's relaxed JSON dialect (mod_info.json).
+
+Starsector reads mod_info.json with a modified org.json: '#', '//' and '/* */'
+comments, unquoted keys and values, single-quoted strings, '=' / ';' as
+separators and trailing commas are all accepted. This module parses that
+dialect in one pass with a small recursive-descent parser over compiled
+regexes and returns every field at once, instead of running a separate regex
+search per field.
+
+Most files are plain JSON apart from a few comments or trailing commas, so
+the C json decoder is tried first; the comment or comma it stops at is cut
+out and the text decoded again. Anything else (bare words, single quotes,
+'=' separators) goes to the lenient parser.
+"""
+
+import json
+import re
+
+
+class ModInfoParseError(ValueError):
+    """Raised when text cannot be parsed as Starsector-style JSON."""
+
+
+# Whitespace and comments between tokens. An unterminated block comment runs
+# to the end of the text, which then fails as "unexpected end of input".
+_SKIP = r'(?:\s+|\#[^\n]*|//[^\n]*|/\*.*?(?:\*/|\Z))*'
+_STRING = r""""[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*'"""
+
+# Each regex skips to the next token and captures it, so every step of the
+# parser is a single match() call:
+# - a member: closing '}' (group 1), or a key, quoted (group 2) or bare up to
+#   ':'/'='/space (group 3), followed by its ':' or '=' separator (group 4)
+# - a value: bracket or ',' (group 1), or a scalar, quoted (group 2) or bare
+#   (group 3), followed by the ',', ';' or closing bracket after it (group 4)
+# - a separator character (group 1; '' at the end of the text), after containers
+# Bare values are read like org.json, up to the next delimiter (',', ';', a
+# bracket, a quote, '#' or the end of the line). Inner spaces and ':' are kept, so
+# "name: Lazy Lib" and "url: http://host/x" work, and '//' only starts a
+# comment after whitespace. Trailing whitespace is not part of the value.
+_MEMBER_RE = re.compile(_SKIP + r"""(?: (}) | (?: (""" + _STRING + r""") | ([^\s{}\[\]:=,;"'\#/]+) )
+    """ + _SKIP + r"""(:|=>?)? )""", re.VERBOSE | re.DOTALL)
+_VALUE_RE = re.compile(_SKIP + r"""(?: ([{}\[\],;]) | (?: (""" + _STRING + r""") | (
+    [^\s,;{}\[\]"'\#/]
+    (?: [^\s,;{}\[\]"'\#]+
+      | [ \t]+ (?= [^\s,;{}\[\]"'\#/] | /(?![/*]) )
+    )*
+) ) (?: """ + _SKIP + r"""([,;}\]]) )? )""", re.VERBOSE | re.DOTALL)
+_SEPARATOR_RE = re.compile(_SKIP + r'(.?)', re.DOTALL)
+
+_WORDS = {'true': True, 'false': False, 'null': None}
+_ESCAPES = {'"': '"', "'": "'", '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_ESCAPE_RE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+
+# Numbers are kept as their source text, like bare words in the lenient parser
+_JSON_DECODER = json.JSONDecoder(parse_float=str, parse_int=str, parse_constant=str, strict=False)
+# Each repair decodes the text again; past this many the lenient parser is faster
+_MAX_JSON_REPAIRS = 8
+# Characters after which '//' or '/*' starts a comment rather than continuing a bare value
+_COMMENT_PRECEDERS = frozenset(' \t\r\n,;{}[]"\'')
+
+
+def _unescape(value):
+    """Resolve backslash escapes; unknown escapes keep the escaped character."""
+    def replace(match):
+        escape = match.group(1)
+        if len(escape) == 5:
+            return chr(int(escape[1:], 16))
+        return _ESCAPES.get(escape, escape)
+    return _ESCAPE_RE.sub(replace, value)
+
+
+def _string_value(token):
+    """Return the value of a quoted string token (quotes included)."""
+    value = token[1:-1]
+    if '\\' in value:
+        value = _unescape(value)
+    return value
+
+
+def _unexpected(text, pos, expected):
+    """Build the error for a missing token at pos."""
+    pos = re.compile(_SKIP, re.DOTALL).match(text, pos).end()
+    if pos >= len(text):
+        return ModInfoParseError(f"Expected {expected}, got end of input")
+    if text[pos] in '"\'':
+        return ModInfoParseError(f"Unterminated string at position {pos}: {text[pos:pos + 20]!r}")
+    return ModInfoParseError(f"Expected {expected} at position {pos}, got {text[pos]!r}")
+
+
+def _parse_object(text, pos):
+    """Parse object members after the opening '{'; returns (dict, end)."""
+    result = {}
+    while True:
+        match = _MEMBER_RE.match(text, pos)
+        if match is None:
+            raise _unexpected(text, pos, "key")
+        key = match.group(3)
+        if key is None:
+            if match.group(1):
+                return result, match.end(1)
+            key = _string_value(match.group(2))
+        if match.group(4) is None:
+            raise _unexpected(text, match.end(), f"':' after key {key!r}")
+
+        result[key], pos, char = _parse_value(text, match.end())
+        if char == '}':
+            return result, pos
+        if char != ',' and char != ';':
+            raise _unexpected(text, pos, f"',' or '}}' after the value of {key!r}")
+        # A '}' may follow (trailing comma)
+
+
+def _parse_array(text, pos):
+    """Parse array elements after the opening '['; returns (list, end)."""
+    result = []
+    while True:
+        match = _VALUE_RE.match(text, pos)
+        char = match.group(1) if match else None
+        if char == ']':
+            return result, match.end()
+        if char == ',' or char == ';':
+            # Missing element, read as null like org.json
+            result.append(None)
+            pos = match.end()
+            continue
+
+        value, pos, char = _parse_value(text, pos, match)
+        result.append(value)
+        if char == ']':
+            return result, pos
+        if char != ',' and char != ';':
+            raise _unexpected(text, pos, "',' or ']' in array")
+        # A ']' may follow (trailing comma)
+
+
+def _parse_value(text, pos, match=None):
+    """Parse the value starting at or after pos.
+
+    Args:
+        text: Text being parsed
+        pos: Position to start at
+        match: The _VALUE_RE match at pos, if the caller already has it
+
+    Returns:
+        tuple: (value, end, separator), where separator is the ',', ';' or
+               closing bracket after the value ('' at the end of the text) and
+               end is the position after it; if anything else follows, the
+               separator is that character and end is where it starts
+    """
+    if match is None:
+        match = _VALUE_RE.match(text, pos)
+    if match is not None:
+        word = match.group(3)
+        if word is not None:
+            value = _WORDS.get(word, word)
+        else:
+            token = match.group(2)
+            if token is not None:
+                # Fast path for the common, escape-free string
+                value = token[1:-1] if '\\' not in token else _string_value(token)
+            else:
+                char = match.group(1)
+                if char == '{':
+                    value, pos = _parse_object(text, match.end())
+                elif char == '[':
+                    value, pos = _parse_array(text, match.end())
+                else:
+                    raise _unexpected(text, pos, "value")
+                separator = _SEPARATOR_RE.match(text, pos)
+                char = separator.group(1)
+                return value, (separator.end() if char in ',;}]' else separator.start(1)), char
+        char = match.group(4)
+        if char is not None:
+            return value, match.end(), char
+        separator = _SEPARATOR_RE.match(text, match.end())
+        return value, separator.start(1), separator.group(1)
+    raise _unexpected(text, pos, "value")
+
+
+def _cut_json_error(text, pos):
+    """
+    Remove the comments and trailing comma at the position the JSON decoder stopped at.
+
+    The decoder reports the first token it cannot read, which is always
+    outside strings, so comments found there (and the ones right after) and a
+    ',' before a closing bracket can be cut out safely.
+
+    Returns:
+        str: The repaired text, or None if the error is something else
+    """
+    head, rest = text[:pos], text[pos:]
+    if rest[:2] in ('//', '/*') and pos > 0 and text[pos - 1] not in _COMMENT_PRECEDERS:
+        # Part of a bare value
+        return None
+    cut = False
+    while True:
+        if rest[:1] == '#' or rest[:2] == '//':
+            end = rest.find('\n')
+        elif rest[:2] == '/*':
+            end = rest.find('*/', 2)
+            end = end + 2 if end >= 0 else -1
+        else:
+            break
+        rest = rest[end:].lstrip() if end >= 0 else ''
+        cut = True
+    if rest[:1] in ('}', ']') and rest:
+        stripped = head.rstrip()
+        if stripped.endswith(','):
+            head = stripped[:-1]
+            cut = True
+    return head + rest if cut else None
+
+
+def _loads_json(text):
+    """
+    Decode text as JSON, cutting out the comments and trailing commas it stops at.
+
+    Returns:
+        The decoded document, or None if text needs the lenient parser
+    """
+    for _ in range(_MAX_JSON_REPAIRS + 1):
+        try:
+            return _JSON_DECODER.decode(text)
+        except json.JSONDecodeError as error:
+            text = _cut_json_error(text, error.pos)
+        if text is None:
+            return None
+    return None
+
+
+def loads(text):
+    """
+    Parse Starsector-style JSON text.
+
+    Bare words other than true/false/null (numbers, unquoted values) are
+    returned as their source text, so versions like 0.10 keep their digits.
+    Separators are checked like the game's reader: a key is followed by ':'
+    (or '='), a value by ',' (or ';') or the closing bracket.
+
+    Args:
+        text: Raw text content
+
+    Returns:
+        The parsed document (dict, list, str, bool or None)
+
+    Raises:
+        ModInfoParseError: If the text is not valid in the relaxed dialect
+
+    Examples:
+        >>> loads("{id: 'lazylib', jars: ['a.jar',], # comment\\n}")
+        {'id': 'lazylib', 'jars': ['a.jar']}
+    """
+    value = _loads_json(text)
+    if value is not None:
+        return value
+    value, pos, char = _parse_value(text, 0)
+    if char:
+        if char in ',;}]':
+            pos -= 1
+        raise ModInfoParseError(f"Unexpected data after document at position {pos}: {text[pos:pos + 20]!r}")
+    return value
+
+
+def _as_text(value):
+    """Return value if it is a non-empty string, else None."""
+    return value if isinstance(value, str) and value else None
+
+
+def _field(obj, name):
+    """Look up a key as the game spells it, falling back to a case-insensitive match."""
+    if name in obj:
+        return obj[name]
+    name = name.lower()
+    for key, value in obj.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def format_version(value):
+    """
+    Format a mod_info.json version (string or {major, minor, patch} object).
+
+    Returns:
+        str: Version string (e.g., "1.5.0", "0.12.1b") or 'unknown'
+
+    Examples:
+        >>> format_version({'major': '0', 'minor': '12', 'patch': '1b'})
+        '0.12.1b'
+    """
+    if isinstance(value, dict):
+        parts = [_field(value, 'major'), _field(value, 'minor'), _field(value, 'patch')]
+        if parts[0] is None or isinstance(parts[0], (dict, list)):
+            return 'unknown'
+        return '.'.join(str(part) for part in parts if part is not None and not isinstance(part, (dict, list)))
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return 'unknown'
+
+
+def parse_mod_info(text):
+    """
+    Parse mod_info.json text and return its metadata in one go.
+
+    Args:
+        text: Raw text content of mod_info.json
+
+    Returns:
+        dict: {
+            'id': str or None,
+            'name': str or None,
+            'version': str or 'unknown',
+            'gameVersion': str or None,
+            'dependencies': [mod_id, ...],
+            'jars': [path, ...]
+        }
+
+    Raises:
+        ModInfoParseError: If the text cannot be parsed or is not an object
+    """
+    data = loads(text)
+    if not isinstance(data, dict):
+        raise ModInfoParseError("mod_info.json root is not an object")
+    dependencies = []
+    deps = _field(data, 'dependencies')
+    if isinstance(deps, list):
+        for dep in deps:
+            dep_id = _as_text(_field(dep, 'id') if isinstance(dep, dict) else dep)
+            if dep_id:
+                dependencies.append(dep_id)
+
+    jars = _field(data, 'jars')
+    jars = [jar for jar in jars if isinstance(jar, str)] if isinstance(jars, list) else []
+
+    return {
+        'id': _as_text(_field(data, 'id')),
+        'name': _as_text(_field(data, 'name')),
+        'version': format_version(_field(data, 'version')),
+        'gameVersion': _as_text(_field(data, 'gameVersion')),
+        'dependencies': dependencies,
+        'jars': jars
+    }
@@ -4,7 +4,12 @@ Centralized functions to avoid code duplication.
 """
 
 import re
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .installed_mod import InstalledMod, read_mod_info_text
+from .mod_info_parser import ModInfoParseError, parse_mod_info
+from .version_key import version_key
 
 
 def normalize_mod_name(name):
@@ -140,21 +145,17 @@ def read_mod_info_json(mod_folder):
     Returns:
         str: Content of mod_info.json or None if not found/readable
     """
-    mod_info_file = Path(mod_folder) / "mod_info.json"
-    if not mod_info_file.exists():
-        return None
-    
-    try:
-        with open(mod_info_file, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception:
-        return None
+    return read_mod_info_text(mod_folder)
 
 
 def extract_all_metadata_from_text(content):
     """
     Extract all metadata from mod_info.json content in one pass.
     
+    The text is parsed once with the lenient mod_info.json parser; content that
+    is not a complete document (e.g. a fragment) falls back to the per-field
+    regex extractors.
+    
     Args:
         content: Raw text content of mod_info.json
         
@@ -163,14 +164,23 @@ def extract_all_metadata_from_text(content):
             'id': str or None,
             'name': str or None,
             'version': str or 'unknown',
-            'gameVersion': str or None
+            'gameVersion': str or None,
+            'dependencies': [mod_id, ...],
+            'jars': [path, ...]
         }
     """
+    try:
+        return parse_mod_info(content)
+    except ModInfoParseError:
+        pass
+    
     return {
         'id': extract_mod_id_from_text(content),
         'name': extract_mod_name_from_text(content),
         'version': extract_mod_version_from_text(content),
-        'gameVersion': extract_game_version_from_text(content)
+        'gameVersion': extract_game_version_from_text(content),
+        'dependencies': _extract_dependencies_with_regex(content),
+        'jars': []
     }
 
 
@@ -178,6 +188,9 @@ def compare_versions(version1, version2):
     """
     Compare two version strings using semantic versioning rules.
     
+    For sorting or picking the newest of many versions, use the key functions
+    in utils.version_key (version_key, sort_versions, max_version) instead.
+    
     Args:
         version1: First version string (e.g., "1.2.3" or "2.0a")
         version2: Second version string
@@ -196,24 +209,10 @@ def compare_versions(version1, version2):
     if version1 == version2:
         return 0
     
-    def parse_version(v):
-        """Parse version string into list of comparable parts."""
-        v = str(v).lower().replace('v', '').replace('version', '').strip()
-        parts = re.findall(r'\d+|[a-z]+', v)
-        return [int(p) if p.isdigit() else ord(p[0]) - ord('a') + 1 for p in parts]
-    
-    v1_parts = parse_version(version1)
-    v2_parts = parse_version(version2)
-    
-    # Compare parts using zip_longest
-    from itertools import zip_longest
-    for p1, p2 in zip_longest(v1_parts, v2_parts, fillvalue=0):
-        if p1 > p2:
-            return 1
-        elif p1 < p2:
-            return -1
-    
-    return 0
+    # Parsed keys are cached, so repeated comparisons don't re-parse
+    key1 = version_key(version1)
+    key2 = version_key(version2)
+    return (key1 > key2) - (key1 < key2)
 
 
 def is_mod_name_match(search_name, folder_name, installed_name=None):
@@ -246,72 +245,87 @@ def is_mod_name_match(search_name, folder_name, installed_name=None):
     return False
 
 
-def scan_installed_mods(mods_dir, filter_func=None):
+def map_ordered(func, items, max_workers=1):
+    """
+    Apply func to every item on a bounded thread pool, yielding results in input order.
+    
+    At most max_workers calls run at once and only a small window of results is
+    buffered ahead of the consumer, so the generator stays lazy. Closing the
+    generator early cancels the calls that have not started yet.
+    
+    Args:
+        func: Function called with one item
+        items: Iterable of items
+        max_workers: Number of worker threads (1 or less runs inline, without threads)
+        
+    Yields:
+        func(item) for each item, in the order of items
+    """
+    if max_workers is None or max_workers <= 1:
+        yield from map(func, items)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mod_scan")
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_installed_mods(mods_dir, filter_func=None, max_workers=1):
     """
     Scan installed mods directory and extract metadata from all mod_info.json files.
     
     This centralizes the common pattern of iterating through mods_dir, reading mod_info.json,
     and extracting metadata. Reduces code duplication across installer.py and main_window.py.
     
+    With max_workers > 1 the mod_info.json files are read concurrently, which hides
+    per-file latency on SMB/NFS-mounted installs; results are still yielded in
+    directory listing order.
+    
     Args:
         mods_dir: Path to Starsector mods directory
         filter_func: Optional function(folder, content) -> bool to filter mods.
                     Return True to include mod, False to skip.
+        max_workers: Number of concurrent reads (default: 1, sequential)
                     
     Yields:
-        tuple: (folder_path, mod_metadata_dict) for each valid mod
-               where mod_metadata_dict contains:
-               {
-                   'folder_name': str,
-                   'mod_id': str or None,
-                   'name': str or None,
-                   'version': str or None,
-                   'game_version': str or None,
-                   'content': str (raw mod_info.json content)
-               }
+        tuple: (folder_path, InstalledMod) for each valid mod. The record holds
+               the parsed fields; its raw mod_info.json text is re-read only if
+               the content attribute is accessed.
                
     Example:
-        >>> for folder, metadata in scan_installed_mods(mods_dir):
-        ...     print(f"Found {metadata['name']} v{metadata['version']}")
+        >>> for folder, mod in scan_installed_mods(mods_dir):
+        ...     print(f"Found {mod.name} v{mod.version}")
         
         >>> # With filter
         >>> def filter_by_id(folder, content):
         ...     return 'graphicslib' in content
-        >>> for folder, metadata in scan_installed_mods(mods_dir, filter_by_id):
-        ...     print(metadata['mod_id'])
+        >>> for folder, mod in scan_installed_mods(mods_dir, filter_by_id):
+        ...     print(mod.id)
     """
     if not mods_dir or not mods_dir.exists():
         return
     
-    for folder in mods_dir.iterdir():
-        # Skip hidden folders and non-directories
-        if not folder.is_dir() or folder.name.startswith('.'):
+    # Skip hidden folders; non-directories are skipped by the read
+    folders = [folder for folder in mods_dir.iterdir() if not folder.name.startswith('.')]
+    
+    for folder, content in zip(folders, map_ordered(read_mod_info_text, folders, max_workers)):
+        if content is None:
             continue
         
-        mod_info_file = folder / "mod_info.json"
-        if not mod_info_file.exists():
+        # Apply filter if provided
+        if filter_func and not filter_func(folder, content):
             continue
         
-        try:
-            with open(mod_info_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Apply filter if provided
-            if filter_func and not filter_func(folder, content):
-                continue
-            
-            # Extract all metadata at once
-            metadata = extract_all_metadata_from_text(content)
-            
-            # Add additional fields
-            metadata['folder_name'] = folder.name
-            metadata['content'] = content
-            
-            yield folder, metadata
-            
-        except (IOError, UnicodeDecodeError, PermissionError):
-            # Skip files we can't read
-            continue
+        # Extract all metadata at once; the raw text is not kept
+        yield folder, InstalledMod.from_metadata(folder, extract_all_metadata_from_text(content))
 
 
 def extract_dependencies_from_text(content):
@@ -328,6 +342,14 @@ def extract_dependencies_from_text(content):
         >>> extract_dependencies_from_text('"dependencies": ["lw_lazylib", "MagicLib"]')
         ['lw_lazylib', 'MagicLib']
     """
+    try:
+        return parse_mod_info(content)['dependencies']
+    except ModInfoParseError:
+        return _extract_dependencies_with_regex(content)
+
+
+def _extract_dependencies_with_regex(content):
+    """Regex fallback of extract_dependencies_from_text() for unparseable content."""
     dependencies = []
     
     # Look for "dependencies" array
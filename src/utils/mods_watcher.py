@@ -0,0 +1,323 @@
+"""
+Watcher for the Starsector mods directory.
+Reports which mod folders were added, removed or had their mod_info.json
+changed, so the installed-mods index and the mod list can be updated without
+rescanning everything. Uses inotify on Linux and falls back to polling.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Mods directory: folders appearing, disappearing or being renamed
+_ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+# Mod folders: mod_info.json being written, replaced or removed
+_FOLDER_MASK = IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+_MOD_INFO = "mod_info.json"
+
+_libc = None
+_libc_loaded = False
+
+
+def _load_libc():
+    """Return libc with the inotify functions, or None if unavailable."""
+    global _libc, _libc_loaded
+    if not _libc_loaded:
+        _libc_loaded = True
+        if sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                if hasattr(libc, 'inotify_init1') and hasattr(libc, 'inotify_add_watch'):
+                    _libc = libc
+            except OSError:
+                pass
+    return _libc
+
+
+def inotify_available():
+    """Return True if inotify can be used on this system."""
+    return _load_libc() is not None
+
+
+class _InotifyBackend:
+    """Kernel notifications for the mods directory and each mod folder."""
+
+    name = 'inotify'
+
+    def __init__(self, mods_dir):
+        self.libc = _load_libc()
+        if self.libc is None:
+            raise OSError("inotify is not available")
+        self.mods_dir = mods_dir
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._folders = {}  # watch descriptor -> mod folder name ('' for the mods directory)
+        self.root_lost = False
+        try:
+            self._add_watch('', _ROOT_MASK)
+        except OSError:
+            os.close(self.fd)
+            raise
+        for entry in os.scandir(mods_dir):
+            if entry.is_dir() and not entry.name.startswith('.'):
+                self._watch_folder(entry.name)
+
+    def _add_watch(self, folder_name, mask):
+        path = os.path.join(self.mods_dir, folder_name) if folder_name else str(self.mods_dir)
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._folders[wd] = folder_name
+
+    def _watch_folder(self, folder_name):
+        try:
+            self._add_watch(folder_name, _FOLDER_MASK)
+        except OSError:
+            # Folder already gone, or the watch limit is reached: the mods
+            # directory watch still reports the folder itself
+            pass
+
+    def wait(self, timeout):
+        """Wait up to timeout seconds for changes.
+
+        Returns:
+            set: Changed folder names (empty on timeout), or None if the events
+                 overflowed or the mods directory itself went away
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            folder = self._folders.get(wd)
+            if folder is None:
+                continue
+            if mask & IN_IGNORED:
+                # Watched folder was deleted or moved; the root event reports it
+                del self._folders[wd]
+                if folder == '':
+                    self.root_lost = True
+                    return None
+                continue
+
+            if folder == '':
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    self.root_lost = True
+                    return None
+                if not name or name.startswith('.'):
+                    continue
+                changed.add(name)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_folder(name)
+            elif name == _MOD_INFO:
+                changed.add(folder)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    """Periodic checks of the mods directory (any platform, network drives).
+
+    Each check stats only the mods directory: its mtime changes when mod
+    folders are added, removed or renamed. The mod_info.json of every folder
+    is stat'ed when that happens, and otherwise every full_scan_interval
+    seconds to pick up mods updated in place.
+    """
+
+    name = 'polling'
+
+    def __init__(self, mods_dir, stop_event, full_scan_interval=60.0):
+        self.mods_dir = mods_dir
+        self.stop_event = stop_event
+        self.full_scan_interval = full_scan_interval
+        self._dir_mtime = self._stat_dir()
+        self._snapshot = self._take_snapshot()
+        self._next_full_scan = time.monotonic() + full_scan_interval
+
+    def _stat_dir(self):
+        try:
+            return os.stat(self.mods_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _take_snapshot(self):
+        # folder name -> (mtime_ns, size) of its mod_info.json, None if it has none
+        snapshot = {}
+        try:
+            entries = list(os.scandir(self.mods_dir))
+        except OSError:
+            return snapshot
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            try:
+                stat = os.stat(os.path.join(entry.path, _MOD_INFO))
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot[entry.name] = None
+        return snapshot
+
+    def wait(self, timeout):
+        """Wait timeout seconds, then return the folders whose state changed."""
+        if self.stop_event.wait(timeout):
+            return set()
+        dir_mtime = self._stat_dir()
+        now = time.monotonic()
+        if dir_mtime == self._dir_mtime and now < self._next_full_scan:
+            return set()
+        self._dir_mtime = dir_mtime
+        self._next_full_scan = now + self.full_scan_interval
+        previous, self._snapshot = self._snapshot, self._take_snapshot()
+        return {name for name in previous.keys() | self._snapshot.keys()
+                if previous.get(name, 0) != self._snapshot.get(name, 0)}
+
+    def close(self):
+        pass
+
+
+class ModsFolderWatcher:
+    """Background watcher that reports changed mod folders.
+
+    Changes are collected until the folder has been quiet for a short while,
+    so an archive being unpacked (or TriOS installing a mod) is reported once.
+    The callback runs on the watcher thread; GUI code should hand it over to
+    the main thread (e.g. with root.after()).
+    """
+
+    def __init__(self, mods_dir, on_change, poll_interval=2.0, debounce=0.5, use_inotify=True,
+                 full_scan_interval=60.0):
+        """Initialize the watcher.
+
+        Args:
+            mods_dir: Path to Starsector mods directory
+            on_change: Callback(folder_names) with a set of changed folder names,
+                       or None when the watcher lost track and a full rescan is needed
+            poll_interval: Seconds between checks when polling
+            debounce: Seconds without new changes before they are reported
+            use_inotify: If False, always poll
+            full_scan_interval: Seconds between mod_info.json stat passes when polling
+                                and the mods directory itself did not change
+        """
+        self.mods_dir = Path(mods_dir)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.full_scan_interval = full_scan_interval
+        self.backend = None  # 'inotify' or 'polling' once started
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start watching in a daemon thread.
+
+        Returns:
+            str: Name of the backend in use ('inotify' or 'polling')
+        """
+        if self._thread is not None:
+            return self.backend
+        self._stop_event.clear()
+        backend = self._create_backend()
+        self._thread = threading.Thread(target=self._run, args=(backend,),
+                                        name="ModsFolderWatcher", daemon=True)
+        self._thread.start()
+        return self.backend
+
+    def stop(self, timeout=2.0):
+        """Stop watching and wait for the thread to exit."""
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _create_backend(self):
+        backend = None
+        if self.use_inotify and inotify_available():
+            try:
+                backend = _InotifyBackend(self.mods_dir)
+            except OSError:
+                # Missing directory, watch limit reached, ...
+                backend = None
+        if backend is None:
+            backend = _PollingBackend(self.mods_dir, self._stop_event, self.full_scan_interval)
+        self.backend = backend.name
+        return backend
+
+    def _run(self, backend):
+        pending = set()
+        rescan = False
+        quiet_since = None
+        try:
+            while not self._stop_event.is_set():
+                if pending or rescan:
+                    timeout = max(0.0, quiet_since + self.debounce - time.monotonic())
+                else:
+                    timeout = self.poll_interval
+                # inotify waits are capped so stop() is noticed quickly
+                changes = backend.wait(min(timeout, 0.5) if backend.name == 'inotify' else timeout)
+                if self._stop_event.is_set():
+                    break
+
+                if changes is None:
+                    rescan = True
+                    quiet_since = time.monotonic()
+                elif changes:
+                    pending |= changes
+                    quiet_since = time.monotonic()
+                elif (pending or rescan) and time.monotonic() - quiet_since >= self.debounce:
+                    report = None if rescan else pending
+                    pending, rescan = set(), False
+                    try:
+                        self.on_change(report)
+                    except Exception:
+                        # A failing consumer must not stop the watcher
+                        pass
+                    if getattr(backend, 'root_lost', False):
+                        # Mods directory was deleted or replaced: watch the new one
+                        backend.close()
+                        backend = self._create_backend()
+        finally:
+            backend.close()
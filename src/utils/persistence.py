@@ -0,0 +1,64 @@
+"""
+Helpers for the JSON files the installer keeps on disk and the shared stores
+that own them.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+
+def save_json_atomic(file_path, data, **dump_options):
+    """
+    Write data to a JSON file atomically.
+
+    The data is written to a temporary file next to the target, which then
+    replaces it, so a crash mid-write leaves the previous file intact.
+
+    Args:
+        file_path: Path of the target file (parent folders are created)
+        data: Data to serialize
+        **dump_options: Extra json.dump() arguments (e.g. indent, ensure_ascii)
+
+    Raises:
+        OSError: If the file cannot be written; the target is left unchanged
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f'.tmp_{file_path.stem}_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_options)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def shared_instance(factory):
+    """
+    Turn a factory into a getter of one process-wide instance.
+
+    The factory runs on the first call (under a lock, so concurrent first
+    calls still share one instance); later calls return the same object.
+
+    Example:
+        >>> @shared_instance
+        ... def get_store():
+        ...     return Store(CACHE_DIR)
+    """
+    lock = threading.Lock()
+    instance = []
+
+    @functools.wraps(factory)
+    def get():
+        with lock:
+            if not instance:
+                instance.append(factory())
+            return instance[0]
+
+    return get
@@ -0,0 +1,98 @@
+"""
+Pre-parsed, cached version keys.
+A version string is parsed once into a tuple that compares and sorts natively,
+with the same ordering as compare_versions().
+"""
+
+import re
+from functools import lru_cache
+
+
+_PART_RE = re.compile(r'\d+|[a-z]+')
+
+
+class VersionKey(tuple):
+    """Comparable form of a mod version string.
+
+    Each number becomes an int and each letter run becomes the position of its
+    first letter in the alphabet (a=1, b=2, ...), so "0.12.1b" -> (0, 12, 1, 2)
+    and "2.1.b" -> (2, 1, 2). Trailing zeros are dropped so that "1.0" and
+    "1.0.0" are equal, matching compare_versions() padding with zeros.
+
+    Use version_key() to get cached instances instead of parsing directly.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, version):
+        """Parse a version string (uncached).
+
+        Args:
+            version: Version string (other values are converted with str())
+
+        Returns:
+            VersionKey: Parsed key
+        """
+        v = str(version).lower().replace('v', '').replace('version', '').strip()
+        parts = [int(p) if p.isdigit() else ord(p[0]) - ord('a') + 1 for p in _PART_RE.findall(v)]
+        while parts and parts[-1] == 0:
+            parts.pop()
+        return cls(parts)
+
+
+@lru_cache(maxsize=4096)
+def _cached_key(version):
+    return VersionKey.parse(version)
+
+
+def version_key(version):
+    """
+    Return the cached VersionKey of a version string.
+
+    Repeated versions return the same interned key object, so comparing the
+    same versions again (e.g. in nested loops over a modlist) costs a dict lookup.
+
+    Args:
+        version: Version string (e.g., "1.2.3", "0.12.1b")
+
+    Returns:
+        VersionKey: Comparable key
+
+    Examples:
+        >>> version_key("1.2.3") > version_key("1.2.2")
+        True
+        >>> version_key("1.0") == version_key("1.0.0")
+        True
+    """
+    if isinstance(version, VersionKey):
+        return version
+    return _cached_key(version if isinstance(version, str) else str(version))
+
+
+def sort_versions(versions, reverse=False):
+    """
+    Sort version strings from oldest to newest (newest first if reverse).
+
+    Args:
+        versions: Iterable of version strings
+        reverse: If True, sort newest first
+
+    Returns:
+        list: Sorted version strings (equal versions keep their input order)
+    """
+    return sorted(versions, key=version_key, reverse=reverse)
+
+
+def max_version(versions, default=None):
+    """
+    Return the newest of several version strings.
+
+    Args:
+        versions: Iterable of version strings
+        default: Value returned if versions is empty
+
+    Returns:
+        str: The newest version (the first one if several are equal), or default
+    """
+    return max(versions, key=version_key, default=default)
@@ -0,0 +1,120 @@
+"""
+Shared test setup: puts src/ on the import path and provides fixtures that
+build mods folders with mod_info.json files and serve downloads locally.
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+import core.http_client as http_client
+import core.installer as installer_module
+
+
+GAME_VERSION = "0.98a-RC8"
+
+
+@pytest.fixture
+def mods_dir(tmp_path):
+    """Path of a Starsector mods folder inside tmp_path (created by the first write_mod)."""
+    return tmp_path / "mods"
+
+
+@pytest.fixture
+def write_mod(mods_dir):
+    """Return write_mod(folder, mod_id=None, version="1.0.0", name=None, content=None).
+
+    Creates (or overwrites) mods_dir/folder/mod_info.json. The generated file
+    has the given id (omitted when None), name (default: the folder name),
+    version and gameVersion; content replaces it with raw text.
+    """
+    def write(folder, mod_id=None, version="1.0.0", name=None, content=None):
+        mod_folder = mods_dir / folder
+        mod_folder.mkdir(parents=True, exist_ok=True)
+        if content is None:
+            data = {'id': mod_id} if mod_id is not None else {}
+            data.update(name=name or folder, version=version, gameVersion=GAME_VERSION)
+            content = json.dumps(data)
+        (mod_folder / "mod_info.json").write_text(content, encoding='utf-8')
+        return mod_folder
+    return write
+
+
+@pytest.fixture
+def write_mods(write_mod):
+    """Return write_mods(count), which creates folders Mod000.. with ids mod0.. and versions 1.<i>."""
+    def write(count):
+        return [write_mod(f"Mod{i:03d}", f"mod{i}", f"1.{i}", name=f"Mod {i}") for i in range(count)]
+    return write
+
+
+class LocalServer:
+    """HTTP server on 127.0.0.1 passing every GET and HEAD request to a handler.
+
+    Attributes:
+        base: URL of the server root (e.g. http://127.0.0.1:12345)
+        handle: Callable(request) answering a request, where request is the
+                BaseHTTPRequestHandler (command, path, headers, send_response,
+                wfile...); may be replaced while the server runs
+        requests: (method, path) of every request received
+    """
+
+    def __init__(self, handle, protocol_version='HTTP/1.0'):
+        self.handle = handle
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append((self.command, self.path))
+                server.handle(self)
+
+            do_HEAD = do_GET
+
+        Handler.protocol_version = protocol_version
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the server (later requests fail to connect); safe to call twice."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self._thread = None
+
+
+@pytest.fixture
+def http_server():
+    """Return serve(handle, protocol_version='HTTP/1.0'), which starts a LocalServer.
+
+    The servers are stopped after the test, and the shared HTTP session is
+    reset before and after it, so no pooled connection outlives its server.
+    """
+    servers = []
+    http_client.close_session()
+
+    def serve(handle, protocol_version='HTTP/1.0'):
+        server = LocalServer(handle, protocol_version)
+        servers.append(server)
+        return server
+
+    yield serve
+    for server in servers:
+        server.close()
+    http_client.close_session()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Skip the waits between download retries."""
+    monkeypatch.setattr(installer_module.time, "sleep", lambda seconds: None)
@@ -106,7 +106,9 @@ def test_extract_zip_success(tmp_path, monkeypatch):
             yield zip_bytes
         def raise_for_status(self):
             return None
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -133,7 +135,9 @@ def test_zip_slip_blocked(tmp_path, monkeypatch):
             yield zip_bytes
         def raise_for_status(self):
             return None
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -152,7 +156,9 @@ def test_network_error(tmp_path, monkeypatch):
     class FakeResp:
         def raise_for_status(self):
             raise Exception("Network down")
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -175,7 +181,9 @@ def test_already_installed_single_root(tmp_path, monkeypatch):
             yield zip_bytes
         def raise_for_status(self):
             return None
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -198,7 +206,9 @@ def test_overlap_at_root(tmp_path, monkeypatch):
             yield zip_bytes
         def raise_for_status(self):
             return None
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -235,7 +245,9 @@ def test_extract_7z_if_available(tmp_path, monkeypatch):
             yield data
         def raise_for_status(self):
             return None
-    monkeypatch.setattr("src.core.installer.requests.get", lambda url, stream=True, timeout=30: FakeResp())
+        def close(self):
+            pass
+    monkeypatch.setattr("requests.Session.get", lambda self, url, stream=True, timeout=30: FakeResp())
 
     logs = Logger()
     installer = ModInstaller(logs)
@@ -339,7 +351,7 @@ class TestCompleteWorkflows:
         log_mock = Mock()
         installer = ModInstaller(log_mock)
         
-        with patch('src.core.installer.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Mock successful download
             mock_response = Mock()
             mock_response.iter_content = lambda chunk_size: [b'fake_zip_data']
@@ -463,7 +475,7 @@ class TestInstallationScenarios:
         
         mod = {'name': 'TestMod', 'download_url': 'https://example.com/testmod.zip'}
         
-        with patch('src.core.installer.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Simulate network timeout
             mock_get.side_effect = Exception("Connection timeout")
             
@@ -0,0 +1,137 @@
+"""
+Tests for revalidating installed archives with conditional requests
+(If-None-Match / If-Modified-Since answered by 304 Not Modified).
+"""
+
+import io
+import os
+import shutil
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+from core.installer import ModInstaller
+from core.url_validators import UrlValidatorStore
+
+
+def make_zip(version):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr("LazyLib/mod_info.json", f'{{"id": "lw_lazylib", "version": "{version}"}}')
+    return buffer.getvalue()
+
+
+class Release:
+    """A "latest release" archive served with an ETag, answering If-None-Match.
+
+    Attributes:
+        requests: If-None-Match header of every request received
+    """
+
+    def __init__(self, body, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def handle(self, request):
+        if_none_match = request.headers.get('If-None-Match')
+        self.requests.append(if_none_match)
+        if if_none_match == self.etag:
+            request.send_response(304)
+            request.send_header('ETag', self.etag)
+            request.end_headers()
+            return
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', str(len(self.body)))
+        request.send_header('ETag', self.etag)
+        request.end_headers()
+        request.wfile.write(self.body)
+
+
+@pytest.fixture
+def serve(http_server):
+    """Return serve(release), which serves a Release and returns its download URL."""
+    return lambda release: http_server(release.handle).base + "/releases/latest/download/LazyLib.zip"
+
+
+@pytest.fixture
+def installer(tmp_path):
+    return ModInstaller(Mock(), url_validators=UrlValidatorStore(tmp_path / "url_validators.json"))
+
+
+def install(installer, url, mods_dir):
+    """Download and extract like the installer; returns the download sentinel or extract result."""
+    temp_path, is_7z = installer.download_archive({'name': 'LazyLib', 'download_url': url}, mods_dir=mods_dir)
+    if temp_path in (None, 'UNCHANGED'):
+        return temp_path
+    try:
+        return installer.extract_archive(temp_path, mods_dir, is_7z)
+    finally:
+        os.unlink(temp_path)
+
+
+def test_store_needs_the_installed_folders(tmp_path, mods_dir):
+    store = UrlValidatorStore(tmp_path / "url_validators.json")
+    validators = {'etag': '"v1"', 'last_modified': 'Tue, 01 Jul 2025 10:00:00 GMT'}
+    store.record("https://example.com/a.zip", validators, mods_dir, {"LazyLib"})
+
+    # Folder not there (deleted by the user): download again
+    assert store.conditional_headers("https://example.com/a.zip", mods_dir) is None
+    (mods_dir / "LazyLib").mkdir(parents=True)
+    expected = {'If-None-Match': '"v1"', 'If-Modified-Since': 'Tue, 01 Jul 2025 10:00:00 GMT'}
+    assert store.conditional_headers("https://example.com/a.zip", mods_dir) == expected
+    # Records persist, and are kept per mods folder
+    reopened = UrlValidatorStore(tmp_path / "url_validators.json")
+    assert reopened.conditional_headers("https://example.com/a.zip", mods_dir) == expected
+    assert reopened.conditional_headers("https://example.com/a.zip", tmp_path / "other_mods") is None
+    assert reopened.conditional_headers("https://example.com/b.zip", mods_dir) is None
+
+
+def test_validators_need_etag_or_last_modified():
+    assert UrlValidatorStore.validators({'Content-Length': '10'}) is None
+    assert UrlValidatorStore.validators({'ETag': '"a"'}) == {'etag': '"a"', 'last_modified': None}
+
+
+def test_unchanged_release_is_not_downloaded_again(installer, mods_dir, serve):
+    mods_dir.mkdir()
+    release = Release(make_zip("1.0.0"))
+    url = serve(release)
+    assert install(installer, url, mods_dir) is True
+    assert install(installer, url, mods_dir) == 'UNCHANGED'
+
+    assert release.requests == [None, '"v1"']
+
+
+def test_new_release_is_downloaded(installer, mods_dir, serve):
+    mods_dir.mkdir()
+    release = Release(make_zip("1.0.0"))
+    url = serve(release)
+    assert install(installer, url, mods_dir) is True
+    release.body, release.etag = make_zip("1.1.0"), '"v2"'
+    assert install(installer, url, mods_dir) is True
+    # The new release's validators replace the old ones
+    assert install(installer, url, mods_dir) == 'UNCHANGED'
+
+    assert release.requests == [None, '"v1"', '"v2"']
+    assert '"1.1.0"' in (mods_dir / "LazyLib" / "mod_info.json").read_text()
+
+
+def test_skipped_archive_is_recorded_too(installer, write_mod, mods_dir, serve):
+    write_mod("LazyLib", "lw_lazylib", "1.0.0")
+    release = Release(make_zip("1.0.0"))
+    url = serve(release)
+    assert install(installer, url, mods_dir) == 'skipped'
+    assert install(installer, url, mods_dir) == 'UNCHANGED'
+
+
+def test_removed_mod_is_downloaded_again(installer, mods_dir, serve):
+    mods_dir.mkdir()
+    release = Release(make_zip("1.0.0"))
+    url = serve(release)
+    assert install(installer, url, mods_dir) is True
+    shutil.rmtree(mods_dir / "LazyLib")
+    assert install(installer, url, mods_dir) is True
+
+    assert release.requests == [None, None]
@@ -0,0 +1,165 @@
+"""
+Tests for the mod dependency graph and the dependency-ready extraction scheduler.
+"""
+
+from utils.dependency_graph import DependencyGraph, DependencyScheduler
+from utils.installed_mod import InstalledMod
+
+
+def build_graph(edges):
+    graph = DependencyGraph()
+    for mod_id, deps in edges.items():
+        graph.add_mod(mod_id, deps)
+    return graph
+
+
+def test_from_mods_merges_modlist_and_installed():
+    installed = [InstalledMod("/mods/Nex", id="nexerelin", dependencies=("lw_lazylib", "MagicLib"))]
+    modlist = [{'mod_id': 'nexerelin', 'dependencies': ['shaderLib']}, {'name': 'No id'}]
+
+    graph = DependencyGraph.from_mods(modlist, installed)
+
+    assert graph.dependencies('nexerelin') == ['lw_lazylib', 'MagicLib', 'shaderLib']
+    assert 'MagicLib' in graph
+    assert graph.dependents('MagicLib') == ['nexerelin']
+
+
+def test_transitive_dependencies_lists_dependencies_first():
+    graph = build_graph({'nex': ['magic', 'lazy'], 'magic': ['lazy'], 'lazy': []})
+
+    assert graph.transitive_dependencies('nex') == ['lazy', 'magic']
+    assert graph.transitive_dependencies('lazy') == []
+    assert graph.transitive_dependencies('unknown') == []
+
+
+def test_missing_dependencies_include_indirect_ones():
+    graph = build_graph({'nex': ['magic'], 'magic': ['lazy'], 'ships': ['magic']})
+
+    missing = graph.missing_dependencies(['nex', 'ships'], {'nex', 'ships', 'magic'})
+
+    assert missing == {'nex': ['lazy'], 'ships': ['lazy']}
+
+
+def test_find_cycles():
+    graph = build_graph({'a': ['b'], 'b': ['c'], 'c': ['a'], 'd': ['d'], 'e': ['a']})
+
+    assert graph.find_cycles() == [['a', 'b', 'c'], ['d']]
+    assert build_graph({'a': ['b'], 'b': []}).find_cycles() == []
+
+
+def test_topological_order_puts_dependencies_first():
+    graph = build_graph({'nex': ['magic', 'lazy'], 'ships': ['magic'], 'magic': ['lazy'], 'lazy': []})
+
+    order = graph.topological_order()
+
+    assert sorted(order) == ['lazy', 'magic', 'nex', 'ships']
+    for mod_id in order:
+        for dep in graph.dependencies(mod_id):
+            assert order.index(dep) < order.index(mod_id)
+    assert graph.topological_order(['ships', 'lazy']) == ['lazy', 'ships']
+
+
+def test_topological_order_with_cycle_keeps_dependents_after_it():
+    graph = build_graph({'user': ['a'], 'a': ['b'], 'b': ['a', 'base'], 'base': []})
+
+    order = graph.topological_order()
+
+    assert order[0] == 'base'
+    assert set(order[1:3]) == {'a', 'b'}
+    assert order[3] == 'user'
+
+
+def test_scheduler_holds_mods_until_batch_dependencies_finish():
+    graph = build_graph({'nex': ['lazy'], 'lazy': []})
+    scheduler = DependencyScheduler(graph, ['nex', 'lazy'])
+
+    scheduler.add('nex', 'nex.zip')
+    assert scheduler.pop_ready() == []
+
+    scheduler.add('lazy', 'lazy.zip')
+    assert scheduler.pop_ready() == ['lazy.zip']
+
+    scheduler.finish('lazy')
+    assert scheduler.pop_ready() == ['nex.zip']
+    assert len(scheduler) == 0
+
+
+def test_scheduler_ignores_dependencies_outside_batch():
+    graph = build_graph({'nex': ['lazy']})
+    scheduler = DependencyScheduler(graph, ['nex'])
+
+    scheduler.add('nex', 'nex.zip')
+    scheduler.add(None, 'unknown.zip')
+
+    assert scheduler.pop_ready() == ['nex.zip', 'unknown.zip']
+
+
+def test_scheduler_learns_dependencies_from_archives():
+    scheduler = DependencyScheduler(DependencyGraph(), ['ships', 'magic'])
+
+    scheduler.add('ships', 'ships.zip', dependencies=['MagicLib'])
+    assert scheduler.pop_ready() == ['ships.zip']
+
+    scheduler.add('nex', 'nex.zip', dependencies=['magic'])
+    assert scheduler.pop_ready() == []
+
+
+def test_scheduler_cycle_members_do_not_block_each_other():
+    graph = build_graph({'a': ['b'], 'b': ['a']})
+    scheduler = DependencyScheduler(graph, ['a', 'b'])
+
+    scheduler.add('a', 'a.zip')
+    scheduler.add('b', 'b.zip')
+
+    assert scheduler.pop_ready() == ['a.zip', 'b.zip']
+
+
+def test_scheduler_drain_returns_dependencies_first():
+    graph = build_graph({'nex': ['magic'], 'magic': ['lazy'], 'lazy': []})
+    scheduler = DependencyScheduler(graph, ['nex', 'magic', 'lazy', 'other'])
+
+    scheduler.add('nex', 'nex.zip')
+    scheduler.add('magic', 'magic.zip')
+    scheduler.add(None, 'unknown.zip')
+
+    assert scheduler.pop_ready() == ['unknown.zip']
+    scheduler.add('lazy', 'lazy.zip')
+    scheduler.finish('other')
+    assert scheduler.drain() == ['lazy.zip', 'magic.zip', 'nex.zip']
+    assert scheduler.drain() == []
+
+
+def test_scheduler_computes_closures_once_per_add(monkeypatch):
+    graph = build_graph({'nex': ['magic'], 'magic': ['lazy'], 'lazy': []})
+    scheduler = DependencyScheduler(graph, ['nex', 'magic', 'lazy'])
+    calls = []
+    original = graph.transitive_dependencies
+    monkeypatch.setattr(graph, 'transitive_dependencies', lambda mod_id: calls.append(mod_id) or original(mod_id))
+
+    scheduler.add('nex', 'nex.zip')
+    assert scheduler.pop_ready() == []
+    computed = len(calls)
+    for _ in range(3):
+        assert scheduler.pop_ready() == []
+    assert len(calls) == computed
+    assert len(set(calls)) == computed
+
+    # New dependencies invalidate the cached closures
+    calls.clear()
+    scheduler.add('magic', 'magic.zip', dependencies=['ships'])
+    scheduler.finish('lazy')
+    assert scheduler.pop_ready() == ['magic.zip']
+    assert 'magic' in calls
+    assert 'ships' in graph.transitive_dependencies('nex')
+
+
+def test_scheduler_failed_mod_releases_dependents():
+    graph = build_graph({'nex': ['lazy'], 'lazy': []})
+    scheduler = DependencyScheduler(graph, ['nex', 'lazy'])
+
+    scheduler.add('nex', 'nex.zip')
+    assert scheduler.pop_ready() == []
+
+    # lazy's download failed: it is finished without ever being queued
+    scheduler.finish('lazy')
+    assert scheduler.pop_ready() == ['nex.zip']
@@ -0,0 +1,207 @@
+"""
+Tests for the content-addressed download cache.
+"""
+
+import hashlib
+import io
+import os
+import zipfile
+from unittest.mock import Mock, patch
+
+from core.download_cache import DownloadCache
+from core.installer import ModInstaller
+
+
+VALIDATORS = {'etag': '"v1"', 'last_modified': None, 'content_length': '5'}
+
+
+def write_file(path, data):
+    path.write_bytes(data)
+    return path, hashlib.sha256(data).hexdigest()
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def make_zip():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr("LazyLib/mod_info.json", '{"id": "lw_lazylib", "version": "3.0.0"}')
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, body, headers):
+        self.body = body
+        self.headers = headers
+        self.status_code = 200
+        self.body_reads = 0
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        self.body_reads += 1
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+def test_validators_need_etag_or_last_modified():
+    assert DownloadCache.validators({'Content-Length': '10'}) is None
+    assert DownloadCache.validators({'ETag': '"a"', 'Content-Length': '10'}) == {
+        'etag': '"a"', 'last_modified': None, 'content_length': '10'
+    }
+
+
+def test_store_and_checkout(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    source, digest = write_file(tmp_path / "mod.zip", b"hello")
+
+    assert cache.store("https://example.com/mod.zip", VALIDATORS, source, digest)
+    temp_path, is_7z = cache.checkout("https://example.com/mod.zip", VALIDATORS, '.zip')
+    try:
+        assert read_bytes(temp_path) == b"hello"
+        assert temp_path.endswith('.zip') and is_7z is False
+    finally:
+        os.unlink(temp_path)
+
+    # Deleting the checked out copy keeps the cached archive
+    os.unlink(cache.checkout("https://example.com/mod.zip", VALIDATORS)[0])
+    changed = dict(VALIDATORS, etag='"v2"')
+    assert cache.checkout("https://example.com/mod.zip", changed) is None
+    assert cache.checkout("https://example.com/other.zip", VALIDATORS) is None
+
+
+def test_same_content_is_stored_once(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    source, digest = write_file(tmp_path / "mod.zip", b"hello")
+
+    cache.store("https://a.example/mod.zip", VALIDATORS, source, digest)
+    cache.store("https://b.example/mod.zip", VALIDATORS, source, digest)
+
+    assert cache.stats()['archives'] == 1
+    assert cache.stats()['urls'] == 2
+    assert cache.stats()['size_bytes'] == 5
+
+
+def test_least_recently_used_archive_is_evicted(tmp_path, monkeypatch):
+    cache = DownloadCache(tmp_path / "cache", max_bytes=10)
+    clock = iter(range(100))
+    monkeypatch.setattr("core.download_cache.time.time", lambda: next(clock))
+
+    first, first_digest = write_file(tmp_path / "a.zip", b"aaaa")
+    second, second_digest = write_file(tmp_path / "b.zip", b"bbbb")
+    third, third_digest = write_file(tmp_path / "c.zip", b"cccc")
+    cache.store("https://example.com/a.zip", VALIDATORS, first, first_digest)
+    cache.store("https://example.com/b.zip", VALIDATORS, second, second_digest)
+    # Using a.zip makes b.zip the least recently used archive
+    os.unlink(cache.checkout("https://example.com/a.zip", VALIDATORS)[0])
+    cache.store("https://example.com/c.zip", VALIDATORS, third, third_digest)
+
+    assert {entry['url'] for entry in cache.entries()} == {"https://example.com/a.zip", "https://example.com/c.zip"}
+    assert cache.stats()['size_bytes'] == 8
+    assert not cache._object_path(second_digest).exists()
+
+
+def test_archives_above_the_cap_are_not_cached(tmp_path):
+    cache = DownloadCache(tmp_path / "cache", max_bytes=3)
+    source, digest = write_file(tmp_path / "mod.zip", b"hello")
+    assert not cache.store("https://example.com/mod.zip", VALIDATORS, source, digest)
+    assert cache.stats()['archives'] == 0
+
+
+def test_new_version_replaces_the_old_archive(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    old, old_digest = write_file(tmp_path / "old.zip", b"old!!")
+    new, new_digest = write_file(tmp_path / "new.zip", b"new!!")
+
+    cache.store("https://example.com/latest.zip", VALIDATORS, old, old_digest)
+    cache.store("https://example.com/latest.zip", dict(VALIDATORS, etag='"v2"'), new, new_digest)
+
+    assert cache.stats()['archives'] == 1
+    assert not cache._object_path(old_digest).exists()
+
+
+def test_index_persists_and_purge_empties_the_cache(tmp_path):
+    source, digest = write_file(tmp_path / "mod.zip", b"hello")
+    DownloadCache(tmp_path / "cache").store("https://example.com/mod.zip", VALIDATORS, source, digest)
+
+    reopened = DownloadCache(tmp_path / "cache")
+    assert reopened.stats()['archives'] == 1
+    assert reopened.purge() == 5
+    assert reopened.stats()['archives'] == 0
+    assert DownloadCache(tmp_path / "cache").checkout("https://example.com/mod.zip", VALIDATORS) is None
+
+
+def test_second_download_is_served_from_cache(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    installer = ModInstaller(Mock(), download_cache=cache)
+    body = make_zip()
+    headers = {'Content-Type': 'application/zip', 'ETag': '"abc"', 'Content-Length': str(len(body))}
+    mod = {'name': 'LazyLib', 'download_url': 'https://example.com/LazyLib.zip'}
+
+    first = FakeResponse(body, headers)
+    with patch('requests.Session.get', return_value=first):
+        path, _ = installer.download_archive(mod)
+    os.unlink(path)
+    assert first.body_reads == 1
+
+    second = FakeResponse(body, headers)
+    with patch('requests.Session.get', return_value=second):
+        path, is_7z = installer.download_archive(mod)
+    try:
+        assert second.body_reads == 0
+        assert read_bytes(path) == body
+        assert is_7z is False
+    finally:
+        os.unlink(path)
+
+
+def test_cached_archive_is_revalidated_without_a_body(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    installer = ModInstaller(Mock(), download_cache=cache)
+    body = make_zip()
+    headers = {'Content-Type': 'application/zip', 'ETag': '"abc"', 'Content-Length': str(len(body))}
+    mod = {'name': 'LazyLib', 'download_url': 'https://example.com/LazyLib.zip'}
+    with patch('requests.Session.get', return_value=FakeResponse(body, headers)) as get:
+        path, _ = installer.download_archive(mod)
+    os.unlink(path)
+    assert 'headers' not in get.call_args.kwargs
+
+    not_modified = FakeResponse(b'', {'ETag': '"abc"'})
+    not_modified.status_code = 304
+    with patch('requests.Session.get', return_value=not_modified) as get:
+        path, _ = installer.download_archive(mod)
+    try:
+        assert get.call_count == 1
+        assert get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+        assert not_modified.body_reads == 0
+        assert read_bytes(path) == body
+    finally:
+        os.unlink(path)
+
+    # A new upload answers the same request with its body
+    changed = FakeResponse(body, dict(headers, ETag='"def"'))
+    with patch('requests.Session.get', return_value=changed) as get:
+        path, _ = installer.download_archive(mod)
+    os.unlink(path)
+    assert get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+    assert changed.body_reads == 1
+    assert cache.conditional_headers(mod['download_url']) == {'If-None-Match': '"def"'}
+
+
+def test_downloads_without_validators_are_not_cached(tmp_path):
+    cache = DownloadCache(tmp_path / "cache")
+    installer = ModInstaller(Mock(), download_cache=cache)
+    body = make_zip()
+
+    with patch('requests.Session.get', return_value=FakeResponse(body, {'Content-Type': 'application/zip'})):
+        path, _ = installer.download_archive({'name': 'X', 'download_url': 'https://example.com/x.zip'})
+    os.unlink(path)
+
+    assert cache.stats()['archives'] == 0
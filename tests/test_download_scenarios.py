@@ -26,7 +26,7 @@ class TestDownloadScenarios:
             {'name': 'Mod3', 'download_url': 'http://example.com/mod3.zip'}
         ]
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Mock successful downloads
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -52,7 +52,7 @@ class TestDownloadScenarios:
         
         mod = {'name': 'SlowMod', 'download_url': 'http://slow.example.com/mod.zip'}
         
-        with patch('requests.get', side_effect=Exception("Timeout")):
+        with patch('requests.Session.get', side_effect=Exception("Timeout")):
             temp_path, is_7z = installer.download_archive(mod)
             
             # Download should fail gracefully
@@ -68,7 +68,7 @@ class TestDownloadScenarios:
         
         mod = {'name': 'MissingMod', 'download_url': 'http://example.com/missing.zip'}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_response.raise_for_status.side_effect = Exception("404 Not Found")
@@ -86,7 +86,7 @@ class TestDownloadScenarios:
         
         mod = {'name': 'Compressed', 'download_url': 'http://example.com/mod.7z'}
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {'Content-Type': 'application/x-7z-compressed'}
@@ -114,7 +114,7 @@ class TestDownloadScenarios:
         mock_response.headers = {'Content-Type': 'text/html'}
         mock_response.raise_for_status = MagicMock()
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             temp_path, is_7z = installer.download_archive(gdrive_mod)
         
         # Should return GDRIVE_HTML indicator
@@ -137,7 +137,7 @@ class TestDownloadScenarios:
         mock_response.raise_for_status = MagicMock()
         mock_response.iter_content = MagicMock(return_value=[b'fake html'])
         
-        with patch('requests.get', return_value=mock_response), \
+        with patch('requests.Session.get', return_value=mock_response), \
              patch('tempfile.mkstemp', return_value=(99, '/tmp/test.zip')):
             temp_path, is_7z = installer.download_archive(regular_mod)
         
@@ -156,7 +156,7 @@ class TestURLValidation:
             {'name': 'OtherMod', 'download_url': 'https://example.com/mod.zip'}
         ]
         
-        with patch('requests.head') as mock_head:
+        with patch('requests.Session.head') as mock_head:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_head.return_value = mock_response
@@ -188,7 +188,7 @@ class TestURLValidation:
                 mock_resp.status_code = 200
                 return mock_resp
         
-        with patch('requests.head', side_effect=mock_request):
+        with patch('requests.Session.head', side_effect=mock_request):
             results = validate_mod_urls(mods)
             
             # Should have retried (call_count will be 2+ due to retry logic)
@@ -201,7 +201,7 @@ class TestURLValidation:
             {'name': 'BlockedMod', 'download_url': 'http://example.com/mod.zip'}
         ]
         
-        with patch('requests.head') as mock_head, patch('requests.get') as mock_get:
+        with patch('requests.Session.head') as mock_head, patch('requests.Session.get') as mock_get:
             # HEAD returns 403
             mock_head_response = MagicMock()
             mock_head_response.status_code = 403
@@ -238,7 +238,7 @@ class TestURLValidation:
             {'name': 'Mod3', 'download_url': 'https://other.site/mod3.zip'}
         ]
         
-        with patch('requests.head') as mock_head:
+        with patch('requests.Session.head') as mock_head:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_head.return_value = mock_response
@@ -260,7 +260,7 @@ class TestConcurrentDownloads:
         mods = [{'name': f'Mod{i}', 'download_url': f'http://example.com/mod{i}.zip'} 
                 for i in range(10)]
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {'Content-Type': 'application/zip'}
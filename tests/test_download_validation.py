@@ -0,0 +1,114 @@
+"""
+Tests for URL validation folded into the downloads (DownloadValidationReport).
+"""
+
+import io
+import os
+import socket
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+from core.installer import DownloadValidationReport, ModInstaller
+from core.url_validators import UrlValidatorStore
+
+
+def make_zip():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr("LazyLib/mod_info.json", '{"id": "lw_lazylib", "version": "1.0.0"}')
+    return buffer.getvalue()
+
+
+ARCHIVE = make_zip()
+
+
+def serve_archive(request):
+    """Serve /mod.zip (with an ETag, answering If-None-Match) and 404 elsewhere."""
+    if request.command == 'HEAD':
+        request.send_response(200)
+        request.end_headers()
+    elif request.path != '/mod.zip':
+        request.send_response(404)
+        request.send_header('Content-Length', '0')
+        request.end_headers()
+    elif request.headers.get('If-None-Match') == '"v1"':
+        request.send_response(304)
+        request.end_headers()
+    else:
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', str(len(ARCHIVE)))
+        request.send_header('ETag', '"v1"')
+        request.end_headers()
+        request.wfile.write(ARCHIVE)
+
+
+@pytest.fixture
+def server(http_server, no_backoff):
+    return http_server(serve_archive)
+
+
+def test_report_categories_match_validate_mod_urls():
+    report = DownloadValidationReport()
+    github = {'name': 'A', 'download_url': 'https://github.com/a/a/releases/latest/download/a.zip'}
+    gdrive = {'name': 'B', 'download_url': 'https://drive.google.com/uc?id=1'}
+    other = {'name': 'C', 'download_url': 'https://example.com/c.zip'}
+    missing = {'name': 'D', 'download_url': 'https://example.com/d.zip'}
+    report.record(github, 200)
+    report.record(gdrive, 304)
+    report.record(other, 206)
+    report.record(missing, 404)
+
+    assert report.results == {
+        'github': [github],
+        'google_drive': [gdrive],
+        'other': {'example.com': [other]},
+        'failed': [{'mod': missing, 'status': 404, 'error': 'HTTP 404'}],
+    }
+
+
+def test_download_response_is_the_url_check(server):
+    report = DownloadValidationReport()
+    mod = {'name': 'LazyLib', 'download_url': server.base + '/mod.zip'}
+    temp_path, _ = ModInstaller(Mock()).download_archive(mod, report=report)
+    os.unlink(temp_path)
+
+    # One GET, no HEAD or ranged GET before it
+    assert server.requests == [('GET', '/mod.zip')]
+    assert report.results['other'] == {server.base[len('http://'):]: [mod]}
+    assert report.results['failed'] == []
+
+
+def test_http_error_is_reported_once(server):
+    report = DownloadValidationReport()
+    mod = {'name': 'Gone', 'download_url': server.base + '/gone.zip'}
+    assert ModInstaller(Mock()).download_archive(mod, report=report) == (None, False)
+
+    assert report.results['failed'] == [{'mod': mod, 'status': 404, 'error': 'HTTP 404'}]
+
+
+def test_unreachable_host_is_reported_as_failed(no_backoff):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    report = DownloadValidationReport()
+    mod = {'name': 'Offline', 'download_url': f"http://127.0.0.1:{port}/mod.zip"}
+    assert ModInstaller(Mock()).download_archive(mod, report=report) == (None, False)
+
+    failed, = report.results['failed']
+    assert failed['mod'] is mod and failed['status'] == 0 and failed['error']
+
+
+def test_conditional_request_counts_as_reachable(tmp_path, mods_dir, server):
+    (mods_dir / "LazyLib").mkdir(parents=True)
+    store = UrlValidatorStore(tmp_path / "url_validators.json")
+    report = DownloadValidationReport()
+    mod = {'name': 'LazyLib', 'download_url': server.base + '/mod.zip'}
+    store.record(mod['download_url'], {'etag': '"v1"', 'last_modified': None}, mods_dir, {"LazyLib"})
+    result = ModInstaller(Mock(), url_validators=store).download_archive(mod, mods_dir=mods_dir, report=report)
+
+    assert result == ('UNCHANGED', False)
+    assert server.requests == [('GET', '/mod.zip')]
+    assert report.results['failed'] == [] and len(report.results['other']) == 1
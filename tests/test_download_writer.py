@@ -0,0 +1,127 @@
+"""
+Tests for the buffered download write path (readinto into a reusable buffer).
+"""
+
+import gzip
+import hashlib
+import random
+import threading
+
+import pytest
+import requests
+
+import core.download_writer as download_writer
+import core.http_client as http_client
+from core.download_writer import copy_response, preallocate
+
+
+BODY = random.Random(0).randbytes(300 * 1024)
+
+
+def serve_body(request):
+    """Answer /full, /short (cut off halfway), /gzip and /chunked with BODY."""
+    body = BODY
+    request.send_response(200)
+    if request.path == '/gzip':
+        body = gzip.compress(BODY)
+        request.send_header('Content-Encoding', 'gzip')
+    if request.path == '/chunked':
+        request.send_header('Transfer-Encoding', 'chunked')
+        request.end_headers()
+        for start in range(0, len(body), 50000):
+            piece = body[start:start + 50000]
+            request.wfile.write(b'%x\r\n%s\r\n' % (len(piece), piece))
+        request.wfile.write(b'0\r\n\r\n')
+        return
+    request.send_header('Content-Length', str(len(body)))
+    request.end_headers()
+    if request.path == '/short':
+        request.wfile.write(body[:len(body) // 2])
+        request.close_connection = True
+        return
+    request.wfile.write(body)
+
+
+@pytest.fixture
+def server(http_server):
+    """Keep-alive HTTP/1.1 server answering with serve_body()."""
+    return http_server(serve_body, protocol_version='HTTP/1.1')
+
+
+@pytest.fixture(autouse=True)
+def small_buffer(monkeypatch):
+    # Several buffer fills per body
+    monkeypatch.setattr(download_writer, "DOWNLOAD_BUFFER_BYTES", 64 * 1024)
+    monkeypatch.setattr(download_writer, "_buffers", threading.local())
+
+
+def fetch(url, path, **kwargs):
+    hasher = hashlib.sha256()
+    response = http_client.get_session().get(url, stream=True, timeout=5)
+    try:
+        with open(path, 'wb') as f:
+            try:
+                return copy_response(response, f, hasher=hasher, **kwargs), hasher.hexdigest()
+            finally:
+                f.truncate()
+    finally:
+        response.close()
+
+
+def test_body_is_written_and_hashed(tmp_path, server):
+    for path in ('/full', '/chunked'):
+        written, digest = fetch(server.base + path, tmp_path / "archive.zip")
+        assert written == len(BODY)
+        assert (tmp_path / "archive.zip").read_bytes() == BODY
+        assert digest == hashlib.sha256(BODY).hexdigest()
+
+
+def test_plain_responses_take_the_buffered_path(server):
+    # _raw_reader relies on urllib3 keeping the http.client response in raw._fp;
+    # if that changes, every download silently falls back to iter_content
+    for path, buffered in (('/full', True), ('/chunked', True), ('/gzip', False)):
+        response = http_client.get_session().get(server.base + path, stream=True, timeout=5)
+        try:
+            assert (download_writer._raw_reader(response) is not None) is buffered
+        finally:
+            response.close()
+
+
+def test_connection_is_reused_after_a_full_body(tmp_path, http_server):
+    connections = set()
+
+    def record_connection(request):
+        connections.add(request.client_address)
+        serve_body(request)
+
+    server = http_server(record_connection, protocol_version='HTTP/1.1')
+    for _ in range(3):
+        fetch(server.base + '/full', tmp_path / "archive.zip")
+    assert len(connections) == 1
+
+
+def test_limit_stops_after_the_range(tmp_path, server):
+    written, _ = fetch(server.base + '/full', tmp_path / "archive.zip", limit=100000)
+    assert written == 100000
+    assert (tmp_path / "archive.zip").read_bytes() == BODY[:100000]
+
+
+def test_short_body_raises_and_keeps_the_received_bytes(tmp_path, server):
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fetch(server.base + '/short', tmp_path / "archive.zip")
+    assert (tmp_path / "archive.zip").read_bytes() == BODY[:len(BODY) // 2]
+
+
+def test_compressed_body_is_decoded(tmp_path, server):
+    written, _ = fetch(server.base + '/gzip', tmp_path / "archive.zip")
+    assert written == len(BODY)
+    assert (tmp_path / "archive.zip").read_bytes() == BODY
+
+
+def test_preallocate_reserves_the_size(tmp_path):
+    with open(tmp_path / "archive.zip.part", 'wb') as f:
+        preallocate(f, 123456)
+        assert (tmp_path / "archive.zip.part").stat().st_size == 123456
+        f.write(b'abc')
+        f.truncate()
+    assert (tmp_path / "archive.zip.part").read_bytes() == b'abc'
@@ -0,0 +1,236 @@
+"""
+Tests for per-host concurrency limits and the adaptive host scheduler.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import core.host_scheduler as host_scheduler
+import core.installer as installer_module
+from core.constants import HOST_BREAKER_THRESHOLD
+from core.host_scheduler import HostCircuitBreaker, HostLimits, HostScheduler, host_of
+from core.installer import validate_mod_urls
+
+
+@pytest.fixture(autouse=True)
+def fresh_host_limits(monkeypatch):
+    monkeypatch.setattr(host_scheduler, "_host_limits", None)
+
+
+class ConcurrencyProbe:
+    """Job that records how many jobs per host run at the same time."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = {}
+        self.max_active = {}
+        self.started = []
+
+    def __call__(self, url):
+        host = host_of(url)
+        with self.lock:
+            self.started.append(host)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self.active[host])
+        threading.Event().wait(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        return url
+
+
+def test_host_limits_increase_additively_and_halve_on_throttling():
+    limits = HostLimits(initial=2, maximum=4)
+    assert limits.limit("github.com") == 2
+
+    for _ in range(2):
+        limits.record_success("github.com")
+    assert limits.limit("github.com") == 2  # 2 + 1/2 + 1/2.5 = 2.9
+    limits.record_success("github.com")
+    assert limits.limit("github.com") == 3
+    for _ in range(20):
+        limits.record_success("github.com")
+    assert limits.limit("github.com") == 4
+
+    limits.record_throttled("github.com")
+    assert limits.limit("github.com") == 2
+    limits.record_throttled("github.com")
+    limits.record_throttled("github.com")
+    assert limits.limit("github.com") == 1
+    assert limits.limit("drive.google.com") == 2
+
+
+def test_record_response_statuses():
+    limits = HostLimits(initial=4, maximum=8)
+    limits.record_response("https://drive.google.com/uc?id=1", 429)
+    assert limits.limit("drive.google.com") == 2
+    limits.record_response("https://drive.google.com/uc?id=1", 503)
+    assert limits.limit("drive.google.com") == 1
+    limits.record_response("https://github.com/a/b.zip", 404)
+    assert limits._limits.get("github.com") is None
+
+
+def test_slots_are_limited_per_host():
+    limits = HostLimits(initial=1)
+    assert limits.try_acquire("github.com")
+    assert not limits.try_acquire("github.com")
+    assert limits.try_acquire("drive.google.com")
+    limits.release("github.com")
+    assert limits.try_acquire("github.com")
+
+
+def test_slow_host_does_not_block_other_hosts():
+    probe = ConcurrencyProbe()
+    urls = [f"https://drive.google.com/{i}" for i in range(6)] + [f"https://github.com/{i}" for i in range(6)]
+    scheduler = HostScheduler(4, host_limits=HostLimits(initial=2, maximum=2))
+    try:
+        done = [item for item, _ in scheduler.map_unordered(probe, urls, url_of=lambda url: url)]
+    finally:
+        scheduler.shutdown()
+
+    assert sorted(done) == sorted(urls)
+    assert probe.max_active == {"drive.google.com": 2, "github.com": 2}
+    # Hosts are dispatched in turn, not in list order
+    assert probe.started[:4].count("github.com") == 2
+
+
+def test_global_cap_limits_all_hosts():
+    probe = ConcurrencyProbe()
+    urls = [f"https://host{i}.example/mod.zip" for i in range(8)]
+    active = []
+    scheduler = HostScheduler(3, host_limits=HostLimits())
+
+    def job(url):
+        active.append(scheduler._running)
+        return probe(url)
+
+    try:
+        list(scheduler.map_unordered(job, urls, url_of=lambda url: url))
+    finally:
+        scheduler.shutdown()
+    assert max(active) <= 3
+
+
+def test_extra_tasks_wait_for_queued_jobs():
+    release = threading.Event()
+    scheduler = HostScheduler(2, host_limits=HostLimits(initial=4))
+    try:
+        jobs = scheduler.map_unordered(lambda url: release.wait(5), ["https://a.example/1"] * 3,
+                                       url_of=lambda url: url)
+        runner = threading.Thread(target=lambda: list(jobs))
+        runner.start()
+        while scheduler._running < 2:
+            threading.Event().wait(0.01)
+        # One job still queued: no extra connection even though the host has room
+        assert scheduler.try_submit("https://a.example/1", lambda: None) is None
+        release.set()
+        runner.join(5)
+        assert scheduler.try_submit("https://a.example/1", lambda: 'extra').result() == 'extra'
+    finally:
+        scheduler.shutdown()
+
+
+def test_worker_count_follows_throughput(monkeypatch):
+    clock = iter(range(0, 1000, 10))
+    monkeypatch.setattr(host_scheduler.time, "monotonic", lambda: next(clock))
+    scheduler = HostScheduler(6, initial_workers=3, host_limits=HostLimits(), adaptive=True)
+    try:
+        scheduler._record_bytes(1000)  # First sample
+        assert scheduler.workers == 4
+        scheduler._record_bytes(2000)  # Throughput doubled
+        assert scheduler.workers == 5
+        scheduler._record_bytes(2050)  # Flat
+        assert scheduler.workers == 5
+        scheduler._record_bytes(500)  # Dropped
+        assert scheduler.workers == 4
+        for _ in range(5):
+            scheduler._record_bytes(10)
+        assert scheduler.workers == 3  # Never below the starting count
+    finally:
+        scheduler.shutdown()
+
+
+def test_validation_timeouts_back_off_the_host():
+    mods = [{'name': f'Mod{i}', 'download_url': f'https://slow.example/mod{i}.zip'} for i in range(2)]
+    with patch('requests.Session.head', side_effect=requests.exceptions.Timeout()), \
+         patch('requests.Session.get', side_effect=requests.exceptions.Timeout()):
+        results = validate_mod_urls(mods)
+
+    assert len(results['failed']) == 2
+    assert host_scheduler.get_host_limits().limit("slow.example") == 1
+
+
+def test_breaker_opens_after_consecutive_failures_and_recovers_through_one_probe():
+    breaker = HostCircuitBreaker(threshold=2)
+    breaker.record_failure("drive.google.com")
+    breaker.record_success("drive.google.com")  # Not consecutive
+    breaker.record_failure("drive.google.com")
+    assert breaker.allow("drive.google.com")
+    breaker.record_failure("drive.google.com")
+    assert breaker.is_open("drive.google.com") and not breaker.allow("drive.google.com")
+    assert breaker.allow("github.com")
+
+    # Half-open: one probe, the other requests wait for its outcome
+    breaker.half_open()
+    assert breaker.allow("drive.google.com")
+    waiting = []
+    waiter = threading.Thread(target=lambda: waiting.append(breaker.allow("drive.google.com")))
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+    breaker.record_failure("drive.google.com")
+    waiter.join(1)
+    assert waiting == [False]
+
+    breaker.half_open()
+    assert breaker.allow("drive.google.com")
+    breaker.record_success("drive.google.com")
+    assert breaker.allow("drive.google.com") and not breaker.is_open("drive.google.com")
+
+
+def fake_probe_url(down_hosts, calls):
+    """probe_url stand-in: hosts in down_hosts time out, the others answer 200."""
+    lock = threading.Lock()
+
+    def probe(url):
+        with lock:
+            calls.append(host_of(url))
+        if host_of(url) in down_hosts:
+            raise requests.exceptions.ConnectTimeout()
+        return {'status': 200}
+    return probe
+
+
+def test_unresponsive_host_fails_fast(monkeypatch):
+    calls = []
+    monkeypatch.setattr(installer_module, "probe_url", fake_probe_url({"drive.google.com"}, calls))
+    mods = [{'name': f'Drive{i}', 'download_url': f'https://drive.google.com/uc?id={i}'} for i in range(8)]
+    mods.append({'name': 'Lib', 'download_url': 'https://github.com/a/b/releases/download/v1/lib.zip'})
+    results = validate_mod_urls(mods)
+
+    # K timeouts (plus any already in flight) and one half-open probe instead of 16 timeouts
+    assert calls.count("drive.google.com") <= HOST_BREAKER_THRESHOLD + 2
+    assert [mod['name'] for mod in results['github']] == ['Lib']
+    assert len(results['failed']) == 8
+    assert any(fail['error'].startswith('Skipped: drive.google.com did not respond') for fail in results['failed'])
+
+
+def test_host_back_for_the_retry_is_checked_again(monkeypatch):
+    calls = []
+    down = {"drive.google.com"}
+    half_open = HostCircuitBreaker.half_open
+
+    def recover_before_retry(breaker):
+        down.clear()  # Network recovered
+        half_open(breaker)
+
+    monkeypatch.setattr(installer_module, "probe_url", fake_probe_url(down, calls))
+    monkeypatch.setattr(HostCircuitBreaker, "half_open", recover_before_retry)
+    mods = [{'name': f'Drive{i}', 'download_url': f'https://drive.google.com/uc?id={i}'} for i in range(8)]
+    results = validate_mod_urls(mods)
+
+    assert results['failed'] == []
+    assert len(results['google_drive']) == 8
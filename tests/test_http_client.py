@@ -0,0 +1,62 @@
+"""
+Tests for the shared HTTP session used by URL validation and downloads.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import core.http_client as http_client
+from core.constants import HOST_MAX_CONNECTIONS, HTTP_POOL_HOSTS, HTTP_USER_AGENT
+from core.installer import ModInstaller, validate_mod_urls
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_client.close_session()
+    yield
+    http_client.close_session()
+
+
+def test_get_session_returns_one_shared_session():
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+
+
+def test_session_sends_user_agent():
+    assert http_client.get_session().headers['User-Agent'].startswith(HTTP_USER_AGENT)
+
+
+def test_pool_sizes_follow_host_limit():
+    session = http_client.get_session()
+    for prefix in ('https://', 'http://'):
+        adapter = session.get_adapter(prefix + 'github.com')
+        assert adapter._pool_connections == HTTP_POOL_HOSTS
+        assert adapter._pool_maxsize == HOST_MAX_CONNECTIONS
+        assert adapter.max_retries.allowed_methods == frozenset({'HEAD', 'GET'})
+
+
+def test_close_session_resets_the_shared_session():
+    session = http_client.get_session()
+    with patch.object(session, 'close') as close:
+        http_client.close_session()
+    close.assert_called_once()
+    assert http_client.get_session() is not session
+
+
+def test_validation_and_download_share_the_session(tmp_path):
+    session = http_client.get_session()
+    head_response = MagicMock(status_code=200)
+    get_response = MagicMock(status_code=200, headers={'Content-Type': 'text/html'})
+
+    with patch.object(session, 'head', return_value=head_response) as head, \
+         patch.object(session, 'get', return_value=get_response) as get:
+        validate_mod_urls([{'name': 'Mod', 'download_url': 'https://github.com/a/b/mod.zip'}])
+        result = ModInstaller(MagicMock()).download_archive(
+            {'name': 'Mod', 'download_url': 'https://drive.google.com/uc?id=ABC'})
+
+    assert head.call_count == 1
+    assert get.call_count == 1
+    assert result == ('GDRIVE_HTML', False)
+    # The streamed response is released back to the pool
+    get_response.close.assert_called_once()
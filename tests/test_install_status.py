@@ -0,0 +1,108 @@
+"""
+Tests for bulk install-status resolution.
+"""
+
+import pytest
+from unittest.mock import Mock
+import utils.installed_mod_index as index_module
+from core.installer import ModInstaller
+
+
+@pytest.fixture
+def installed_mods(mods_dir, write_mod):
+    """Mods folder with LazyLib 3.0.0, MagicLib 1.5.6 and an id-less GraphicsLib."""
+    write_mod("LazyLib", "lw_lazylib", "3.0.0")
+    write_mod("MagicLib", "MagicLib", "1.5.6")
+    write_mod("Graphics Lib", version="1.12.1", name="GraphicsLib")
+    return mods_dir
+
+
+def test_resolve_statuses_in_one_pass(installed_mods):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+
+    mods = [
+        {'name': 'LazyLib', 'mod_id': 'lw_lazylib', 'mod_version': '3.0.0'},
+        {'name': 'MagicLib', 'mod_id': 'MagicLib', 'mod_version': '1.6.0'},
+        {'name': 'GraphicsLib', 'mod_id': 'shaderLib'},
+        {'name': 'Nexerelin', 'mod_id': 'nexerelin'},
+    ]
+    statuses = installer.resolve_install_status(mods, mods_dir)
+
+    assert statuses == {
+        'lw_lazylib': 'installed',
+        'MagicLib': 'outdated',
+        'shaderLib': 'installed',
+        'nexerelin': 'missing',
+    }
+
+
+def test_name_match_without_mod_id(installed_mods):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+
+    statuses = installer.resolve_install_status([
+        {'name': 'Lazy Lib'},
+        {'name': 'Magic'},  # partial folder match
+        {'name': 'Unknown Mod'},
+    ], mods_dir)
+
+    assert statuses == {'Lazy Lib': 'installed', 'Magic': 'installed', 'Unknown Mod': 'missing'}
+
+
+def test_mod_id_does_not_match_other_ids_by_name(installed_mods):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+
+    # Installed LazyLib has its own id, so a different id must not match it by name
+    statuses = installer.resolve_install_status([{'name': 'LazyLib', 'mod_id': 'other_lib'}], mods_dir)
+    assert statuses == {'other_lib': 'missing'}
+
+
+def test_is_mod_already_installed_agrees_with_resolver(installed_mods):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+
+    assert installer.is_mod_already_installed({'name': 'LazyLib', 'mod_id': 'lw_lazylib'}, mods_dir) is True
+    assert installer.is_mod_already_installed({'name': 'MagicLib', 'mod_id': 'MagicLib', 'mod_version': '2.0'}, mods_dir) is False
+    assert installer.is_mod_already_installed({}, mods_dir) is False
+
+
+def test_is_mod_already_installed_with_shared_lookup(installed_mods, monkeypatch):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+    lookup = installer.build_installed_lookup(mods_dir)
+
+    monkeypatch.setattr(installer, "build_installed_lookup", Mock(side_effect=AssertionError("rebuilt")))
+    assert installer.is_mod_already_installed({'name': 'LazyLib', 'mod_id': 'lw_lazylib'}, mods_dir, lookup) is True
+    assert installer.is_mod_already_installed({'name': 'Magic'}, mods_dir, lookup) is True
+    assert installer.is_mod_already_installed({'name': 'Nexerelin'}, mods_dir, lookup) is False
+
+
+def test_entries_with_same_name_keep_separate_statuses(installed_mods):
+    installer = ModInstaller(Mock())
+    mods_dir = installed_mods
+
+    statuses = installer.resolve_install_status([
+        {'name': 'Core Pack', 'mod_id': 'lw_lazylib'},
+        {'name': 'Core Pack', 'mod_id': 'nexerelin'},
+    ], mods_dir)
+
+    assert statuses == {'lw_lazylib': 'installed', 'nexerelin': 'missing'}
+
+
+def test_each_mod_info_read_once(mods_dir, write_mod, monkeypatch):
+    installer = ModInstaller(Mock())
+    for i in range(30):
+        write_mod(f"Mod{i:02d}", f"mod{i}", "1.0", name=f"Mod {i}")
+
+    reads = []
+    original = index_module.read_mod_info_json
+    monkeypatch.setattr(index_module, "read_mod_info_json",
+                        lambda folder: reads.append(folder) or original(folder))
+
+    mods = [{'name': f'Mod {i}', 'mod_id': f'mod{i}', 'mod_version': '1.0'} for i in range(60)]
+    statuses = installer.resolve_install_status(mods, mods_dir)
+
+    assert len(reads) == 30
+    assert sum(1 for s in statuses.values() if s == 'installed') == 30
@@ -0,0 +1,60 @@
+"""
+Tests for the InstalledMod record.
+"""
+
+import pytest
+from utils.installed_mod import InstalledMod
+from utils.mod_utils import scan_installed_mods
+
+
+MOD_INFO = '{"id": "lunalib", "name": "LunaLib", "version": "2.0.4", "gameVersion": "0.98a-RC5", ' \
+           '"dependencies": [{"id": "lw_lazylib"}], "jars": ["jars/LunaLib.jar"]}'
+
+
+def test_record_has_no_instance_dict(tmp_path):
+    mod = InstalledMod(tmp_path, id="lunalib")
+    assert not hasattr(mod, '__dict__')
+    with pytest.raises(AttributeError):
+        mod.extra = 1
+
+
+def test_scan_yields_records_without_raw_content(mods_dir, write_mod):
+    write_mod("LunaLib", content=MOD_INFO)
+
+    [(folder, mod)] = list(scan_installed_mods(mods_dir))
+
+    assert mod.folder == folder
+    assert mod.folder_name == "LunaLib"
+    assert (mod.id, mod.name, mod.version, mod.game_version) == ("lunalib", "LunaLib", "2.0.4", "0.98a-RC5")
+    assert mod.dependencies == ("lw_lazylib",)
+    assert mod.jars == ("jars/LunaLib.jar",)
+    assert mod._content is None
+
+    # Raw text is read on first access and can be released again
+    assert mod.content == MOD_INFO
+    mod.release_content()
+    assert mod._content is None
+
+
+def test_metadata_round_trip(tmp_path):
+    mod = InstalledMod(tmp_path / "LunaLib", id="lunalib", name="LunaLib", version="2.0.4",
+                       game_version="0.98a-RC5", dependencies=["lw_lazylib"], jars=["jars/LunaLib.jar"])
+    assert InstalledMod.from_metadata(mod.folder, mod.to_metadata()) == mod
+
+
+def test_missing_content_is_none(tmp_path):
+    assert InstalledMod(tmp_path / "gone").content is None
+
+
+def test_equal_records_hash_alike(tmp_path):
+    mod = InstalledMod(tmp_path / "LunaLib", id="lunalib", version="2.0.4", jars=["jars/LunaLib.jar"])
+    same = InstalledMod(tmp_path / "LunaLib", id="lunalib", version="2.0.4", jars=("jars/LunaLib.jar",))
+    assert hash(mod) == hash(same)
+    assert {mod, same} == {mod}
+    assert len({mod, InstalledMod(tmp_path / "LunaLib", id="lunalib", version="2.0.5")}) == 2
+
+
+def test_content_decodes_like_the_scan(mods_dir, write_mod):
+    write_mod("Broken").joinpath("mod_info.json").write_bytes(b'{"id": "broken", "name": "\xe9"}')
+    assert list(scan_installed_mods(mods_dir)) == []
+    assert InstalledMod(mods_dir / "Broken").content is None
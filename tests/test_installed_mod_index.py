@@ -0,0 +1,145 @@
+"""
+Tests for the persistent installed-mods index.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+import utils.installed_mod_index as index_module
+from utils.installed_mod_index import InstalledModIndex
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    """Count mod_info.json reads performed by the index."""
+    reads = []
+    original = index_module.read_mod_info_json
+
+    def counting_read(mod_folder):
+        reads.append(Path(mod_folder).name)
+        return original(mod_folder)
+
+    monkeypatch.setattr(index_module, "read_mod_info_json", counting_read)
+    return reads
+
+
+def test_scan_returns_metadata(mods_dir, write_mod, read_counter):
+    write_mod("LazyLib", "lw_lazylib", "3.0.0")
+    write_mod("MagicLib", "MagicLib", "1.5.6")
+    (mods_dir / "not_a_mod").mkdir()
+    (mods_dir / ".hidden").mkdir()
+
+    index = InstalledModIndex(mods_dir)
+    found = {folder.name: mod for folder, mod in index.scan()}
+
+    assert set(found) == {"LazyLib", "MagicLib"}
+    assert found["LazyLib"].id == "lw_lazylib"
+    assert found["LazyLib"].version == "3.0.0"
+    assert found["MagicLib"].game_version == "0.98a-RC8"
+
+
+def test_refresh_only_rereads_changed_folders(mods_dir, write_mod, read_counter):
+    write_mod("LazyLib", "lw_lazylib", "3.0.0")
+    write_mod("MagicLib", "MagicLib", "1.5.6")
+
+    index = InstalledModIndex(mods_dir)
+    index.refresh()
+    assert sorted(read_counter) == ["LazyLib", "MagicLib"]
+
+    read_counter.clear()
+    assert index.refresh() == set()
+    assert read_counter == []
+
+    write_mod("MagicLib", "MagicLib", "1.5.10")
+    assert index.refresh() == {"MagicLib"}
+    assert read_counter == ["MagicLib"]
+    assert index.get("MagicLib").version == "1.5.10"
+
+
+def test_removed_folder_is_dropped(mods_dir, write_mod, read_counter):
+    write_mod("LazyLib", "lw_lazylib")
+    write_mod("OldMod", "old_mod")
+
+    index = InstalledModIndex(mods_dir)
+    index.refresh()
+    (mods_dir / "OldMod" / "mod_info.json").unlink()
+    (mods_dir / "OldMod").rmdir()
+
+    assert index.refresh() == {"OldMod"}
+    assert index.folder_names(refresh=False) == ["LazyLib"]
+    assert index.get("OldMod") is None
+
+
+def test_index_is_persisted_next_to_mods_dir(mods_dir, write_mod, tmp_path, read_counter):
+    write_mod("LazyLib", "lw_lazylib")
+
+    InstalledModIndex(mods_dir).refresh()
+    assert (tmp_path / index_module.INDEX_FILE_NAME).exists()
+
+    # A fresh instance reuses the saved metadata without reading mod_info.json
+    read_counter.clear()
+    reloaded = InstalledModIndex(mods_dir)
+    found = list(reloaded.scan())
+    assert read_counter == []
+    assert found[0][1].id == "lw_lazylib"
+    assert found[0][1].folder == mods_dir / "LazyLib"
+
+
+def test_missing_mods_dir_is_empty(tmp_path):
+    index = InstalledModIndex(tmp_path / "does_not_exist")
+    assert list(index.scan()) == []
+
+
+def test_same_size_change_with_restored_mtime_is_detected(mods_dir, write_mod, read_counter):
+    write_mod("LazyLib", "lw_lazylib", "1.2.0")
+    mod_info = mods_dir / "LazyLib" / "mod_info.json"
+    original = mod_info.stat()
+
+    index = InstalledModIndex(mods_dir)
+    index.refresh()
+
+    # Same size, and the extractor restores the archive timestamps
+    write_mod("LazyLib", "lw_lazylib", "1.3.0")
+    os.utime(mod_info, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert mod_info.stat().st_size == original.st_size
+
+    assert index.refresh() == {"LazyLib"}
+    assert index.get("LazyLib").version == "1.3.0"
+
+
+def test_invalidate_forces_reread(mods_dir, write_mod, read_counter):
+    write_mod("LazyLib", "lw_lazylib")
+
+    index = InstalledModIndex(mods_dir)
+    index.refresh()
+    read_counter.clear()
+
+    index.invalidate(["LazyLib", "Unknown"])
+    index.refresh()
+    assert read_counter == ["LazyLib"]
+
+
+def test_unreadable_mod_info_is_cached_until_it_changes(mods_dir, write_mod, tmp_path, read_counter):
+    write_mod("LazyLib", "lw_lazylib")
+    broken = mods_dir / "Broken"
+    broken.mkdir()
+    (broken / "mod_info.json").write_bytes(b'\xff\xfe invalid utf-8')
+
+    index = InstalledModIndex(mods_dir, index_file=tmp_path / "index.json")
+    index.refresh()
+    assert index.folder_names(refresh=False) == ["LazyLib"]
+    assert index.get("Broken") is None
+
+    read_counter.clear()
+    assert index.refresh() == set()
+    assert read_counter == []
+
+    # The negative entry survives a restart
+    reloaded = InstalledModIndex(mods_dir, index_file=tmp_path / "index.json")
+    reloaded.refresh()
+    assert read_counter == []
+
+    write_mod("Broken", "fixed_mod")
+    assert reloaded.refresh() == {"Broken"}
+    assert reloaded.get("Broken").id == "fixed_mod"
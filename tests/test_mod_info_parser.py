@@ -0,0 +1,127 @@
+"""
+Tests for the lenient mod_info.json parser.
+"""
+
+import pytest
+from utils.mod_info_parser import ModInfoParseError, _loads_json, _parse_value, loads, parse_mod_info
+from utils.mod_utils import extract_all_metadata_from_text, extract_dependencies_from_text
+from test_mod_info_samples import MOD_INFO_SAMPLES
+
+
+def test_relaxed_syntax():
+    text = """{
+        # hash comment
+        id: lazylib,  // line comment
+        'name': 'Lazy \\'Lib\\'',
+        /* block
+           comment */
+        "url": "https://example.com/#top",
+        "flags": [true, false, null,],
+    }"""
+    assert loads(text) == {
+        'id': 'lazylib',
+        'name': "Lazy 'Lib'",
+        'url': 'https://example.com/#top',
+        'flags': [True, False, None],
+    }
+
+
+def test_numbers_keep_source_text():
+    assert loads('{"version": 1.10, "list": [0.5, 2]}') == {'version': '1.10', 'list': ['0.5', '2']}
+
+
+def test_org_json_separators():
+    assert loads('{"id":"a"; "name"="b"}') == {'id': 'a', 'name': 'b'}
+    assert loads('{"a" => 1; "list": [1; 2,]}') == {'a': '1', 'list': ['1', '2']}
+
+
+def test_unquoted_values_run_to_the_next_delimiter():
+    assert loads('{id:"a", url: http://foo.com/x, version:"1.0"}') == {
+        'id': 'a', 'url': 'http://foo.com/x', 'version': '1.0'
+    }
+    assert loads('{name: Lazy Lib , author: A B // comment\n}') == {'name': 'Lazy Lib', 'author': 'A B'}
+
+
+def test_unquoted_value_with_spaces_keeps_metadata():
+    metadata = parse_mod_info('{id: lazylib, name: Lazy Lib, version: 3.0.0, gameVersion: 0.98a-RC8}')
+    assert metadata['id'] == 'lazylib'
+    assert metadata['name'] == 'Lazy Lib'
+    assert metadata['version'] == '3.0.0'
+
+
+def test_json_fast_path_cuts_comments_and_trailing_commas():
+    text = '{"id": "a", # one\n  # two\n  "deps": ["b", /* x */ "c",],\n  "url": "http://h/#x" // end\n,}'
+    assert _loads_json(text) == {'id': 'a', 'deps': ['b', 'c'], 'url': 'http://h/#x'}
+    assert _loads_json('{"a": 1}/* unterminated') == {'a': '1'}
+    # '//' inside a bare value is not a comment: left to the lenient parser
+    assert _loads_json('{"a": 1//2}') is None
+    assert loads('{"a": 1//2}') == {'a': '1//2'}
+    assert _loads_json("{'a': 1}") is None
+
+
+def test_json_fast_path_agrees_with_the_lenient_parser():
+    for name, text in MOD_INFO_SAMPLES.items():
+        fast = _loads_json(text)
+        if fast is not None:
+            value, _, _ = _parse_value(text, 0)
+            assert fast == value, name
+
+
+def test_missing_array_element_is_null():
+    assert loads('[1,,2,]') == ['1', None, '2']
+
+
+@pytest.mark.parametrize("text", ['', '{', '{"a": "b"', '{"a" }', '{"a": 1} extra', '{"a: 1}', '{[]: 1}', ']',
+                                  '{"a" 1}', '{"a": 1 "b": 2}', '{"a": "b" "c": "d"}', '{"a": [1 "2"]}', '{}}'])
+def test_invalid_documents_raise(text):
+    with pytest.raises(ModInfoParseError):
+        loads(text)
+
+
+def test_version_object_and_dependencies():
+    metadata = parse_mod_info("""{
+        "id": "nexerelin",
+        "name": "Nexerelin",
+        "version": {"major": 0, "minor": 12, "patch": "1b"},
+        "gameVersion": "0.98a-RC8",
+        "jars": ["jars/ExerelinCore.jar"],
+        "dependencies": [
+            {"id": "lw_lazylib", "name": "LazyLib", "version": "3.0.0"},
+            {"id": "MagicLib", "name": "MagicLib"},
+        ],
+    }""")
+    assert metadata == {
+        'id': 'nexerelin',
+        'name': 'Nexerelin',
+        'version': '0.12.1b',
+        'gameVersion': '0.98a-RC8',
+        'dependencies': ['lw_lazylib', 'MagicLib'],
+        'jars': ['jars/ExerelinCore.jar'],
+    }
+
+
+def test_version_inside_dependencies_is_not_the_mod_version():
+    # The regex extractors picked up the first "version" key, even inside dependencies
+    metadata = extract_all_metadata_from_text(
+        '{"id": "a", "dependencies": [{"id": "b", "version": "9.9"}], "version": "1.0"}'
+    )
+    assert metadata['version'] == '1.0'
+    assert metadata['dependencies'] == ['b']
+
+
+def test_dependency_ids_exclude_names():
+    content = '{"dependencies": [{"id": "lw_lazylib", "name": "LazyLib"}]}'
+    assert extract_dependencies_from_text(content) == ['lw_lazylib']
+
+
+def test_fragments_fall_back_to_regex():
+    assert extract_dependencies_from_text('"dependencies": ["lw_lazylib", "MagicLib"]') == ['lw_lazylib', 'MagicLib']
+    assert extract_all_metadata_from_text('"id": "lazylib", "version": "1.0"')['id'] == 'lazylib'
+
+
+@pytest.mark.parametrize("mod_name", sorted(MOD_INFO_SAMPLES))
+def test_samples_parse(mod_name):
+    metadata = parse_mod_info(MOD_INFO_SAMPLES[mod_name])
+    assert metadata['id']
+    assert metadata['version'] != 'unknown'
+    assert metadata['gameVersion']
@@ -8,7 +8,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.installer import ModInstaller
+from utils.mod_utils import extract_all_metadata_from_text
 
 
 # Sample mod_info.json files from real Starsector mods
@@ -202,8 +202,6 @@ MOD_INFO_SAMPLES = {
 
 def test_version_extraction_from_samples():
     """Test that we can extract versions from all real mod_info.json samples."""
-    installer = ModInstaller(lambda msg, **kwargs: print(msg))
-    
     print("\n" + "="*80)
     print("Testing Version Extraction from Real mod_info.json Samples")
     print("="*80)
@@ -213,8 +211,9 @@ def test_version_extraction_from_samples():
     failed = []
     
     for mod_name, json_content in MOD_INFO_SAMPLES.items():
-        version = installer._extract_version_from_text(json_content)
-        mod_id = installer._extract_id_from_text(json_content)
+        metadata = extract_all_metadata_from_text(json_content)
+        version = metadata['version']
+        mod_id = metadata['id']
         
         if version != 'unknown':
             successful += 1
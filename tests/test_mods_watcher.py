@@ -0,0 +1,145 @@
+"""
+Tests for the mods folder watcher and targeted index refreshes.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from utils.installed_mod_index import InstalledModIndex
+from utils.mods_watcher import ModsFolderWatcher, _PollingBackend, inotify_available
+
+
+class Recorder:
+    def __init__(self):
+        self.reports = []
+        self.event = threading.Event()
+
+    def __call__(self, folder_names):
+        self.reports.append(folder_names)
+        self.event.set()
+
+    def wait_for(self, expected, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        seen = set()
+        while time.monotonic() < deadline:
+            self.event.wait(0.05)
+            self.event.clear()
+            seen = set().union(*[r for r in self.reports if r is not None])
+            if expected <= seen:
+                return seen
+        return seen
+
+
+def test_refresh_folders_updates_only_given_folders(mods_dir, write_mod, tmp_path):
+    write_mod("LazyLib", "lw_lazylib")
+    write_mod("MagicLib", "MagicLib")
+    index = InstalledModIndex(mods_dir, index_file=tmp_path / "index.json")
+    index.refresh()
+
+    write_mod("LazyLib", "lw_lazylib", version="2.8b")
+    write_mod("Nexerelin", "nexerelin")
+    (mods_dir / "MagicLib" / "mod_info.json").unlink()
+
+    assert index.refresh_folders(["Nexerelin", "MagicLib"]) == {"Nexerelin", "MagicLib"}
+    assert sorted(index.folder_names(refresh=False)) == ["LazyLib", "Nexerelin"]
+    # Not reported, so not re-read yet
+    assert index.get("LazyLib").version == "1.0.0"
+
+    assert index.refresh_folders(["LazyLib", ".hidden", "Missing"]) == {"LazyLib"}
+    assert index.get("LazyLib").version == "2.8b"
+    assert index.refresh() == set()
+
+
+@pytest.mark.parametrize("use_inotify", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not inotify_available(), reason="inotify not available")),
+])
+def test_watcher_reports_changed_folders(mods_dir, write_mod, use_inotify):
+    write_mod("LazyLib", "lw_lazylib")
+    write_mod("MagicLib", "MagicLib")
+
+    recorder = Recorder()
+    watcher = ModsFolderWatcher(mods_dir, recorder, poll_interval=0.05, debounce=0.1, use_inotify=use_inotify,
+                                full_scan_interval=0.05)
+    assert watcher.start() == ("inotify" if use_inotify else "polling")
+    try:
+        time.sleep(0.1)
+        write_mod("Nexerelin", "nexerelin")
+        write_mod("LazyLib", "lw_lazylib", version="2.8b.extra")
+        (mods_dir / "MagicLib" / "mod_info.json").unlink()
+
+        seen = recorder.wait_for({"Nexerelin", "LazyLib", "MagicLib"})
+        assert {"Nexerelin", "LazyLib", "MagicLib"} <= seen
+    finally:
+        watcher.stop()
+    assert not watcher.is_running
+
+
+def test_polling_stats_mod_info_only_when_the_mods_dir_changes(mods_dir, write_mod, monkeypatch):
+    write_mod("LazyLib", "lw_lazylib")
+    write_mod("MagicLib", "MagicLib")
+    stop_event = threading.Event()
+    backend = _PollingBackend(mods_dir, stop_event, full_scan_interval=3600)
+
+    stats = []
+    original_stat = os.stat
+    monkeypatch.setattr(os, "stat", lambda path, *args, **kwargs: stats.append(str(path)) or original_stat(path, *args, **kwargs))
+
+    assert backend.wait(0) == set()
+    assert stats == [str(mods_dir)]
+
+    # An in-place edit waits for the next full pass; a new folder triggers one
+    write_mod("LazyLib", "lw_lazylib", version="2.0.0-longer")
+    assert backend.wait(0) == set()
+    write_mod("Nexerelin", "nexerelin")
+    os.utime(mods_dir, ns=(0, 0))  # Make sure the mtime differs on coarse filesystems
+    assert backend.wait(0) == {"LazyLib", "Nexerelin"}
+
+    backend._next_full_scan = 0  # Full pass due
+    write_mod("MagicLib", "MagicLib", version="2.0.0-longer")
+    assert backend.wait(0) == {"MagicLib"}
+
+
+def test_watcher_debounces_bursts(mods_dir, write_mod):
+    mods_dir.mkdir()
+
+    recorder = Recorder()
+    watcher = ModsFolderWatcher(mods_dir, recorder, poll_interval=0.02, debounce=0.3, use_inotify=False)
+    watcher.start()
+    try:
+        for i in range(5):
+            write_mod(f"Mod{i}", f"mod{i}")
+            time.sleep(0.03)
+        recorder.wait_for({f"Mod{i}" for i in range(5)})
+    finally:
+        watcher.stop()
+
+    assert recorder.reports == [{f"Mod{i}" for i in range(5)}]
+
+
+def test_watcher_survives_callback_errors(mods_dir, write_mod):
+    mods_dir.mkdir()
+    calls = []
+
+    def failing(folder_names):
+        calls.append(folder_names)
+        raise RuntimeError("consumer failed")
+
+    watcher = ModsFolderWatcher(mods_dir, failing, poll_interval=0.02, debounce=0.05, use_inotify=False)
+    watcher.start()
+    try:
+        write_mod("First", "first")
+        deadline = time.monotonic() + 5
+        while len(calls) < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        write_mod("Second", "second")
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert watcher.is_running
+    finally:
+        watcher.stop()
+
+    assert calls == [{"First"}, {"Second"}]
@@ -0,0 +1,149 @@
+"""
+Tests for extracting several archives at once (per-folder locks in ModInstaller).
+"""
+
+import concurrent.futures
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import Mock
+
+from core.installer import ModInstaller
+
+
+def write_zip(path, folder, version="1.0.0", files=20):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{folder}/mod_info.json", f'{{"id": "{folder.lower()}", "version": "{version}"}}')
+        for i in range(files):
+            zf.writestr(f"{folder}/graphics/sprite{i}.png", bytes([i % 251]) * 4096)
+    return path
+
+
+class OverlapProbe:
+    """Wraps _check_if_installed to record which folders are being checked/extracted at once."""
+
+    def __init__(self, installer):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.max_active = {}
+        self.max_total = 0
+        check = installer._check_if_installed
+
+        def probed(archive_ref, members, mods_dir, *args, **kwargs):
+            folder = Path(members[0]).parts[0]
+            with self.lock:
+                self.active[folder] = self.active.get(folder, 0) + 1
+                self.max_active[folder] = max(self.max_active.get(folder, 0), self.active[folder])
+                self.max_total = max(self.max_total, sum(self.active.values()))
+            threading.Event().wait(0.05)
+            try:
+                return check(archive_ref, members, mods_dir, *args, **kwargs)
+            finally:
+                with self.lock:
+                    self.active[folder] -= 1
+
+        installer._check_if_installed = probed
+
+
+def extract_all(installer, archives, mods_dir, workers=4):
+    with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(lambda path: installer.extract_archive(path, mods_dir, False), archives))
+
+
+def test_independent_archives_extract_concurrently(tmp_path, mods_dir):
+    archives = [write_zip(tmp_path / f"mod{i}.zip", f"Mod{i}") for i in range(4)]
+    installer = ModInstaller(Mock())
+    probe = OverlapProbe(installer)
+
+    assert extract_all(installer, archives, mods_dir) == [True] * 4
+    assert probe.max_total > 1
+    for i in range(4):
+        assert len(list((mods_dir / f"Mod{i}" / "graphics").iterdir())) == 20
+
+
+def test_archives_for_the_same_folder_take_turns(tmp_path, mods_dir):
+    # Two versions of one mod: the second sees the first installed and updates it
+    archives = [write_zip(tmp_path / "shared_old.zip", "Shared", "1.0.0"),
+                write_zip(tmp_path / "shared_new.zip", "Shared", "2.0.0"),
+                write_zip(tmp_path / "other.zip", "Other")]
+    installer = ModInstaller(Mock())
+    probe = OverlapProbe(installer)
+
+    results = extract_all(installer, archives, mods_dir)
+
+    assert probe.max_active["Shared"] == 1
+    # Whichever version came second saw the first one installed
+    assert results[1:] == [True, True] and results[0] in (True, 'skipped')
+    assert '"2.0.0"' in (mods_dir / "Shared" / "mod_info.json").read_text()
+
+
+def test_lock_keys_follow_the_top_level_folders(tmp_path):
+    installer = ModInstaller(Mock())
+    with installer._lock_folders(tmp_path, ["B/mod_info.json", "A/x.png", "A/y.png"]):
+        held = dict(installer._folder_locks)
+        assert len(held) == 2 and all(lock.locked() for lock in held.values())
+    assert not any(lock.locked() for lock in installer._folder_locks.values())
+
+
+def write_asset_pack(path, files=300):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("Pack/mod_info.json", '{"id": "pack", "version": "1.0.0"}')
+        zf.writestr("Pack/sounds/", b'')
+        for i in range(files):
+            zf.writestr(f"Pack/graphics/set{i % 7}/sprite{i}.png", bytes([i % 256]) * (100 + i * 37))
+            zf.writestr(f"Pack/sounds/sfx{i}.ogg", bytes([(i * 3) % 256]) * (50 + i))
+    return path
+
+
+def tree(root):
+    return {str(path.relative_to(root)): path.read_bytes() if path.is_file() else None
+            for path in sorted(Path(root).rglob('*'))}
+
+
+def test_large_zip_members_are_extracted_on_several_threads(tmp_path, mods_dir, monkeypatch):
+    archive = write_asset_pack(tmp_path / "pack.zip")
+    threads = set()
+    extract = zipfile.ZipFile.extract
+
+    def recording_extract(self, member, path=None, pwd=None):
+        threads.add(threading.get_ident())
+        return extract(self, member, path, pwd)
+
+    monkeypatch.setattr(zipfile.ZipFile, "extract", recording_extract)
+    assert ModInstaller(Mock()).extract_archive(archive, mods_dir, False) is True
+    monkeypatch.undo()
+
+    reference = tmp_path / "reference"
+    with zipfile.ZipFile(archive) as zf:
+        zf.extractall(reference)
+    assert tree(mods_dir) == tree(reference)
+    assert len(threads) > 1
+
+
+def test_parallel_extraction_overwrites_like_extractall(tmp_path, mods_dir):
+    # Stray files of a multi-root archive (no single mod folder to compare) are overwritten
+    (mods_dir / "Pack" / "graphics" / "set0").mkdir(parents=True)
+    (mods_dir / "Pack" / "graphics" / "set0" / "sprite0.png").write_bytes(b'old')
+    (mods_dir / "Pack" / "notes.txt").write_text("kept")
+    installer = ModInstaller(Mock())
+    with zipfile.ZipFile(write_asset_pack(tmp_path / "pack.zip")) as zf:
+        installer._extract_zip_members(tmp_path / "pack.zip", zf, mods_dir)
+
+    assert (mods_dir / "Pack" / "graphics" / "set0" / "sprite0.png").read_bytes() == bytes([0]) * 100
+    assert (mods_dir / "Pack" / "notes.txt").read_text() == "kept"
+    assert (mods_dir / "Pack" / "sounds").is_dir()
+
+
+def test_parallel_extraction_keeps_traversal_members_inside(tmp_path, mods_dir):
+    archive = write_asset_pack(tmp_path / "pack.zip")
+    outside = tmp_path / "outside"
+    with zipfile.ZipFile(archive, 'a') as zf:
+        zf.writestr("../escape/evil.txt", b'x')
+        zf.writestr(f"{outside}/evil.txt", b'x')
+    with zipfile.ZipFile(archive) as zf:
+        ModInstaller(Mock())._extract_zip_members(archive, zf, mods_dir)
+
+    assert not (tmp_path / "escape").exists() and not outside.exists()
+    # Cleaned like ZipFile.extract does
+    assert (mods_dir / "escape" / "evil.txt").is_file()
+    assert (mods_dir / outside.relative_to(outside.anchor) / "evil.txt").is_file()
@@ -0,0 +1,74 @@
+"""
+Tests for the thread-pool-backed mod folder scanning.
+"""
+
+import threading
+import time
+
+import utils.installed_mod_index as index_module
+from utils.installed_mod_index import InstalledModIndex
+from utils.mod_utils import map_ordered, scan_installed_mods
+
+
+def test_map_ordered_keeps_input_order():
+    def slow_square(n):
+        time.sleep(0.001 * (n % 3))
+        return n * n
+
+    assert list(map_ordered(slow_square, range(20), max_workers=4)) == [n * n for n in range(20)]
+
+
+def test_map_ordered_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def track(n):
+        with lock:
+            running.append(n)
+            peak.append(len(running))
+        time.sleep(0.005)
+        with lock:
+            running.remove(n)
+        return n
+
+    assert list(map_ordered(track, range(30), max_workers=3)) == list(range(30))
+    assert max(peak) <= 3
+
+
+def test_map_ordered_inline_without_workers():
+    caller = threading.current_thread()
+    threads = list(map_ordered(lambda n: threading.current_thread(), range(3), max_workers=1))
+    assert threads == [caller] * 3
+
+
+def test_parallel_scan_matches_sequential(mods_dir, write_mods):
+    write_mods(25)
+    (mods_dir / "not_a_mod").mkdir()
+    (mods_dir / "readme.txt").write_text("not a folder")
+
+    sequential = list(scan_installed_mods(mods_dir))
+    parallel = list(scan_installed_mods(mods_dir, max_workers=6))
+
+    assert len(parallel) == 25
+    assert parallel == sequential
+
+
+def test_parallel_index_refresh(mods_dir, write_mods, monkeypatch):
+    write_mods(25)
+    (mods_dir / "not_a_mod").mkdir()
+    (mods_dir / "readme.txt").write_text("not a folder")
+
+    reads = []
+    original = index_module.read_mod_info_json
+    monkeypatch.setattr(index_module, "read_mod_info_json",
+                        lambda folder: reads.append(folder) or original(folder))
+
+    index = InstalledModIndex(mods_dir, max_workers=6)
+    assert len(index.refresh()) == 25
+    assert index.folder_names(refresh=False) == InstalledModIndex(mods_dir).folder_names()
+    assert len(reads) == 25
+
+    reads.clear()
+    assert index.refresh() == set()
+    assert reads == []
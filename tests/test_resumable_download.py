@@ -0,0 +1,150 @@
+"""
+Tests for resuming broken downloads with HTTP Range requests, against a
+local HTTP server that drops connections midway.
+"""
+
+import io
+import os
+import random
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+import core.installer as installer_module
+from core.installer import ModInstaller
+
+
+def make_archive(size=256 * 1024):
+    """ZIP with incompressible content, so the archive is about size bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("BigMod/mod_info.json", '{"id": "big_mod", "version": "1.0"}')
+        zf.writestr("BigMod/graphics.bin", random.Random(0).randbytes(size))
+    return buffer.getvalue()
+
+
+class FlakyArchive:
+    """Answers every request with one archive; the first `drops` responses are cut off halfway.
+
+    Attributes:
+        supports_ranges: Answer Range requests with 206 (else always 200)
+        etag: Current ETag; changing it makes If-Range requests get the full body
+        requests: (Range, If-Range) headers of every request received
+    """
+
+    def __init__(self, body, drops=1, supports_ranges=True):
+        self.body = body
+        self.drops = drops
+        self.supports_ranges = supports_ranges
+        self.etag = '"v1"'
+        self.requests = []
+        self.bytes_sent = 0
+
+    def handle(self, request):
+        range_header = request.headers.get('Range')
+        if_range = request.headers.get('If-Range')
+        self.requests.append((range_header, if_range))
+
+        start = 0
+        if range_header and self.supports_ranges and if_range == self.etag:
+            start = int(range_header.split('=')[1].split('-')[0])
+        payload = self.body[start:]
+
+        request.send_response(206 if start else 200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', str(len(payload)))
+        request.send_header('ETag', self.etag)
+        if self.supports_ranges:
+            request.send_header('Accept-Ranges', 'bytes')
+        if start:
+            request.send_header('Content-Range', f'bytes {start}-{len(self.body) - 1}/{len(self.body)}')
+        request.end_headers()
+
+        if self.drops > 0:
+            self.drops -= 1
+            payload = payload[:len(payload) // 2]
+            request.close_connection = True
+        request.wfile.write(payload)
+        request.wfile.flush()
+        self.bytes_sent += len(payload)
+
+
+@pytest.fixture
+def serve(http_server, no_backoff):
+    """Return serve(archive), which serves a FlakyArchive and returns its download URL."""
+    return lambda archive: http_server(archive.handle).base + "/BigMod.zip"
+
+
+def download(url):
+    installer = ModInstaller(Mock())
+    temp_path, is_7z = installer.download_archive({'name': 'BigMod', 'download_url': url})
+    assert temp_path, "download failed"
+    try:
+        with open(temp_path, 'rb') as f:
+            return f.read(), temp_path
+    finally:
+        os.unlink(temp_path)
+
+
+def test_dropped_download_resumes_with_range(serve):
+    body = make_archive()
+    archive = FlakyArchive(body, drops=1)
+    data, temp_path = download(serve(archive))
+
+    assert data == body
+    assert not temp_path.endswith('.part')
+    assert archive.requests[0] == (None, None)
+    range_header, if_range = archive.requests[1]
+    assert if_range == '"v1"'
+    # Resumed after the bytes that arrived (a partly read chunk is fetched again)
+    start = int(range_header[len("bytes="):-1])
+    assert 0 < start <= len(body) // 2
+    assert archive.bytes_sent == len(body) // 2 + len(body) - start
+
+
+def test_repeated_drops_keep_resuming(serve):
+    body = make_archive()
+    archive = FlakyArchive(body, drops=2)
+    data, _ = download(serve(archive))
+
+    assert data == body
+    assert len(archive.requests) == 3
+    assert all(range_header for range_header, _ in archive.requests[1:])
+    assert archive.bytes_sent < 2 * len(body)
+
+
+def test_server_without_ranges_restarts_from_zero(serve):
+    body = make_archive()
+    archive = FlakyArchive(body, drops=1, supports_ranges=False)
+    data, _ = download(serve(archive))
+
+    assert data == body
+    assert archive.bytes_sent == len(body) // 2 + len(body)
+
+
+def test_changed_file_restarts_from_zero(http_server, no_backoff):
+    body = make_archive()
+    archive = FlakyArchive(body, drops=1)
+
+    def replace_after_first(request):
+        # The archive is replaced between the attempts: If-Range no longer matches
+        if archive.requests:
+            archive.etag = '"v2"'
+        archive.handle(request)
+
+    data, _ = download(http_server(replace_after_first).base + "/BigMod.zip")
+
+    assert data == body
+    assert archive.requests[1][0].startswith("bytes=")
+    assert archive.requests[1][1] == '"v1"'
+    assert archive.bytes_sent == len(body) // 2 + len(body)
+
+
+def test_failed_download_leaves_no_part_file(tmp_path, monkeypatch, serve):
+    monkeypatch.setattr(installer_module.tempfile, "tempdir", str(tmp_path))
+    url = serve(FlakyArchive(make_archive(), drops=10))
+    installer = ModInstaller(Mock())
+    assert installer.download_archive({'name': 'BigMod', 'download_url': url}) == (None, False)
+
+    assert list(tmp_path.iterdir()) == []
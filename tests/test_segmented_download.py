@@ -0,0 +1,210 @@
+"""
+Tests for downloading large archives in parallel byte ranges, against a local
+HTTP server that honours Range requests.
+"""
+
+import io
+import os
+import random
+import threading
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+import core.installer as installer_module
+from core.host_scheduler import HostLimits, HostScheduler
+from core.installer import ModInstaller
+
+
+SEGMENT = 32 * 1024
+
+
+def make_archive(size=256 * 1024, seed=0):
+    """ZIP with incompressible content, so the archive is about size bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("BigMod/mod_info.json", '{"id": "big_mod", "version": "1.0"}')
+        zf.writestr("BigMod/graphics.bin", random.Random(seed).randbytes(size))
+    return buffer.getvalue()
+
+
+class RangeArchives:
+    """Serves archives at /0.zip, /1.zip, ... and answers 'bytes=start-end' requests with 206.
+
+    Attributes:
+        bodies: Archive served at each path
+        etag: Current ETag; a Range request with another If-Range gets the full body
+        requests: Range header of every request received (None for full downloads)
+        max_active: Highest number of requests being answered at the same time (all paths)
+        drop_ranges: Range headers whose next response is cut off halfway
+        on_request: Optional callback(archives) run before each response
+        urls: Download URL of each archive, once served
+    """
+
+    def __init__(self, *bodies, accept_ranges=True):
+        self.bodies = list(bodies)
+        self.accept_ranges = accept_ranges
+        self.etag = '"v1"'
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.drop_ranges = set()
+        self.on_request = None
+        self.urls = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return self.urls[0]
+
+    def handle(self, request):
+        if self.on_request:
+            self.on_request(self)
+        range_header = request.headers.get('Range')
+        with self.lock:
+            self.requests.append(range_header)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        body = self.bodies[int(request.path.strip('/').split('.')[0])]
+        start, end = 0, len(body) - 1
+        partial = range_header and self.accept_ranges and request.headers.get('If-Range') == self.etag
+        if partial:
+            first, last = range_header.split('=')[1].split('-')
+            start, end = int(first), int(last) if last else len(body) - 1
+        payload = body[start:end + 1]
+
+        request.send_response(206 if partial else 200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', str(len(payload)))
+        request.send_header('ETag', self.etag)
+        if self.accept_ranges:
+            request.send_header('Accept-Ranges', 'bytes')
+        if partial:
+            request.send_header('Content-Range', f'bytes {start}-{end}/{len(body)}')
+        request.end_headers()
+
+        if range_header in self.drop_ranges:
+            self.drop_ranges.discard(range_header)
+            payload = payload[:len(payload) // 2]
+            request.close_connection = True
+        # Slow responses, so parallel ranges overlap (time.sleep is patched out)
+        threading.Event().wait(0.02)
+        # Stop counting before the body: the client may close a full response
+        # after its first range while this handler is still writing
+        with self.lock:
+            self.active -= 1
+        try:
+            request.wfile.write(payload)
+            request.wfile.flush()
+        except OSError:
+            pass  # Client closed a full response after reading its first range
+
+
+@pytest.fixture
+def serve(http_server):
+    """Return serve(archives), which serves RangeArchives and fills in their URLs."""
+    def start(archives):
+        base = http_server(archives.handle).base
+        archives.urls = [f"{base}/{index}.zip" for index in range(len(archives.bodies))]
+        return archives
+    return start
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch, no_backoff):
+    monkeypatch.setattr(installer_module, "SEGMENTED_DOWNLOAD_MIN_BYTES", 4 * SEGMENT)
+    monkeypatch.setattr(installer_module, "DOWNLOAD_SEGMENT_BYTES", SEGMENT)
+
+
+def download_all(urls, workers=3):
+    """Download urls the way the installer does: one job per archive on a host scheduler."""
+    installer = ModInstaller(Mock())
+    scheduler = HostScheduler(workers, host_limits=HostLimits(initial=workers, maximum=workers))
+    installer.download_scheduler = scheduler
+    results = {}
+    try:
+        jobs = scheduler.map_unordered(
+            lambda url: installer.download_archive({'name': 'BigMod', 'download_url': url}),
+            urls, url_of=lambda url: url)
+        for url, future in jobs:
+            temp_path, _ = future.result()
+            assert temp_path, "download failed"
+            with open(temp_path, 'rb') as f:
+                results[url] = f.read()
+            os.unlink(temp_path)
+    finally:
+        scheduler.shutdown()
+    return [results[url] for url in urls]
+
+
+def segment_count(body):
+    return -(-len(body) // SEGMENT)
+
+
+def test_large_archive_is_downloaded_in_ranges(serve):
+    body = make_archive()
+    archives = serve(RangeArchives(body))
+    assert download_all([archives.url]) == [body]
+
+    # The first range comes from the initial GET, the others from Range requests
+    assert archives.requests[0] is None
+    assert len(archives.requests) == segment_count(body)
+    assert archives.requests[1:] and all(header.startswith("bytes=") for header in archives.requests[1:])
+    assert 1 < archives.max_active <= 3
+
+
+def test_connections_stay_bounded_by_the_scheduler(serve):
+    first, second = make_archive(seed=1), make_archive(seed=2)
+    archives = serve(RangeArchives(first, second))
+    assert download_all(archives.urls, workers=2) == [first, second]
+
+    assert archives.max_active == 2
+
+
+def test_small_archives_and_servers_without_ranges_use_one_request(serve):
+    small = make_archive(size=2 * SEGMENT)
+    archives = serve(RangeArchives(small))
+    assert download_all([archives.url]) == [small]
+    assert archives.requests == [None]
+
+    body = make_archive()
+    archives = serve(RangeArchives(body, accept_ranges=False))
+    assert download_all([archives.url]) == [body]
+    assert archives.requests == [None]
+
+
+def test_no_segments_without_a_scheduler(serve):
+    body = make_archive()
+    archives = serve(RangeArchives(body))
+    temp_path, _ = ModInstaller(Mock()).download_archive({'name': 'BigMod', 'download_url': archives.url})
+    with open(temp_path, 'rb') as f:
+        assert f.read() == body
+    os.unlink(temp_path)
+    assert archives.requests == [None]
+
+
+def test_failed_range_is_fetched_again_without_restarting(serve):
+    body = make_archive()
+    archives = serve(RangeArchives(body))
+    archives.drop_ranges.add(f"bytes={3 * SEGMENT}-{4 * SEGMENT - 1}")
+    assert download_all([archives.url]) == [body]
+
+    assert archives.requests.count(None) == 1
+    assert archives.requests.count(f"bytes={3 * SEGMENT}-{4 * SEGMENT - 1}") == 2
+
+
+def test_changed_file_restarts_the_download(serve):
+    old, new = make_archive(seed=1), make_archive(seed=2)
+
+    def replace_after_first(archives):
+        if archives.requests and archives.etag == '"v1"':
+            archives.bodies[0], archives.etag = new, '"v2"'
+
+    archives = serve(RangeArchives(old))
+    archives.on_request = replace_after_first
+    assert download_all([archives.url]) == [new]
+
+    # Range requests for v1 got the whole v2 file: a fresh download followed
+    assert archives.requests.count(None) >= 2
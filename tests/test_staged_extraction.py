@@ -0,0 +1,90 @@
+"""
+Tests for single-pass archive checking: structural check after download,
+CRC checks while extracting into a staging folder, rollback on failure.
+"""
+
+import hashlib
+import zipfile
+from unittest.mock import Mock, patch
+
+from core.download_cache import DownloadCache
+from core.installer import ModInstaller
+
+
+PAYLOAD = b'A' * 5000
+
+
+def write_zip(path, folder="LazyLib", version="2.0.0", corrupt=False, extra=()):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr(f"{folder}/mod_info.json", f'{{"id": "{folder.lower()}", "version": "{version}"}}')
+        zf.writestr(f"{folder}/jars/lib.jar", PAYLOAD)
+        for name in extra:
+            zf.writestr(name, b'x')
+    if corrupt:
+        # Flip one byte of the member data; the central directory stays intact
+        data = path.read_bytes()
+        offset = data.index(PAYLOAD)
+        path.write_bytes(data[:offset] + b'B' + data[offset + 1:])
+    return path
+
+
+def test_integrity_check_reads_the_structure_only(tmp_path):
+    archive = write_zip(tmp_path / "mod.zip", corrupt=True)
+    installer = ModInstaller(Mock())
+    with patch.object(zipfile.ZipFile, 'testzip', side_effect=AssertionError("members decompressed")):
+        assert installer._validate_archive_integrity(str(archive), False) is True
+
+    (tmp_path / "mod.7z").write_bytes(b'7z\xbc\xaf\x27\x1c' + b'\0' * 26)
+    assert installer._validate_archive_integrity(str(tmp_path / "mod.7z"), True) is True
+
+
+def test_bad_crc_rolls_back_the_extraction(tmp_path, mods_dir):
+    archive = write_zip(tmp_path / "mod.zip", corrupt=True)
+    log = Mock()
+
+    assert ModInstaller(log).extract_archive(archive, mods_dir, False) is False
+    assert list(mods_dir.iterdir()) == []
+    assert any('Corrupted archive' in call.args[0] for call in log.call_args_list)
+
+
+def test_failed_update_keeps_the_installed_version(tmp_path, mods_dir, write_mod):
+    write_mod("LazyLib", "lazylib", "1.0.0")
+    archive = write_zip(tmp_path / "mod.zip", version="2.0.0", corrupt=True)
+
+    assert ModInstaller(Mock()).extract_archive(archive, mods_dir, False) is False
+    assert '"1.0.0"' in (mods_dir / "LazyLib" / "mod_info.json").read_text()
+    assert [path.name for path in mods_dir.iterdir()] == ["LazyLib"]
+
+    # A good archive replaces it
+    archive = write_zip(tmp_path / "good.zip", version="2.0.0")
+    assert ModInstaller(Mock()).extract_archive(archive, mods_dir, False) is True
+    assert '"2.0.0"' in (mods_dir / "LazyLib" / "mod_info.json").read_text()
+    assert (mods_dir / "LazyLib" / "jars" / "lib.jar").read_bytes() == PAYLOAD
+
+
+def test_corrupted_archive_is_dropped_from_the_download_cache(tmp_path, mods_dir):
+    archive = write_zip(tmp_path / "mod.zip", corrupt=True)
+    cache = DownloadCache(tmp_path / "cache")
+    url = 'https://example.com/lazylib.zip'
+    cache.store(url, {'etag': '"v1"'}, archive, hashlib.sha256(archive.read_bytes()).hexdigest())
+    installer = ModInstaller(Mock(), download_cache=cache)
+    installer._downloaded_validators[str(archive)] = (url, None)
+
+    assert installer.extract_archive(archive, mods_dir, False) is False
+    assert cache.stats()['archives'] == 0
+    assert cache.checkout(url, {'etag': '"v1"'}) is None
+
+
+def test_staged_files_merge_into_existing_folders(tmp_path, mods_dir):
+    # Multi-root archive adding a file to an existing folder
+    (mods_dir / "shared").mkdir(parents=True)
+    (mods_dir / "shared" / "existing.txt").write_text("kept")
+    archive = tmp_path / "loose.zip"
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr("shared/added.txt", "new")
+        zf.writestr("readme.txt", "hello")
+
+    assert ModInstaller(Mock()).extract_archive(archive, mods_dir, False) is True
+    assert sorted(path.name for path in (mods_dir / "shared").iterdir()) == ["added.txt", "existing.txt"]
+    assert (mods_dir / "readme.txt").read_text() == "hello"
+    assert sorted(path.name for path in mods_dir.iterdir()) == ["readme.txt", "shared"]
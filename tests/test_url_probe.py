@@ -0,0 +1,136 @@
+"""
+Tests for the persistent URL probe cache shared by validation and the CSV import.
+"""
+
+import socket
+
+import pytest
+import requests
+
+import core.url_probe as url_probe
+from core.installer import validate_mod_urls
+from core.url_probe import UrlProbeCache, probe_url
+
+
+def serve_probes(request):
+    """Serve /mod.zip, redirect /latest to it, reject HEAD on /nohead.zip and answer 503 on /busy.zip."""
+    if request.path == '/latest':
+        request.send_response(302)
+        request.send_header('Location', '/mod.zip')
+        request.send_header('Content-Length', '0')
+    elif request.path == '/busy.zip':
+        request.send_response(503)
+        request.send_header('Content-Length', '0')
+    elif request.path == '/nohead.zip' and request.command == 'HEAD':
+        request.send_response(405)
+        request.send_header('Content-Length', '0')
+    elif request.path == '/nohead.zip':
+        request.send_response(206)
+        request.send_header('Content-Range', 'bytes 0-0/5000')
+        request.send_header('Content-Length', '1')
+        request.end_headers()
+        request.wfile.write(b'P')
+        return
+    else:
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', '1234')
+        request.send_header('ETag', '"v1"')
+        request.send_header('Last-Modified', 'Tue, 01 Jul 2025 10:00:00 GMT')
+        request.end_headers()
+        if request.command == 'GET':
+            request.wfile.write(b'P' * 1234)
+        return
+    request.end_headers()
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(serve_probes)
+
+
+def test_probe_follows_redirects_and_keeps_the_headers(server):
+    probe = probe_url(server.base + '/latest')
+
+    assert probe['status'] == 200
+    assert probe['final_url'] == server.base + '/mod.zip'
+    assert probe['content_length'] == 1234
+    assert probe['content_type'] == 'application/zip'
+    assert (probe['etag'], probe['last_modified']) == ('"v1"', 'Tue, 01 Jul 2025 10:00:00 GMT')
+
+
+def test_rejected_head_falls_back_to_one_byte_get(server):
+    probe = probe_url(server.base + '/nohead.zip')
+
+    assert server.requests == [('HEAD', '/nohead.zip'), ('GET', '/nohead.zip')]
+    assert probe['status'] == 206
+    assert probe['content_length'] == 5000
+
+
+def test_unchanged_modlist_is_validated_without_network(tmp_path, server):
+    mods = [{'name': f'Mod{i}', 'download_url': f"{server.base}/mod{i}.zip"} for i in range(3)]
+    first = validate_mod_urls(mods, probe_cache=UrlProbeCache(tmp_path / "url_probes.json"))
+    sent = len(server.requests)
+
+    # A later session: probes come from disk
+    cache = UrlProbeCache(tmp_path / "url_probes.json")
+    second = validate_mod_urls(mods, probe_cache=cache)
+
+    assert sent == 3
+    assert len(server.requests) == 3
+    assert cache.stats() == {'hits': 3, 'misses': 0, 'entries': 3}
+    host = server.base[len('http://'):]
+    assert sorted(mod['name'] for mod in first['other'][host]) == ['Mod0', 'Mod1', 'Mod2']
+    assert sorted(mod['name'] for mod in second['other'][host]) == ['Mod0', 'Mod1', 'Mod2']
+
+
+def test_expired_probes_are_refreshed(tmp_path, monkeypatch, server):
+    clock = [1000.0]
+    monkeypatch.setattr(url_probe.time, "time", lambda: clock[0])
+    cache = UrlProbeCache(tmp_path / "url_probes.json", ttl=60)
+    url = server.base + '/mod.zip'
+    cache.probe(url)
+    clock[0] += 30
+    cache.probe(url)
+    clock[0] += 60
+    cache.probe(url)
+    # use_cache=False always asks the server
+    cache.probe(url, use_cache=False)
+
+    assert len(server.requests) == 3
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_transient_answers_and_errors_are_not_cached(tmp_path, server):
+    cache = UrlProbeCache(tmp_path / "url_probes.json")
+    assert cache.probe(server.base + '/busy.zip')['status'] == 503
+    assert cache.probe(server.base + '/busy.zip')['status'] == 503
+    server.close()
+    with pytest.raises(requests.exceptions.RequestException):
+        cache.probe(server.base + '/mod.zip', timeout=1)
+
+    assert cache.stats()['entries'] == 0
+    cache.save()
+    assert not (tmp_path / "url_probes.json").exists()
+
+
+def test_results_are_streamed_as_they_are_final(tmp_path, server):
+    streamed = []
+    unreachable = socket.socket()
+    unreachable.bind(('127.0.0.1', 0))
+    port = unreachable.getsockname()[1]
+    unreachable.close()
+    mods = [
+        {'name': 'Core', 'download_url': server.base + '/mod.zip'},
+        {'name': 'Busy', 'download_url': server.base + '/busy.zip'},
+        {'name': 'Offline', 'download_url': f"http://127.0.0.1:{port}/mod.zip"},
+    ]
+    results = validate_mod_urls(mods, on_result=lambda *result: streamed.append(result))
+
+    assert [(result[1]['name'], result[0], result[3]) for result in streamed] == [
+        ('Core', 'other', 200),
+        ('Busy', 'failed', 503),
+        # Network errors are only reported once their retry failed too
+        ('Offline', 'failed', 0),
+    ]
+    assert [fail['mod']['name'] for fail in results['failed']] == ['Busy', 'Offline']
@@ -0,0 +1,143 @@
+"""
+Tests for the redirect/release resolution cache (UrlResolver).
+"""
+
+import io
+import os
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+import core.url_resolver as url_resolver
+from core.installer import ModInstaller, validate_mod_urls
+from core.url_resolver import UrlResolver, resolution_of
+
+
+def redirected(url, *hops):
+    """Response stand-in for a request of url redirected through hops ((status, location), ...)."""
+    history = []
+    current = url
+    for status, location in hops:
+        history.append(SimpleNamespace(url=current, status_code=status))
+        current = location
+    return SimpleNamespace(url=current, history=history)
+
+
+def make_zip():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr("LazyLib/mod_info.json", '{"id": "lw_lazylib", "version": "1.0.0"}')
+    return buffer.getvalue()
+
+
+ARCHIVE = make_zip()
+
+
+def serve_moved(request):
+    """Redirect /old.zip permanently and /latest.zip temporarily to /new.zip; 404 elsewhere."""
+    if request.path in ('/old.zip', '/latest.zip'):
+        request.send_response(301 if request.path == '/old.zip' else 302)
+        request.send_header('Location', '/new.zip')
+        request.send_header('Content-Length', '0')
+        request.end_headers()
+    elif request.path == '/new.zip':
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/zip')
+        request.send_header('Content-Length', str(len(ARCHIVE)))
+        request.end_headers()
+        if request.command == 'GET':
+            request.wfile.write(ARCHIVE)
+    else:
+        request.send_response(404)
+        request.send_header('Content-Length', '0')
+        request.end_headers()
+
+
+@pytest.fixture
+def server(http_server, no_backoff):
+    return http_server(serve_moved)
+
+
+def test_resolution_stops_at_the_last_stable_hop():
+    latest = 'https://github.com/o/lib/releases/latest/download/lib.zip'
+    concrete = 'https://github.com/o/lib/releases/download/v1.2.0/lib.zip'
+    github = redirected(latest, (302, concrete), (302, 'https://objects.githubusercontent.com/x?X-Amz-Signature=s'))
+    assert resolution_of(latest, github) == {'resolved_url': concrete, 'tag': 'v1.2.0'}
+
+    drive = 'https://drive.google.com/uc?id=1&export=download'
+    usercontent = 'https://drive.usercontent.google.com/download?id=1&export=download'
+    assert resolution_of(drive, redirected(drive, (303, usercontent))) == {'resolved_url': usercontent, 'tag': None}
+
+    # Other hosts: permanent redirects only
+    assert resolution_of('https://a.example/m.zip', redirected('https://a.example/m.zip', (301, 'https://b.example/m.zip'),
+                                                               (302, 'https://c.example/m.zip'))) == \
+        {'resolved_url': 'https://b.example/m.zip', 'tag': None}
+    assert resolution_of('https://a.example/m.zip', redirected('https://a.example/m.zip', (302, 'https://b.example/m.zip'))) is None
+    assert resolution_of('https://a.example/m.zip', Mock()) is None
+
+
+def test_new_release_tag_is_reported_once_and_persisted(tmp_path):
+    url = 'https://github.com/o/lib/releases/latest/download/lib.zip'
+    resolver = UrlResolver(tmp_path / "url_resolutions.json")
+    resolver.store(url, 'https://github.com/o/lib/releases/download/v1.0/lib.zip', 'v1.0')
+    resolver.store(url, 'https://github.com/o/lib/releases/download/v1.0/lib.zip', 'v1.0')
+    assert resolver.pop_tag_changes([url]) == {}
+    resolver.save()
+
+    # A later session sees the next release
+    resolver = UrlResolver(tmp_path / "url_resolutions.json")
+    assert resolver.release_tag(url) == 'v1.0'
+    resolver.store(url, 'https://github.com/o/lib/releases/download/v1.1/lib.zip', 'v1.1')
+    assert resolver.pop_tag_changes([url, 'https://example.com/other.zip']) == {url: ('v1.0', 'v1.1')}
+    assert resolver.pop_tag_changes([url]) == {}
+    assert resolver.resolve(url) == 'https://github.com/o/lib/releases/download/v1.1/lib.zip'
+
+
+def test_expired_resolution_is_not_used(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(url_resolver.time, "time", lambda: clock[0])
+    resolver = UrlResolver(tmp_path / "url_resolutions.json", ttl=60)
+    resolver.store('https://a.example/m.zip', 'https://b.example/m.zip')
+    clock[0] += 59
+    assert resolver.resolve('https://a.example/m.zip') == 'https://b.example/m.zip'
+    clock[0] += 1
+    assert resolver.resolve('https://a.example/m.zip') == 'https://a.example/m.zip'
+
+
+def test_download_goes_straight_to_the_resolved_target(tmp_path, server):
+    resolver = UrlResolver(tmp_path / "url_resolutions.json")
+    mod = {'name': 'LazyLib', 'download_url': server.base + '/old.zip'}
+    for _ in range(2):
+        temp_path, _ = ModInstaller(Mock(), url_resolver=resolver).download_archive(mod)
+        os.unlink(temp_path)
+    latest = {'name': 'Latest', 'download_url': server.base + '/latest.zip'}
+    temp_path, _ = ModInstaller(Mock(), url_resolver=resolver).download_archive(latest)
+    os.unlink(temp_path)
+
+    assert server.requests == [('GET', '/old.zip'), ('GET', '/new.zip'), ('GET', '/new.zip'),
+                               # Temporary redirects are followed every time
+                               ('GET', '/latest.zip'), ('GET', '/new.zip')]
+    assert UrlResolver(tmp_path / "url_resolutions.json").resolve(mod['download_url']) == server.base + '/new.zip'
+
+
+def test_broken_target_falls_back_to_the_url(tmp_path, server):
+    resolver = UrlResolver(tmp_path / "url_resolutions.json")
+    mod = {'name': 'LazyLib', 'download_url': server.base + '/old.zip'}
+    resolver.store(mod['download_url'], server.base + '/removed.zip')
+    temp_path, _ = ModInstaller(Mock(), url_resolver=resolver).download_archive(mod)
+    os.unlink(temp_path)
+
+    assert server.requests == [('GET', '/removed.zip'), ('GET', '/old.zip'), ('GET', '/new.zip')]
+    assert resolver.resolve(mod['download_url']) == server.base + '/new.zip'
+
+
+def test_validation_probes_the_resolved_target(tmp_path, server):
+    resolver = UrlResolver(tmp_path / "url_resolutions.json")
+    mods = [{'name': 'LazyLib', 'download_url': server.base + '/old.zip'}]
+    validate_mod_urls(mods, resolver=resolver)
+    validate_mod_urls(mods, resolver=resolver)
+
+    assert server.requests == [('HEAD', '/old.zip'), ('HEAD', '/new.zip'), ('HEAD', '/new.zip')]
+    assert (tmp_path / "url_resolutions.json").exists()
@@ -0,0 +1,64 @@
+"""
+Tests for cached version keys.
+"""
+
+import re
+from itertools import product, zip_longest
+
+from utils.mod_utils import compare_versions
+from utils.version_key import VersionKey, max_version, sort_versions, version_key
+
+
+VERSIONS = [
+    "1.0", "1.0.0", "1.0.1", "1.2.3", "1.10", "1.9", "2.0a", "2.0b", "2.0",
+    "0.12.1b", "0.12.1", "0.12.1a", "0.12.2", "2.1.b", "2.1.a", "2.1",
+    "v1.5.6", "1.5.6", "1.5.10", "0.98a-RC8", "0.98a-RC7", "0.98a", "3.0.0-rc1",
+    "unknown", "", "1.06", "1.6",
+]
+
+
+def legacy_compare(version1, version2):
+    """compare_versions() as it was before VersionKey, for parity checks."""
+    if version1 == version2:
+        return 0
+
+    def parse_version(v):
+        v = str(v).lower().replace('v', '').replace('version', '').strip()
+        parts = re.findall(r'\d+|[a-z]+', v)
+        return [int(p) if p.isdigit() else ord(p[0]) - ord('a') + 1 for p in parts]
+
+    for p1, p2 in zip_longest(parse_version(version1), parse_version(version2), fillvalue=0):
+        if p1 > p2:
+            return 1
+        elif p1 < p2:
+            return -1
+    return 0
+
+
+def test_same_ordering_as_legacy_compare():
+    for v1, v2 in product(VERSIONS, repeat=2):
+        assert compare_versions(v1, v2) == legacy_compare(v1, v2), (v1, v2)
+        k1, k2 = version_key(v1), version_key(v2)
+        assert (k1 > k2) - (k1 < k2) == legacy_compare(v1, v2), (v1, v2)
+
+
+def test_suffixes():
+    assert version_key("0.12.1b") == (0, 12, 1, 2)
+    assert version_key("2.1.b") == (2, 1, 2)
+    assert version_key("0.12.1b") > version_key("0.12.1a") > version_key("0.12.1")
+    assert version_key("1.0") == version_key("1.0.0")
+
+
+def test_keys_are_cached_and_interned():
+    assert version_key("1.2.3") is version_key("1.2.3")
+    assert isinstance(version_key("1.2.3"), VersionKey)
+    key = VersionKey.parse("4.5")
+    assert version_key(key) is key
+
+
+def test_sort_and_max():
+    versions = ["1.10", "1.9", "1.9.1", "0.12.1b", "2.1.b", "2.1"]
+    assert sort_versions(versions) == ["0.12.1b", "1.9", "1.9.1", "1.10", "2.1", "2.1.b"]
+    assert sort_versions(versions, reverse=True)[0] == "2.1.b"
+    assert max_version(versions) == "2.1.b"
+    assert max_version([], default="unknown") == "unknown"